@@ -0,0 +1,271 @@
+"""Batch runner for USS Engine.
+
+`run_batch` executes `run_uss_pipeline` for every transcript in a directory or
+glob across a process pool. Each thread writes its artifact bundle into its own
+subdirectory, and one NDJSON manifest records every run as it finishes. Worker
+processes load the protocol once and reuse it for every thread they process.
+
+Batches are resumable: a thread whose manifest entry completed is skipped when
+the batch is invoked again with the same output directory.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from .prompt_compiler import load_protocol
+from .redactor import RedactionConfig
+from .reports import RunStatus, now_utc
+from .run import RunConfig, run_uss_pipeline
+from .stages import STAGE_DIR_NAME
+
+TRANSCRIPT_SUFFIXES = {".json", ".jsonl", ".md", ".txt"}
+MANIFEST_NAME = "manifest.ndjson"
+COMPLETED_STATUSES = {RunStatus.completed.value, RunStatus.completed_with_warnings.value}
+ERROR_STATUS = "error"
+
+
+class BatchManifestEntry(BaseModel):
+    """One NDJSON manifest line describing a single thread run."""
+
+    thread_path: str
+    output_dir: str
+    status: str
+    run_id: str | None = None
+    duration_ms: int
+    finished_at: str
+    artifacts: dict[str, str] = Field(default_factory=dict)
+    error: str | None = None
+
+
+class BatchResult(BaseModel):
+    """Summary returned by `run_batch`."""
+
+    manifest_path: str
+    entries: list[BatchManifestEntry] = Field(default_factory=list)
+    skipped: list[str] = Field(default_factory=list)
+
+    @property
+    def completed_count(self) -> int:
+        return sum(1 for entry in self.entries if entry.status in COMPLETED_STATUSES)
+
+    @property
+    def failed_count(self) -> int:
+        return len(self.entries) - self.completed_count
+
+
+@dataclass(slots=True)
+class BatchConfig:
+    """Process-pool and resume settings for a batch run."""
+
+    workers: int | None = None
+    resume: bool = True
+    manifest_name: str = MANIFEST_NAME
+
+    def __post_init__(self) -> None:
+        if self.workers is not None and self.workers < 1:
+            raise ValueError("workers must be at least 1")
+
+
+def discover_threads(source: str | Path, *, exclude: Iterable[str | Path] = ()) -> list[Path]:
+    """Return transcript files under a directory, or matching a glob pattern.
+
+    Files inside `exclude` directories, such as a batch's own output directory,
+    and inside incremental stage stores are never returned.
+    """
+
+    source_path = Path(source)
+    if source_path.is_dir():
+        candidates = (path for path in source_path.rglob("*") if path.suffix.lower() in TRANSCRIPT_SUFFIXES)
+    elif source_path.is_file():
+        candidates = iter([source_path])
+    else:
+        candidates = (Path(match) for match in glob.glob(str(source), recursive=True))
+    excluded = [Path(path).resolve() for path in exclude]
+    return sorted(path for path in candidates if path.is_file() and not _is_excluded(path, excluded))
+
+
+def run_batch(
+    *,
+    source: str | Path,
+    output_dir: str | Path,
+    protocol_path: str | Path = "protocols/uss_v1_3.protocol.json",
+    config: RunConfig | None = None,
+    batch: BatchConfig | None = None,
+) -> BatchResult:
+    """Run the full pipeline for every transcript found at `source`."""
+
+    batch_cfg = batch or BatchConfig()
+    run_cfg = config or RunConfig()
+    output_root = Path(output_dir)
+    output_root.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_root / batch_cfg.manifest_name
+
+    threads = discover_threads(source, exclude=[output_root])
+    root = _source_root(source)
+    done = read_completed_threads(manifest_path) if batch_cfg.resume else set()
+    pending: list[tuple[Path, Path]] = []
+    skipped: list[str] = []
+    for thread_path in threads:
+        if str(thread_path.resolve()) in done:
+            skipped.append(str(thread_path))
+        else:
+            pending.append((thread_path, output_root / _output_name(thread_path, root)))
+
+    entries: list[BatchManifestEntry] = []
+    workers = batch_cfg.workers or min(len(pending), os.cpu_count() or 1) or 1
+    if workers > 1:
+        run_cfg = _serial_redaction(run_cfg)
+    with manifest_path.open("a", encoding="utf-8") as manifest:
+        if workers == 1:
+            _init_worker(str(protocol_path))
+            results = (_run_one(str(path), str(out), str(protocol_path), run_cfg) for path, out in pending)
+            for entry in results:
+                _append(manifest, entry)
+                entries.append(entry)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(str(protocol_path),),
+            ) as pool:
+                futures = {
+                    pool.submit(_run_one, str(path), str(out), str(protocol_path), run_cfg): (path, out)
+                    for path, out in pending
+                }
+                for future in as_completed(futures):
+                    try:
+                        entry = future.result()
+                    except Exception as exc:  # noqa: BLE001 - e.g. BrokenProcessPool after a worker died
+                        path, out = futures[future]
+                        entry = _error_entry(str(path), str(out), exc, duration_ms=0)
+                    _append(manifest, entry)
+                    entries.append(entry)
+
+    return BatchResult(manifest_path=str(manifest_path), entries=entries, skipped=skipped)
+
+
+def read_completed_threads(manifest_path: str | Path) -> set[str]:
+    """Return resolved thread paths whose latest manifest entry completed."""
+
+    path = Path(manifest_path)
+    if not path.exists():
+        return set()
+    latest: dict[str, str] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # A batch killed mid-write can leave a truncated last line.
+            continue
+        latest[str(Path(record["thread_path"]).resolve())] = str(record.get("status"))
+    return {thread for thread, status in latest.items() if status in COMPLETED_STATUSES}
+
+
+_WORKER_PROTOCOLS: dict[str, dict[str, Any]] = {}
+
+
+def _init_worker(protocol_path: str) -> None:
+    if protocol_path not in _WORKER_PROTOCOLS:
+        _WORKER_PROTOCOLS[protocol_path] = load_protocol(protocol_path)
+
+
+def _run_one(thread_path: str, output_dir: str, protocol_path: str, config: RunConfig) -> BatchManifestEntry:
+    started = time.perf_counter()
+    try:
+        result = run_uss_pipeline(
+            thread_path=thread_path,
+            output_dir=output_dir,
+            protocol_path=protocol_path,
+            protocol=_WORKER_PROTOCOLS.get(protocol_path),
+            config=config,
+        )
+    except Exception as exc:  # noqa: BLE001 - one failed thread must not stop the batch
+        return _error_entry(thread_path, output_dir, exc, duration_ms=int((time.perf_counter() - started) * 1000))
+    return BatchManifestEntry(
+        # Resolved, so resuming from another working directory still matches.
+        thread_path=str(Path(thread_path).resolve()),
+        output_dir=output_dir,
+        status=result.report.status.value,
+        run_id=result.report.run_id,
+        duration_ms=int((time.perf_counter() - started) * 1000),
+        finished_at=now_utc(),
+        artifacts=result.output_paths.model_dump(exclude={"output_dir"}),
+    )
+
+
+def _error_entry(thread_path: str, output_dir: str, exc: BaseException, *, duration_ms: int) -> BatchManifestEntry:
+    return BatchManifestEntry(
+        thread_path=str(Path(thread_path).resolve()),
+        output_dir=output_dir,
+        status=ERROR_STATUS,
+        duration_ms=duration_ms,
+        finished_at=now_utc(),
+        error=f"{type(exc).__name__}: {exc}",
+    )
+
+
+def _serial_redaction(config: RunConfig) -> RunConfig:
+    # Threads already run one per worker process; a nested redaction pool per
+    # thread would only oversubscribe the CPUs.
+    redaction = config.redaction or RedactionConfig()
+    if redaction.workers is not None:
+        return config
+    return replace(config, redaction=replace(redaction, workers=1))
+
+
+def _append(manifest: Any, entry: BatchManifestEntry) -> None:
+    manifest.write(json.dumps(entry.model_dump(mode="json"), ensure_ascii=False) + "\n")
+    manifest.flush()
+
+
+def _source_root(source: str | Path) -> Path:
+    """Directory that per-thread output names are made relative to.
+
+    Derived from `source` rather than the discovered files so names stay stable
+    when a resumed batch finds additional transcripts.
+    """
+
+    source_path = Path(source)
+    if source_path.is_dir():
+        return source_path.resolve()
+    if source_path.is_file():
+        return source_path.resolve().parent
+    literal_parts: list[str] = []
+    for part in source_path.parts:
+        if glob.has_magic(part):
+            break
+        literal_parts.append(part)
+    return Path(*literal_parts).resolve() if literal_parts else Path.cwd().resolve()
+
+
+def _output_name(thread_path: Path, root: Path) -> str:
+    resolved = thread_path.resolve()
+    try:
+        relative = resolved.relative_to(root)
+    except ValueError:
+        relative = Path(resolved.name)
+    # Keep the suffix so `a.json` and `a.md` in one directory do not collide, and
+    # hash the relative path since `a.b.json` and `a_b.json` read the same.
+    digest = hashlib.sha256(relative.as_posix().encode("utf-8")).hexdigest()[:8]
+    return "__".join(relative.parts).replace(".", "_") + f"-{digest}"
+
+
+def _is_excluded(path: Path, excluded: list[Path]) -> bool:
+    if STAGE_DIR_NAME in path.parts:
+        return True
+    resolved = path.resolve()
+    return any(resolved.is_relative_to(directory) for directory in excluded)
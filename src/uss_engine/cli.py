@@ -9,16 +9,30 @@ from pathlib import Path
 import typer
 from rich.console import Console
 
-from .clients import AnthropicClient, GeminiClient, GrokClient, OllamaClient, OpenAIClient, StaticLLMClient
+from .batch import BatchConfig, run_batch
+from .clients import (
+    AnthropicClient,
+    CachedLLMClient,
+    GeminiClient,
+    GrokClient,
+    OllamaClient,
+    OpenAIClient,
+    ResponseCache,
+    StaticLLMClient,
+)
 from .config import all_provider_secret_statuses, load_env_file, provider_secret_status
-from .evidence import build_evidence_map_from_files
+from .evidence import EvidenceScoring, build_evidence_map_from_files
+from .evidence_matrix import numpy_available
 from .generator import GenerationConfig, generate_summary_from_files
+from .ingest import IngestConfig, ingest_export
 from .inspector import inspect_files, write_inspection_json
 from .prompt_compiler import compile_runtime_prompt, load_protocol
-from .redactor import RedactionConfig, redact_thread
+from .redactor import RedactionConfig, RedactionReportMode, redact_thread
 from .reports import ProviderKind
 from .run import RunConfig, run_uss_pipeline
+from .scanner import DEFAULT_MAX_FILE_BYTES, ScanConfig, ScanFormat, default_cache_path, scan_paths, to_sarif
 from .schema import InvocationMode
+from .thread_cache import ThreadCache
 from .transcript import load_thread, save_thread
 from .validator import validate_file
 
@@ -52,14 +66,23 @@ def normalize(
     input_path: Path = typer.Argument(..., help="Path to a raw .txt/.md transcript or JSON transcript."),
     output: Path | None = typer.Option(None, "--output", "-o", help="Path for normalized thread JSON."),
     json_output: bool = typer.Option(False, "--json", help="Print normalized JSON to stdout."),
+    checksum: bool = typer.Option(
+        True, "--checksum/--no-checksum", help="Store a checksum so later loads detect edits and skip re-validation."
+    ),
+    thread_cache: Path | None = typer.Option(None, "--thread-cache", help="Reuse normalized threads cached in this directory."),
+    incremental: bool = typer.Option(
+        False, "--incremental", help="With --thread-cache, parse only what was appended since the last load."
+    ),
 ) -> None:
     """Normalize a raw transcript into USS Engine thread JSON."""
 
-    thread = load_thread(input_path)
+    if incremental and thread_cache is None:
+        raise typer.BadParameter("--incremental requires --thread-cache")
+    thread = load_thread(input_path, cache=_thread_cache(thread_cache), incremental=incremental)
     payload = json.dumps(thread.model_dump(mode="json"), indent=2, ensure_ascii=False)
 
     if output is not None:
-        save_thread(thread, output)
+        save_thread(thread, output, checksum=checksum)
         console.print(f"[green]NORMALIZED:[/green] {input_path} -> {output}")
     elif json_output:
         console.print(payload)
@@ -78,16 +101,21 @@ def redact(
     report_output: Path | None = typer.Option(None, "--report", help="Write redaction report JSON."),
     keep_emails: bool = typer.Option(False, "--keep-emails", help="Do not redact email addresses."),
     keep_phone_numbers: bool = typer.Option(False, "--keep-phone-numbers", help="Do not redact phone numbers."),
+    redaction_rules: Path | None = typer.Option(None, "--redaction-rules", help="YAML/JSON file of custom redaction rules."),
+    compact_report: bool = typer.Option(False, "--compact-report", help="Report counts plus a capped sample of hits."),
     json_output: bool = typer.Option(False, "--json", help="Print redaction report JSON."),
+    thread_cache: Path | None = typer.Option(None, "--thread-cache", help="Reuse normalized threads cached in this directory."),
 ) -> None:
     """Redact secrets/PII from a transcript before generation."""
 
-    thread = load_thread(input_path)
+    thread = load_thread(input_path, cache=_thread_cache(thread_cache))
     result = redact_thread(
         thread,
         RedactionConfig(
             redact_emails=not keep_emails,
             redact_phone_numbers=not keep_phone_numbers,
+            custom_rules_path=redaction_rules,
+            report_mode=RedactionReportMode.compact if compact_report else RedactionReportMode.full,
         ),
     )
 
@@ -107,6 +135,66 @@ def redact(
         console.print(f"[green]REDACTION COMPLETE[/green] hits={result.report.hit_count}")
         for category, count in result.report.categories.items():
             console.print(f"- {category}: {count}")
+    for rule in result.report.disabled_rules:
+        console.print(f"[yellow]RULE DISABLED:[/yellow] {rule.description} ({rule.pattern}): {rule.reason}")
+
+
+@app.command()
+def scan(
+    paths: list[Path] | None = typer.Argument(None, help="Files or directories to scan (default: current directory)."),
+    output_format: ScanFormat = typer.Option(ScanFormat.text, "--format", help="text, json, or sarif."),
+    output: Path | None = typer.Option(None, "--output", "-o", help="Write the JSON/SARIF report to this file."),
+    workers: int | None = typer.Option(None, "--workers", help="Worker processes (default: CPU count)."),
+    cache_file: Path | None = typer.Option(
+        None, "--cache-file", help="Per-file result cache (default: .uss_scan_cache.json in the first scanned directory)."
+    ),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Rescan every file and do not write the cache."),
+    max_file_bytes: int = typer.Option(DEFAULT_MAX_FILE_BYTES, "--max-file-bytes", help="Skip files larger than this."),
+    ignore_emails: bool = typer.Option(False, "--ignore-emails", help="Do not report email addresses."),
+    ignore_phone_numbers: bool = typer.Option(False, "--ignore-phone-numbers", help="Do not report phone numbers."),
+    redaction_rules: Path | None = typer.Option(None, "--redaction-rules", help="YAML/JSON file of custom redaction rules."),
+) -> None:
+    """Scan files for secrets with the redaction detectors (exit 1 on findings)."""
+
+    missing = [str(path) for path in paths or [] if not path.exists()]
+    if missing:
+        raise typer.BadParameter(f"no such file or directory: {', '.join(missing)}", param_hint="PATHS")
+
+    roots = paths or [Path(".")]
+    result = scan_paths(
+        roots,
+        ScanConfig(
+            redaction=RedactionConfig(
+                redact_emails=not ignore_emails,
+                redact_phone_numbers=not ignore_phone_numbers,
+                custom_rules_path=redaction_rules,
+            ),
+            workers=workers,
+            cache_path=None if no_cache else cache_file or default_cache_path(roots),
+            max_file_bytes=max_file_bytes,
+        ),
+    )
+
+    for rule in result.disabled_rules:
+        console.print(f"[yellow]RULE DISABLED:[/yellow] {rule.description} ({rule.pattern}): {rule.reason}")
+    if output_format == ScanFormat.text:
+        for finding in result.findings:
+            console.print(f"{finding.path}:{finding.line}:{finding.column}: {finding.category.value} ({finding.description})")
+        style = "green" if result.clean else "red"
+        console.print(
+            f"[{style}]SCAN COMPLETE[/{style}] findings={len(result.findings)} "
+            f"scanned={result.files_scanned} cached={result.files_cached} skipped={result.files_skipped}"
+        )
+    else:
+        payload = to_sarif(result) if output_format == ScanFormat.sarif else result.model_dump(mode="json")
+        rendered = json.dumps(payload, indent=2, ensure_ascii=False)
+        if output is not None:
+            output.write_text(rendered + "\n", encoding="utf-8")
+            console.print(f"[green]SCAN REPORT:[/green] {output}")
+        else:
+            typer.echo(rendered)
+
+    raise typer.Exit(code=0 if result.clean else 1)
 
 
 @app.command("compile-prompt")
@@ -117,11 +205,12 @@ def compile_prompt(
     output: Path | None = typer.Option(None, "--output", "-o", help="Write compiled prompt text."),
     max_transcript_chars: int | None = typer.Option(None, "--max-transcript-chars", help="Optional transcript char budget."),
     no_redaction: bool = typer.Option(False, "--no-redaction", help="Compile prompt without pre-generation redaction."),
+    thread_cache: Path | None = typer.Option(None, "--thread-cache", help="Reuse normalized threads cached in this directory."),
 ) -> None:
     """Compile protocol + normalized/redacted thread into an LLM runtime prompt."""
 
     protocol_data = load_protocol(protocol)
-    thread = load_thread(input_path)
+    thread = load_thread(input_path, cache=_thread_cache(thread_cache))
     redaction_result = redact_thread(thread, RedactionConfig(enabled=not no_redaction))
     runtime_prompt = compile_runtime_prompt(
         protocol=protocol_data,
@@ -153,8 +242,10 @@ def generate(
     json_report: bool = typer.Option(False, "--json", help="Print final validation report as JSON."),
     redaction_report: Path | None = typer.Option(None, "--redaction-report", help="Write redaction report JSON."),
     no_redaction: bool = typer.Option(False, "--no-redaction", help="Disable pre-generation redaction."),
+    redaction_rules: Path | None = typer.Option(None, "--redaction-rules", help="YAML/JSON file of custom redaction rules."),
     provider: str = typer.Option("static", "--provider", help="static, openai, anthropic, gemini, grok/xai, or ollama."),
     model: str | None = typer.Option(None, "--model", help="Provider model name."),
+    cache_dir: Path | None = typer.Option(None, "--cache-dir", help="Reuse provider responses cached in this directory."),
     env_file: Path | None = typer.Option(Path(".env"), "--env-file", help="Optional .env file to load before provider calls."),
 ) -> None:
     """Run generator orchestration with redaction + provider adapter support.
@@ -166,6 +257,9 @@ def generate(
     if env_file is not None:
         load_env_file(env_file)
     client = _build_client(provider=provider, model=model, candidate_output=candidate_output, max_attempts=max_attempts)
+    if cache_dir is not None and not isinstance(client, StaticLLMClient):
+        cache_provider = ProviderKind(provider.strip().lower()).canonical.value
+        client = CachedLLMClient(client, ResponseCache(cache_dir), provider=cache_provider)
     result = generate_summary_from_files(
         protocol_path=protocol,
         thread_path=input_path,
@@ -173,7 +267,7 @@ def generate(
         client=client,
         config=GenerationConfig(
             max_attempts=max_attempts,
-            redaction=RedactionConfig(enabled=not no_redaction),
+            redaction=RedactionConfig(enabled=not no_redaction, custom_rules_path=redaction_rules),
         ),
     )
 
@@ -215,7 +309,11 @@ def run_pipeline(
     max_transcript_chars: int | None = typer.Option(None, "--max-transcript-chars", help="Optional transcript char budget."),
     candidate_output: Path | None = typer.Option(None, "--candidate", help="Optional static provider candidate artifact."),
     no_redaction: bool = typer.Option(False, "--no-redaction", help="Disable pre-generation redaction."),
+    redaction_rules: Path | None = typer.Option(None, "--redaction-rules", help="YAML/JSON file of custom redaction rules."),
     fail_on_invalid: bool = typer.Option(False, "--fail-on-invalid", help="Raise non-zero when final artifact is invalid."),
+    cache_dir: Path | None = typer.Option(None, "--cache-dir", help="Reuse provider responses cached in this directory."),
+    incremental: bool = typer.Option(False, "--incremental", help="Skip pipeline stages whose inputs are unchanged since the last run."),
+    thread_cache: Path | None = typer.Option(None, "--thread-cache", help="Reuse normalized threads cached in this directory."),
     env_file: Path | None = typer.Option(Path(".env"), "--env-file", help="Optional .env file to load before provider calls."),
     json_output: bool = typer.Option(False, "--json", help="Print generation report JSON."),
 ) -> None:
@@ -234,9 +332,12 @@ def run_pipeline(
             model=model,
             max_attempts=max_attempts,
             max_transcript_chars=max_transcript_chars,
-            redaction=RedactionConfig(enabled=not no_redaction),
+            redaction=RedactionConfig(enabled=not no_redaction, custom_rules_path=redaction_rules),
             static_candidate_path=candidate_output,
             fail_on_invalid=fail_on_invalid,
+            cache_dir=cache_dir,
+            incremental=incremental,
+            thread_cache_dir=thread_cache,
         ),
     )
 
@@ -250,6 +351,8 @@ def run_pipeline(
         console.print(f"MVP Ready: {result.report.mvp_ready}")
         console.print(f"Inspection Score: {result.report.inspection_score} ({result.report.inspection_grade})")
         console.print(f"Output Dir: {result.output_paths.output_dir}")
+        if result.skipped_stages:
+            console.print(f"Reused Stages: {', '.join(result.skipped_stages)}")
         console.print("Artifacts:")
         console.print(f"- {result.output_paths.summary_md}")
         console.print(f"- {result.output_paths.validation_report_json}")
@@ -265,16 +368,116 @@ def run_pipeline(
     raise typer.Exit(code=0 if result.report.valid else 1)
 
 
+@app.command("run-batch")
+def run_batch_command(
+    source: str = typer.Argument(..., help="Directory of transcripts or a glob such as 'exports/**/*.json'."),
+    provider: ProviderKind = typer.Option(ProviderKind.static, "--provider", help="static, openai, anthropic, gemini, grok/xai, or ollama."),
+    mode: InvocationMode = typer.Option(InvocationMode.checkpoint, "--mode", help="USS invocation mode."),
+    output_dir: Path = typer.Option(Path("output/batch"), "--output-dir", help="Directory for per-thread bundles and the manifest."),
+    protocol: Path = typer.Option(Path("protocols/uss_v1_3.protocol.json"), "--protocol", help="Protocol JSON path."),
+    model: str | None = typer.Option(None, "--model", help="Provider model name."),
+    max_attempts: int = typer.Option(2, "--max-attempts", help="Maximum validation/repair attempts."),
+    max_transcript_chars: int | None = typer.Option(None, "--max-transcript-chars", help="Optional transcript char budget."),
+    workers: int | None = typer.Option(None, "--workers", help="Worker processes (default: CPU count)."),
+    no_resume: bool = typer.Option(False, "--no-resume", help="Re-run threads that already completed in the manifest."),
+    no_redaction: bool = typer.Option(False, "--no-redaction", help="Disable pre-generation redaction."),
+    redaction_rules: Path | None = typer.Option(None, "--redaction-rules", help="YAML/JSON file of custom redaction rules."),
+    cache_dir: Path | None = typer.Option(None, "--cache-dir", help="Reuse provider responses cached in this directory."),
+    incremental: bool = typer.Option(False, "--incremental", help="Skip pipeline stages whose inputs are unchanged since the last run."),
+    env_file: Path | None = typer.Option(Path(".env"), "--env-file", help="Optional .env file to load before provider calls."),
+    json_output: bool = typer.Option(False, "--json", help="Print batch result JSON."),
+) -> None:
+    """Run the full pipeline for many transcripts across a process pool."""
+
+    if env_file is not None:
+        load_env_file(env_file)
+
+    result = run_batch(
+        source=source,
+        output_dir=output_dir,
+        protocol_path=protocol,
+        config=RunConfig(
+            mode=mode,
+            provider=provider,
+            model=model,
+            max_attempts=max_attempts,
+            max_transcript_chars=max_transcript_chars,
+            redaction=RedactionConfig(enabled=not no_redaction, custom_rules_path=redaction_rules),
+            cache_dir=cache_dir,
+            incremental=incremental,
+        ),
+        batch=BatchConfig(workers=workers, resume=not no_resume),
+    )
+
+    if json_output:
+        console.print(json.dumps(result.model_dump(mode="json"), indent=2, ensure_ascii=False))
+    else:
+        style = "green" if result.failed_count == 0 else "red"
+        console.print(f"[{style}]BATCH COMPLETE[/{style}] runs={len(result.entries)} skipped={len(result.skipped)}")
+        console.print(f"Completed: {result.completed_count}")
+        console.print(f"Failed: {result.failed_count}")
+        console.print(f"Manifest: {result.manifest_path}")
+        for entry in result.entries:
+            if entry.status == "error":
+                console.print(f"[red]ERROR:[/red] {entry.thread_path}: {entry.error}")
+
+    raise typer.Exit(code=0 if result.failed_count == 0 else 1)
+
+
+@app.command("ingest")
+def ingest(
+    export_path: Path = typer.Argument(..., help="ChatGPT or Claude conversations.json export."),
+    output_dir: Path = typer.Option(Path("output/ingest"), "--output-dir", help="Directory for thread files and the index."),
+    workers: int | None = typer.Option(None, "--workers", help="Worker processes (default: CPU count)."),
+    json_output: bool = typer.Option(False, "--json", help="Print ingest result JSON."),
+) -> None:
+    """Split a bulk conversation export into one normalized thread file per conversation."""
+
+    result = ingest_export(source=export_path, output_dir=output_dir, config=IngestConfig(workers=workers))
+
+    if json_output:
+        console.print(json.dumps(result.model_dump(mode="json"), indent=2, ensure_ascii=False))
+    else:
+        style = "green" if result.failed_count == 0 else "red"
+        console.print(f"[{style}]INGEST COMPLETE[/{style}] conversations={len(result.entries)}")
+        console.print(f"Ingested: {result.ingested_count}")
+        console.print(f"Empty: {result.empty_count}")
+        console.print(f"Failed: {result.failed_count}")
+        console.print(f"Threads: {result.threads_dir}")
+        console.print(f"Index: {result.index_path}")
+        for entry in result.entries:
+            if entry.status == "error":
+                console.print(f"[red]ERROR:[/red] conversation {entry.position}: {entry.error}")
+
+    raise typer.Exit(code=0 if result.failed_count == 0 else 1)
+
+
 @app.command("evidence-map")
 def evidence_map(
     summary_path: Path = typer.Argument(..., help="Path to a USS Markdown artifact."),
     thread_path: Path = typer.Argument(..., help="Path to the source normalized/raw thread input."),
     output: Path | None = typer.Option(None, "--output", "-o", help="Write evidence map JSON."),
     json_output: bool = typer.Option(False, "--json", help="Print evidence map JSON."),
+    scoring: EvidenceScoring = typer.Option(
+        EvidenceScoring.lexical,
+        "--scoring",
+        help="lexical, vector (same scores, batched with NumPy when installed), or bm25 (requires NumPy, length-normalized).",
+    ),
+    thread_cache: Path | None = typer.Option(None, "--thread-cache", help="Reuse normalized threads cached in this directory."),
 ) -> None:
     """Build a deterministic evidence map from summary claims to source messages."""
 
-    result = build_evidence_map_from_files(summary_path=summary_path, thread_path=thread_path)
+    if scoring == EvidenceScoring.bm25 and not numpy_available():
+        raise typer.BadParameter(
+            f"{scoring.value} scoring requires NumPy; install it with `pip install uss-engine[fast]`.",
+            param_hint="--scoring",
+        )
+    result = build_evidence_map_from_files(
+        summary_path=summary_path,
+        thread_path=thread_path,
+        scoring=scoring,
+        thread_cache=_thread_cache(thread_cache),
+    )
     payload = json.dumps(result.model_dump(mode="json"), indent=2, ensure_ascii=False)
     if output is not None:
         output.write_text(payload + "\n", encoding="utf-8")
@@ -295,10 +498,11 @@ def inspect(
     thread_path: Path | None = typer.Option(None, "--thread", help="Optional source thread for evidence anchoring."),
     output: Path | None = typer.Option(None, "--output", "-o", help="Write full inspection JSON."),
     json_output: bool = typer.Option(False, "--json", help="Print full inspection JSON."),
+    thread_cache: Path | None = typer.Option(None, "--thread-cache", help="Reuse normalized threads cached in this directory."),
 ) -> None:
     """Inspect structure, evidence support, risk surface, and MVP readiness."""
 
-    result = inspect_files(summary_path=summary_path, thread_path=thread_path)
+    result = inspect_files(summary_path=summary_path, thread_path=thread_path, thread_cache=_thread_cache(thread_cache))
     if output is not None:
         write_inspection_json(result, output)
         console.print(f"[green]INSPECTION REPORT:[/green] {output}")
@@ -320,6 +524,10 @@ def inspect(
             console.print(f"- {recommendation}")
 
 
+def _thread_cache(directory: Path | None) -> ThreadCache | None:
+    return None if directory is None else ThreadCache(directory)
+
+
 def _build_client(*, provider: str, model: str | None, candidate_output: Path | None, max_attempts: int):
     provider_key = provider.strip().lower()
     if provider_key == "static":
@@ -1,7 +1,16 @@
 """Provider adapter exports for USS Engine."""
 
-from .base import ChatMessage, ClientConfig, LLMClient, StaticLLMClient
+from .base import (
+    ChatMessage,
+    ClientConfig,
+    LLMClient,
+    StaticLLMClient,
+    StreamingLLMClient,
+    client_fingerprint,
+    supports_streaming,
+)
 from .anthropic_client import AnthropicClient
+from .cache import CachedLLMClient, ResponseCache
 from .gemini_client import GeminiClient
 from .grok_client import GrokClient
 from .ollama_client import OllamaClient
@@ -9,6 +18,7 @@ from .openai_client import OpenAIClient
 
 __all__ = [
     "AnthropicClient",
+    "CachedLLMClient",
     "ChatMessage",
     "ClientConfig",
     "GeminiClient",
@@ -16,5 +26,9 @@ __all__ = [
     "LLMClient",
     "OllamaClient",
     "OpenAIClient",
+    "ResponseCache",
     "StaticLLMClient",
+    "StreamingLLMClient",
+    "client_fingerprint",
+    "supports_streaming",
 ]
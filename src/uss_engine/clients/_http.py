@@ -1,11 +1,25 @@
-﻿"""Small JSON-over-HTTP helper functions for USS Engine provider clients."""
+﻿"""Small JSON-over-HTTP helper functions for USS Engine provider clients.
+
+Requests go through a process-wide keep-alive connection pool built on
+`http.client`, so repeated completion calls to one provider reuse their TCP and
+TLS sessions. Requests that must go through an environment-configured proxy use
+`urllib.request` instead, which honors the proxy settings.
+"""
 
 from __future__ import annotations
 
+import http.client
 import json
+import os
 import re
+import select
+import ssl
+import threading
+import time
 import urllib.error
 import urllib.request
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from typing import Any
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
@@ -63,28 +77,349 @@ def redact_url(url: str) -> str:
         return redact_secrets(url)
 
 
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+# Methods that may be re-sent after the server could already have received them.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+
+@dataclass(slots=True)
+class _HostSlots:
+    idle: list[tuple[http.client.HTTPConnection, float]] = field(default_factory=list)
+    active: int = 0
+
+
+class HTTPConnectionPool:
+    """Thread-safe keep-alive pool of `http.client` connections keyed by host.
+
+    At most `max_connections_per_host` connections to one scheme/host/port are
+    open at once; further requests wait up to their timeout for a connection to
+    be released. Idle connections older than `idle_timeout_seconds`, or that the
+    server has already closed, are closed instead of reused.
+    """
+
+    def __init__(self, *, max_connections_per_host: int = 8, idle_timeout_seconds: float = 60.0) -> None:
+        if max_connections_per_host < 1:
+            raise ValueError("max_connections_per_host must be at least 1")
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._ssl_context = ssl.create_default_context()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._condition = threading.Condition()
+        self._hosts: dict[tuple[str, str, int], _HostSlots] = {}
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout_seconds: float = 60,
+    ) -> tuple[int, bytes]:
+        """Send one request and return `(status, body)`.
+
+        A reused connection that the server already closed is retried once on a
+        fresh connection (see `_send`). Socket and protocol errors propagate to
+        the caller.
+        """
+
+        parts = urlsplit(url)
+        key = _host_key(parts.scheme, parts.hostname or "", parts.port)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+
+        connection, response = self._send(key, method, target, body, headers, timeout_seconds)
+        try:
+            data = response.read()
+        except BaseException:
+            self._discard(key, connection)
+            raise
+        if response.will_close:
+            self._discard(key, connection)
+        else:
+            self._release(key, connection)
+        return response.status, data
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout_seconds: float = 60,
+    ) -> Iterator[tuple[int, bytes]]:
+        """Yield `(status, line)` pairs from a response as they arrive.
+
+        Closing the generator before the body is exhausted cancels the request:
+        the connection is closed rather than returned to the pool. An error status
+        yields a single pair carrying the whole error body.
+        """
+
+        parts = urlsplit(url)
+        key = _host_key(parts.scheme, parts.hostname or "", parts.port)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+
+        connection, response = self._send(key, method, target, body, headers, timeout_seconds)
+        finished = False
+        try:
+            if response.status >= 400:
+                yield response.status, response.read()
+            else:
+                while True:
+                    line = response.readline()
+                    if not line:
+                        break
+                    yield response.status, line
+            finished = not response.will_close
+        finally:
+            if finished:
+                self._release(key, connection)
+            else:
+                self._discard(key, connection)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+
+        with self._condition:
+            for slots in self._hosts.values():
+                for connection, _ in slots.idle:
+                    connection.close()
+                slots.idle.clear()
+
+    def _send(
+        self,
+        key: tuple[str, str, int],
+        method: str,
+        target: str,
+        body: bytes | None,
+        headers: dict[str, str] | None,
+        timeout_seconds: float,
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send a request and return its connection and response headers.
+
+        A stale reused connection is retried once on a fresh one if it failed
+        while the request was being written. Once the request is fully written
+        the server may have acted on it, so only idempotent methods are re-sent.
+        """
+
+        for attempt in range(2):
+            connection, reused = self._acquire(key, timeout_seconds)
+            sent = False
+            try:
+                connection.request(method, target, body=body, headers=headers or {})
+                sent = True
+                return connection, connection.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                self._discard(key, connection)
+                if reused and attempt == 0 and (not sent or method.upper() in _IDEMPOTENT_METHODS):
+                    continue
+                raise
+            except BaseException:
+                self._discard(key, connection)
+                raise
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _acquire(self, key: tuple[str, str, int], timeout_seconds: float) -> tuple[http.client.HTTPConnection, bool]:
+        deadline = time.monotonic() + timeout_seconds
+        with self._condition:
+            slots = self._hosts.setdefault(key, _HostSlots())
+            while True:
+                now = time.monotonic()
+                while slots.idle:
+                    connection, released_at = slots.idle.pop()
+                    if now - released_at <= self.idle_timeout_seconds and not _is_dropped(connection):
+                        slots.active += 1
+                        _set_timeout(connection, timeout_seconds)
+                        return connection, True
+                    connection.close()
+                if slots.active < self.max_connections_per_host:
+                    slots.active += 1
+                    break
+                if now >= deadline:
+                    raise TimeoutError(f"timed out after {timeout_seconds:g}s waiting for a connection to {key[1]}")
+                self._condition.wait(deadline - now)
+
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout_seconds, context=self._ssl_context), False
+        return http.client.HTTPConnection(host, port, timeout=timeout_seconds), False
+
+    def _release(self, key: tuple[str, str, int], connection: http.client.HTTPConnection) -> None:
+        with self._condition:
+            slots = self._hosts[key]
+            slots.active -= 1
+            slots.idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+    def _discard(self, key: tuple[str, str, int], connection: http.client.HTTPConnection) -> None:
+        connection.close()
+        with self._condition:
+            self._hosts[key].active -= 1
+            self._condition.notify()
+
+
+DEFAULT_POOL = HTTPConnectionPool()
+
+# Sockets must not be shared between a parent and forked batch workers.
+os.register_at_fork(after_in_child=DEFAULT_POOL._reset)
+
+
 def post_json(
     *,
     url: str,
     payload: dict[str, Any],
     headers: dict[str, str] | None = None,
     timeout_seconds: int = 60,
+    pool: HTTPConnectionPool | None = None,
 ) -> dict[str, Any]:
     """POST JSON and return parsed JSON, raising sanitized RuntimeError on failure."""
     body = json.dumps(payload).encode("utf-8")
-    request = urllib.request.Request(
-        url=url,
-        data=body,
-        headers={
-            "Content-Type": "application/json",
-            **(headers or {}),
-        },
-        method="POST",
-    )
+    request_headers = {
+        "Content-Type": "application/json",
+        **(headers or {}),
+    }
+
+    if _uses_proxy(url):
+        raw = _post_via_urllib(url=url, body=body, headers=request_headers, timeout_seconds=timeout_seconds)
+    else:
+        try:
+            status, data = (pool or DEFAULT_POOL).request(
+                "POST",
+                url,
+                body=body,
+                headers=request_headers,
+                timeout_seconds=timeout_seconds,
+            )
+        except (OSError, http.client.HTTPException, ValueError) as exc:
+            safe_url = redact_url(url)
+            reason = redact_secrets(str(exc) or type(exc).__name__)
+            raise RuntimeError(f"Request failed for {safe_url}: {reason}") from exc
+        if status >= 400:
+            safe_url = redact_url(url)
+            safe_detail = redact_secrets(data.decode("utf-8", errors="replace"))
+            raise RuntimeError(f"HTTP {status} from {safe_url}: {safe_detail}")
+        raw = data.decode("utf-8")
+
+    if not raw.strip():
+        return {}
 
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError as exc:
+        safe_raw = redact_secrets(raw)
+        raise RuntimeError(f"Provider returned invalid JSON: {safe_raw}") from exc
+
+
+def stream_lines(
+    *,
+    url: str,
+    payload: dict[str, Any],
+    headers: dict[str, str] | None = None,
+    timeout_seconds: int = 60,
+    pool: HTTPConnectionPool | None = None,
+) -> Iterator[str]:
+    """POST JSON and yield decoded response lines as they stream in.
+
+    Used for SSE and NDJSON streaming completions. Errors are raised as the same
+    sanitized RuntimeError messages as `post_json`. Closing the iterator early
+    aborts the underlying HTTP request.
+    """
+    body = json.dumps(payload).encode("utf-8")
+    request_headers = {
+        "Content-Type": "application/json",
+        **(headers or {}),
+    }
+
+    if _uses_proxy(url):
+        lines: Iterable[tuple[int, bytes]] = _stream_via_urllib(
+            url=url, body=body, headers=request_headers, timeout_seconds=timeout_seconds
+        )
+    else:
+        lines = (pool or DEFAULT_POOL).stream(
+            "POST",
+            url,
+            body=body,
+            headers=request_headers,
+            timeout_seconds=timeout_seconds,
+        )
+
+    iterator = iter(lines)
+    try:
+        while True:
+            try:
+                status, line = next(iterator)
+            except StopIteration:
+                return
+            except (OSError, http.client.HTTPException, ValueError) as exc:
+                safe_url = redact_url(url)
+                reason = redact_secrets(str(exc) or type(exc).__name__)
+                raise RuntimeError(f"Request failed for {safe_url}: {reason}") from exc
+            if status >= 400:
+                safe_url = redact_url(url)
+                safe_detail = redact_secrets(line.decode("utf-8", errors="replace"))
+                raise RuntimeError(f"HTTP {status} from {safe_url}: {safe_detail}")
+            yield line.decode("utf-8").rstrip("\r\n")
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+def iter_sse_data(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Group Server-Sent Event lines into `(event, data)` pairs.
+
+    Events without an `event:` field are reported as `message`. Multiple `data:`
+    lines in one event are joined with newlines, per the SSE specification.
+    """
+    event = "message"
+    data: list[str] = []
+    for line in lines:
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "message", []
+            continue
+        if line.startswith(":"):
+            continue
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "event":
+            event = value
+        elif name == "data":
+            data.append(value)
+    if data:
+        yield event, "\n".join(data)
+
+
+def parse_stream_json(raw: str, *, provider: str) -> dict[str, Any]:
+    """Parse one streamed JSON chunk, raising a sanitized RuntimeError on failure."""
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise RuntimeError(f"{provider} stream returned invalid JSON: {redact_secrets(raw)}") from exc
+    if not isinstance(data, dict):
+        raise RuntimeError(f"{provider} stream returned an unexpected chunk: {redact_secrets(raw)}")
+    return data
+
+
+def _post_via_urllib(*, url: str, body: bytes, headers: dict[str, str], timeout_seconds: int) -> str:
+    request = urllib.request.Request(url=url, data=body, headers=headers, method="POST")
     try:
         with urllib.request.urlopen(request, timeout=timeout_seconds) as response:  # noqa: S310
-            raw = response.read().decode("utf-8")
+            return response.read().decode("utf-8")
     except urllib.error.HTTPError as exc:
         detail = exc.read().decode("utf-8", errors="replace")
         safe_url = redact_url(url)
@@ -95,11 +430,51 @@ def post_json(
         reason = redact_secrets(str(exc.reason))
         raise RuntimeError(f"Request failed for {safe_url}: {reason}") from exc
 
-    if not raw.strip():
-        return {}
 
+def _stream_via_urllib(
+    *, url: str, body: bytes, headers: dict[str, str], timeout_seconds: int
+) -> Iterator[tuple[int, bytes]]:
+    request = urllib.request.Request(url=url, data=body, headers=headers, method="POST")
     try:
-        return json.loads(raw)
-    except json.JSONDecodeError as exc:
-        safe_raw = redact_secrets(raw)
-        raise RuntimeError(f"Provider returned invalid JSON: {safe_raw}") from exc
+        response = urllib.request.urlopen(request, timeout=timeout_seconds)  # noqa: S310
+    except urllib.error.HTTPError as exc:
+        yield exc.code, exc.read()
+        return
+    except urllib.error.URLError as exc:
+        raise OSError(str(exc.reason)) from exc
+    with response:
+        for line in response:
+            yield response.status, line
+
+
+def _uses_proxy(url: str) -> bool:
+    parts = urlsplit(url)
+    proxies = urllib.request.getproxies()
+    if parts.scheme not in proxies:
+        return False
+    return not urllib.request.proxy_bypass(parts.hostname or "")
+
+
+def _host_key(scheme: str, host: str, port: int | None) -> tuple[str, str, int]:
+    scheme = scheme.lower()
+    if scheme not in {"http", "https"}:
+        raise ValueError(f"Unsupported URL scheme for provider request: {scheme!r}")
+    return scheme, host, port or (443 if scheme == "https" else 80)
+
+
+def _set_timeout(connection: http.client.HTTPConnection, timeout_seconds: float) -> None:
+    connection.timeout = timeout_seconds
+    if connection.sock is not None:
+        connection.sock.settimeout(timeout_seconds)
+
+
+def _is_dropped(connection: http.client.HTTPConnection) -> bool:
+    """Return True if an idle connection's socket is readable, i.e. the server closed it."""
+
+    if connection.sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([connection.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
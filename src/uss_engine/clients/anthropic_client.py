@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from contextlib import closing
 from dataclasses import dataclass
 from typing import Any
 
-from ._http import post_json
+from ._http import iter_sse_data, parse_stream_json, post_json, redact_secrets, stream_lines
 from .base import ChatMessage, ClientConfig
 
 DEFAULT_ANTHROPIC_BASE_URL = "https://api.anthropic.com/v1"
@@ -42,6 +44,47 @@ class AnthropicClient:
         )
 
     def complete(self, messages: list[ChatMessage]) -> str:
+        url, payload, headers = self._request(messages)
+        data = post_json(
+            url=url,
+            payload=payload,
+            headers=headers,
+            timeout_seconds=self.config.timeout_seconds,
+        )
+        try:
+            blocks = data["content"]
+            text = "".join(block.get("text", "") for block in blocks if block.get("type") == "text")
+        except (KeyError, TypeError) as exc:
+            raise RuntimeError(f"Unexpected Anthropic response shape: {data}") from exc
+        if not text.strip():
+            raise RuntimeError("Anthropic response did not contain non-empty text content")
+        return text
+
+    def stream(self, messages: list[ChatMessage]) -> Iterator[str]:
+        """Yield text deltas from a streamed Messages API response (SSE)."""
+
+        url, payload, headers = self._request(messages)
+        with closing(
+            stream_lines(
+                url=url,
+                payload={**payload, "stream": True},
+                headers=headers,
+                timeout_seconds=self.config.timeout_seconds,
+            )
+        ) as lines:
+            for event, raw in iter_sse_data(lines):
+                if event == "message_stop":
+                    return
+                if event == "error":
+                    raise RuntimeError(f"Anthropic stream error: {redact_secrets(raw)}")
+                if event != "content_block_delta":
+                    continue
+                delta = parse_stream_json(raw, provider="Anthropic").get("delta") or {}
+                text = delta.get("text") if isinstance(delta, dict) else None
+                if isinstance(text, str) and text:
+                    yield text
+
+    def _request(self, messages: list[ChatMessage]) -> tuple[str, dict[str, Any], dict[str, str]]:
         api_key = self.config.api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not api_key:
             raise RuntimeError("ANTHROPIC_API_KEY is required for AnthropicClient")
@@ -74,17 +117,4 @@ class AnthropicClient:
             "anthropic-version": DEFAULT_ANTHROPIC_VERSION,
             **(self.config.extra_headers or {}),
         }
-        data = post_json(
-            url=f"{base_url}/messages",
-            payload=payload,
-            headers=headers,
-            timeout_seconds=self.config.timeout_seconds,
-        )
-        try:
-            blocks = data["content"]
-            text = "".join(block.get("text", "") for block in blocks if block.get("type") == "text")
-        except (KeyError, TypeError) as exc:
-            raise RuntimeError(f"Unexpected Anthropic response shape: {data}") from exc
-        if not text.strip():
-            raise RuntimeError("Anthropic response did not contain non-empty text content")
-        return text
+        return f"{base_url}/messages", payload, headers
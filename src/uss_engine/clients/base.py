@@ -7,6 +7,9 @@ one candidate USS Markdown artifact per `complete()` call.
 
 from __future__ import annotations
 
+import hashlib
+import json
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any, Protocol, runtime_checkable
 
@@ -22,6 +25,37 @@ class LLMClient(Protocol):
         """Return a USS Markdown artifact candidate."""
 
 
+@runtime_checkable
+class StreamingLLMClient(LLMClient, Protocol):
+    """Optional extension for clients that can stream a candidate incrementally.
+
+    `stream()` yields text deltas whose concatenation equals what `complete()`
+    would have returned. Callers may close the iterator early to cancel the
+    underlying request.
+    """
+
+    def stream(self, messages: list[ChatMessage]) -> Iterator[str]:
+        """Yield USS Markdown artifact text as it is generated."""
+
+
+def supports_streaming(client: LLMClient) -> bool:
+    """Return whether `client` implements the streaming extension."""
+
+    return isinstance(client, StreamingLLMClient)
+
+
+def client_fingerprint(client: LLMClient) -> str | None:
+    """Return the client's own `fingerprint()`, or None when it defines none.
+
+    A fingerprint identifies everything about a client that shapes its output
+    (provider, model, settings, canned responses), so generations from clients
+    with equal fingerprints are interchangeable.
+    """
+
+    fingerprint = getattr(client, "fingerprint", None)
+    return fingerprint() if callable(fingerprint) else None
+
+
 @dataclass(slots=True)
 class StaticLLMClient:
     """Deterministic test/demo client that returns predefined outputs.
@@ -37,6 +71,17 @@ class StaticLLMClient:
             raise RuntimeError("StaticLLMClient has no outputs remaining")
         return self.outputs.pop(0)
 
+    def stream(self, messages: list[ChatMessage]) -> Iterator[str]:
+        """Yield the next predefined output line by line."""
+
+        yield from self.complete(messages).splitlines(keepends=True)
+
+    def fingerprint(self) -> str:
+        """Hash of the outputs still to be returned."""
+
+        encoded = json.dumps(self.outputs, ensure_ascii=False).encode("utf-8")
+        return "static:" + hashlib.sha256(encoded).hexdigest()
+
 
 @dataclass(slots=True)
 class ClientConfig:
@@ -0,0 +1,122 @@
+"""Content-addressed on-disk cache for LLM completions.
+
+`CachedLLMClient` wraps any `LLMClient` and stores each completion under a hash
+of the provider, model, endpoint, extra request payload, and the exact compiled
+messages.
+Re-running the pipeline after a validator, evidence, or report change therefore
+reuses the provider output whenever the redacted prompt is byte-identical.
+
+Entries live in a `DiskCache` directory (see `uss_engine.diskcache`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterator
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..diskcache import DiskCache
+from .base import ChatMessage, LLMClient, supports_streaming
+
+CACHE_FORMAT_VERSION = 2
+# Kept under its original name for callers of `uss_engine.clients`.
+ResponseCache = DiskCache
+
+
+@dataclass(slots=True)
+class CachedLLMClient:
+    """`LLMClient` wrapper that serves repeated prompts from a `DiskCache`.
+
+    Streaming is passed through on a miss and the output is stored only when the
+    stream ran to completion, so a cancelled attempt is never cached. A hit is
+    yielded as a single chunk.
+    """
+
+    client: LLMClient
+    cache: DiskCache
+    provider: str | None = None
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def complete(self, messages: list[ChatMessage]) -> str:
+        key = self.cache_key(messages)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        output = self.client.complete(messages)
+        self.cache.put(key, output)
+        return output
+
+    def stream(self, messages: list[ChatMessage]) -> Iterator[str]:
+        key = self.cache_key(messages)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            yield cached
+            return
+        self.misses += 1
+        if not supports_streaming(self.client):
+            output = self.client.complete(messages)
+            self.cache.put(key, output)
+            yield output
+            return
+        chunks: list[str] = []
+        with closing(self.client.stream(messages)) as deltas:  # type: ignore[attr-defined]
+            for chunk in deltas:
+                chunks.append(chunk)
+                yield chunk
+        self.cache.put(key, "".join(chunks))
+
+    def cache_key(self, messages: list[ChatMessage]) -> str:
+        extra_payload = dict(_config_value(self.client, "extra_payload") or {})
+        max_tokens = getattr(self.client, "max_tokens", None)
+        if max_tokens is not None:
+            extra_payload.setdefault("max_tokens", max_tokens)
+        return response_cache_key(
+            provider=self.provider or type(self.client).__name__,
+            model=_config_value(self.client, "model"),
+            base_url=_config_value(self.client, "base_url"),
+            extra_payload=extra_payload,
+            messages=messages,
+        )
+
+
+def response_cache_key(
+    *,
+    provider: str,
+    model: str | None,
+    extra_payload: dict[str, Any] | None,
+    messages: list[ChatMessage],
+    base_url: str | None = None,
+) -> str:
+    """Return the content hash identifying one completion request.
+
+    `base_url` keeps responses from different servers for the same provider
+    name (two Ollama hosts, a proxy) apart.
+    """
+
+    material = json.dumps(
+        {
+            "version": CACHE_FORMAT_VERSION,
+            "provider": provider,
+            "model": model,
+            "base_url": base_url,
+            "extra_payload": extra_payload or {},
+            "messages": messages,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _config_value(client: LLMClient, name: str) -> Any:
+    config = getattr(client, "config", None)
+    return getattr(config, name, None)
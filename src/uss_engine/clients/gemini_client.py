@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from contextlib import closing
 from dataclasses import dataclass
 from typing import Any
 from urllib.parse import urlencode
 
-from ._http import post_json
+from ._http import iter_sse_data, parse_stream_json, post_json, redact_secrets, stream_lines
 from .base import ChatMessage, ClientConfig
 
 DEFAULT_GEMINI_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
@@ -44,15 +46,7 @@ class GeminiClient:
         )
 
     def complete(self, messages: list[ChatMessage]) -> str:
-        api_key = self.config.api_key or os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
-        if not api_key:
-            raise RuntimeError("GEMINI_API_KEY or GOOGLE_API_KEY is required for GeminiClient")
-
-        payload: dict[str, Any] = {
-            "contents": _messages_to_gemini_contents(messages),
-            "generationConfig": {"temperature": 0},
-            **(self.config.extra_payload or {}),
-        }
+        payload, api_key = self._request(messages)
         base_url = (self.config.base_url or DEFAULT_GEMINI_BASE_URL).rstrip("/")
         query = urlencode({"key": api_key})
         data = post_json(
@@ -70,6 +64,44 @@ class GeminiClient:
             raise RuntimeError("Gemini response did not contain non-empty text content")
         return text
 
+    def stream(self, messages: list[ChatMessage]) -> Iterator[str]:
+        """Yield text from `streamGenerateContent` server-sent events."""
+
+        payload, api_key = self._request(messages)
+        base_url = (self.config.base_url or DEFAULT_GEMINI_BASE_URL).rstrip("/")
+        query = urlencode({"alt": "sse", "key": api_key})
+        with closing(
+            stream_lines(
+                url=f"{base_url}/models/{self.config.model}:streamGenerateContent?{query}",
+                payload=payload,
+                headers={**(self.config.extra_headers or {})},
+                timeout_seconds=self.config.timeout_seconds,
+            )
+        ) as lines:
+            for _event, raw in iter_sse_data(lines):
+                chunk = parse_stream_json(raw, provider="Gemini")
+                if "error" in chunk:
+                    raise RuntimeError(f"Gemini stream error: {redact_secrets(str(chunk['error']))}")
+                try:
+                    parts = chunk["candidates"][0]["content"]["parts"]
+                except (KeyError, IndexError, TypeError):
+                    continue
+                text = "".join(part.get("text", "") for part in parts if isinstance(part, dict))
+                if text:
+                    yield text
+
+    def _request(self, messages: list[ChatMessage]) -> tuple[dict[str, Any], str]:
+        api_key = self.config.api_key or os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
+        if not api_key:
+            raise RuntimeError("GEMINI_API_KEY or GOOGLE_API_KEY is required for GeminiClient")
+
+        payload: dict[str, Any] = {
+            "contents": _messages_to_gemini_contents(messages),
+            "generationConfig": {"temperature": 0},
+            **(self.config.extra_payload or {}),
+        }
+        return payload, api_key
+
 
 def _messages_to_gemini_contents(messages: list[ChatMessage]) -> list[dict[str, Any]]:
     system_parts: list[str] = []
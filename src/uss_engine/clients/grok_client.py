@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from contextlib import closing
 from dataclasses import dataclass
 from typing import Any
 
-from ._http import post_json
+from ._http import iter_sse_data, parse_stream_json, post_json, redact_secrets, stream_lines
 from .base import ChatMessage, ClientConfig
 
 DEFAULT_XAI_BASE_URL = "https://api.x.ai/v1"
@@ -42,6 +44,48 @@ class GrokClient:
         )
 
     def complete(self, messages: list[ChatMessage]) -> str:
+        url, payload, headers = self._request(messages)
+        data = post_json(
+            url=url,
+            payload=payload,
+            headers=headers,
+            timeout_seconds=self.config.timeout_seconds,
+        )
+        try:
+            content = data["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError) as exc:
+            raise RuntimeError(f"Unexpected Grok/xAI response shape: {data}") from exc
+        if not isinstance(content, str) or not content.strip():
+            raise RuntimeError("Grok/xAI response did not contain non-empty message content")
+        return content
+
+    def stream(self, messages: list[ChatMessage]) -> Iterator[str]:
+        """Yield content deltas from a streamed (SSE) chat completion."""
+
+        url, payload, headers = self._request(messages)
+        with closing(
+            stream_lines(
+                url=url,
+                payload={**payload, "stream": True},
+                headers=headers,
+                timeout_seconds=self.config.timeout_seconds,
+            )
+        ) as lines:
+            for _event, raw in iter_sse_data(lines):
+                if raw.strip() == "[DONE]":
+                    return
+                chunk = parse_stream_json(raw, provider="Grok/xAI")
+                if "error" in chunk:
+                    raise RuntimeError(f"Grok/xAI stream error: {redact_secrets(str(chunk['error']))}")
+                try:
+                    delta = chunk["choices"][0].get("delta") or {}
+                except (KeyError, IndexError, TypeError, AttributeError):
+                    continue
+                content = delta.get("content")
+                if isinstance(content, str) and content:
+                    yield content
+
+    def _request(self, messages: list[ChatMessage]) -> tuple[str, dict[str, Any], dict[str, str]]:
         api_key = self.config.api_key or os.environ.get("XAI_API_KEY")
         if not api_key:
             raise RuntimeError("XAI_API_KEY is required for GrokClient")
@@ -57,16 +101,4 @@ class GrokClient:
             "Authorization": f"Bearer {api_key}",
             **(self.config.extra_headers or {}),
         }
-        data = post_json(
-            url=f"{base_url}/chat/completions",
-            payload=payload,
-            headers=headers,
-            timeout_seconds=self.config.timeout_seconds,
-        )
-        try:
-            content = data["choices"][0]["message"]["content"]
-        except (KeyError, IndexError, TypeError) as exc:
-            raise RuntimeError(f"Unexpected Grok/xAI response shape: {data}") from exc
-        if not isinstance(content, str) or not content.strip():
-            raise RuntimeError("Grok/xAI response did not contain non-empty message content")
-        return content
+        return f"{base_url}/chat/completions", payload, headers
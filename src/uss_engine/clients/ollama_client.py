@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from contextlib import closing
 from dataclasses import dataclass
 from typing import Any
 
-from ._http import post_json
+from ._http import parse_stream_json, post_json, redact_secrets, stream_lines
 from .base import ChatMessage, ClientConfig
 
 DEFAULT_OLLAMA_BASE_URL = "http://localhost:11434"
@@ -14,7 +16,10 @@ DEFAULT_OLLAMA_BASE_URL = "http://localhost:11434"
 
 @dataclass(slots=True)
 class OllamaClient:
-    """Minimal Ollama /api/chat client with stream disabled."""
+    """Minimal Ollama /api/chat client.
+
+    `complete()` disables streaming; `stream()` consumes the NDJSON stream.
+    """
 
     config: ClientConfig
 
@@ -38,21 +43,10 @@ class OllamaClient:
         )
 
     def complete(self, messages: list[ChatMessage]) -> str:
-        payload: dict[str, Any] = {
-            "model": self.config.model,
-            "messages": messages,
-            "stream": False,
-            **(self.config.extra_payload or {}),
-        }
-        headers: dict[str, str] = {**(self.config.extra_headers or {})}
-        api_key = self.config.api_key or os.environ.get("OLLAMA_API_KEY")
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
-
-        base_url = (self.config.base_url or DEFAULT_OLLAMA_BASE_URL).rstrip("/")
+        url, payload, headers = self._request(messages)
         data = post_json(
-            url=f"{base_url}/api/chat",
-            payload=payload,
+            url=url,
+            payload={**payload, "stream": False},
             headers=headers,
             timeout_seconds=self.config.timeout_seconds,
         )
@@ -63,3 +57,42 @@ class OllamaClient:
         if not isinstance(content, str) or not content.strip():
             raise RuntimeError("Ollama response did not contain non-empty message content")
         return content
+
+    def stream(self, messages: list[ChatMessage]) -> Iterator[str]:
+        """Yield message content from Ollama's newline-delimited JSON stream."""
+
+        url, payload, headers = self._request(messages)
+        with closing(
+            stream_lines(
+                url=url,
+                payload={**payload, "stream": True},
+                headers=headers,
+                timeout_seconds=self.config.timeout_seconds,
+            )
+        ) as lines:
+            for line in lines:
+                if not line.strip():
+                    continue
+                chunk = parse_stream_json(line, provider="Ollama")
+                if "error" in chunk:
+                    raise RuntimeError(f"Ollama stream error: {redact_secrets(str(chunk['error']))}")
+                message = chunk.get("message")
+                content = message.get("content") if isinstance(message, dict) else None
+                if isinstance(content, str) and content:
+                    yield content
+                if chunk.get("done"):
+                    return
+
+    def _request(self, messages: list[ChatMessage]) -> tuple[str, dict[str, Any], dict[str, str]]:
+        payload: dict[str, Any] = {
+            "model": self.config.model,
+            "messages": messages,
+            **(self.config.extra_payload or {}),
+        }
+        headers: dict[str, str] = {**(self.config.extra_headers or {})}
+        api_key = self.config.api_key or os.environ.get("OLLAMA_API_KEY")
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+
+        base_url = (self.config.base_url or DEFAULT_OLLAMA_BASE_URL).rstrip("/")
+        return f"{base_url}/api/chat", payload, headers
@@ -8,10 +8,12 @@ application code without changing the `LLMClient` contract.
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from contextlib import closing
 from dataclasses import dataclass
 from typing import Any
 
-from ._http import post_json
+from ._http import iter_sse_data, parse_stream_json, post_json, redact_secrets, stream_lines
 from .base import ChatMessage, ClientConfig
 
 DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
@@ -43,6 +45,48 @@ class OpenAIClient:
         )
 
     def complete(self, messages: list[ChatMessage]) -> str:
+        url, payload, headers = self._request(messages)
+        data = post_json(
+            url=url,
+            payload=payload,
+            headers=headers,
+            timeout_seconds=self.config.timeout_seconds,
+        )
+        try:
+            content = data["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError) as exc:
+            raise RuntimeError(f"Unexpected OpenAI response shape: {data}") from exc
+        if not isinstance(content, str) or not content.strip():
+            raise RuntimeError("OpenAI response did not contain non-empty message content")
+        return content
+
+    def stream(self, messages: list[ChatMessage]) -> Iterator[str]:
+        """Yield content deltas from a streamed (SSE) chat completion."""
+
+        url, payload, headers = self._request(messages)
+        with closing(
+            stream_lines(
+                url=url,
+                payload={**payload, "stream": True},
+                headers=headers,
+                timeout_seconds=self.config.timeout_seconds,
+            )
+        ) as lines:
+            for _event, raw in iter_sse_data(lines):
+                if raw.strip() == "[DONE]":
+                    return
+                chunk = parse_stream_json(raw, provider="OpenAI")
+                if "error" in chunk:
+                    raise RuntimeError(f"OpenAI stream error: {redact_secrets(str(chunk['error']))}")
+                try:
+                    delta = chunk["choices"][0].get("delta") or {}
+                except (KeyError, IndexError, TypeError, AttributeError):
+                    continue
+                content = delta.get("content")
+                if isinstance(content, str) and content:
+                    yield content
+
+    def _request(self, messages: list[ChatMessage]) -> tuple[str, dict[str, Any], dict[str, str]]:
         api_key = self.config.api_key or os.environ.get("OPENAI_API_KEY")
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY is required for OpenAIClient")
@@ -58,16 +102,4 @@ class OpenAIClient:
             "Authorization": f"Bearer {api_key}",
             **(self.config.extra_headers or {}),
         }
-        data = post_json(
-            url=f"{base_url}/chat/completions",
-            payload=payload,
-            headers=headers,
-            timeout_seconds=self.config.timeout_seconds,
-        )
-        try:
-            content = data["choices"][0]["message"]["content"]
-        except (KeyError, IndexError, TypeError) as exc:
-            raise RuntimeError(f"Unexpected OpenAI response shape: {data}") from exc
-        if not isinstance(content, str) or not content.strip():
-            raise RuntimeError("OpenAI response did not contain non-empty message content")
-        return content
+        return f"{base_url}/chat/completions", payload, headers
@@ -0,0 +1,415 @@
+"""Column-oriented in-memory threads for very large transcripts.
+
+A `NormalizedThread` holds one validated pydantic `TranscriptMessage` per
+message, which dominates memory and load time for exports with 100k+ messages.
+`CompactThread` stores the same data as columns:
+
+- role codes in an `array('B')`;
+- all message content in one string, sliced through an offset array;
+- message IDs only where they differ from the positional default
+  (`msg_0001`, ...), interned;
+- timestamps as codes into a table of distinct values.
+
+Validation is deferred to `validate()` (run by `to_normalized()`), which
+checks each distinct timestamp once. Messages are materialized as
+`TranscriptMessage` objects only when read through `messages`, so code written
+against `NormalizedThread` (redaction, prompt compilation, evidence mapping and
+the static renderer) works unchanged.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any, overload
+from uuid import uuid4
+
+from pydantic_core import core_schema
+
+from .transcript import (
+    NormalizedThread,
+    TranscriptMessage,
+    TranscriptRole,
+    _now_utc,
+    iter_text_file_messages,
+    message_fields_from_json,
+    open_thread_stream,
+    render_prompt_block,
+)
+
+_ROLES = tuple(TranscriptRole)
+_ROLE_CODES = {role: code for code, role in enumerate(_ROLES)}
+
+# (id, role, content, timestamp, source_index) as yielded by `CompactThread.rows`.
+MessageRow = tuple[str, TranscriptRole, str, str | None, int]
+
+
+class CompactThread:
+    """Array-backed counterpart of `NormalizedThread` (see module docstring)."""
+
+    __slots__ = (
+        "thread_id",
+        "source",
+        "created_at",
+        "metadata",
+        "extra",
+        "_roles",
+        "_parts",
+        "_text",
+        "_offsets",
+        "_ids",
+        "_timestamps",
+        "_timestamp_table",
+        "_timestamp_codes",
+        "_source_indices",
+        "_message_metadata",
+        "_message_extra",
+        "_hit_counts",
+        "_validated",
+    )
+
+    def __init__(
+        self,
+        *,
+        thread_id: str | None = None,
+        source: str = "unknown",
+        created_at: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        extra: dict[str, Any] | None = None,
+    ) -> None:
+        self.thread_id = thread_id or f"thread_{uuid4().hex[:12]}"
+        self.source = source
+        self.created_at = created_at or _now_utc()
+        self.metadata = metadata or {}
+        self.extra = extra or {}
+        self._roles = array("B")
+        self._parts: list[str] = []
+        self._text = ""
+        self._offsets = array("Q", [0])
+        self._ids: dict[int, str] = {}
+        self._timestamps: dict[str | None, int] = {None: 0}
+        self._timestamp_table: list[str | None] = [None]
+        self._timestamp_codes = array("I")
+        self._source_indices = array("q")
+        self._message_metadata: dict[int, dict[str, Any]] = {}
+        self._message_extra: dict[int, dict[str, Any]] = {}
+        # Per-message redaction hit counts, set by `redact_thread`; surfaced as
+        # the `redacted`/`redaction_hit_count` message metadata.
+        self._hit_counts: array[int] | None = None
+        self._validated = False
+
+    # Building -----------------------------------------------------------
+
+    def append(
+        self,
+        role: TranscriptRole | str,
+        content: str,
+        *,
+        id: str | None = None,
+        timestamp: str | None = None,
+        source_index: int | None = None,
+        metadata: dict[str, Any] | None = None,
+        **extra: Any,
+    ) -> None:
+        """Add one message without running pydantic validation."""
+
+        index = len(self._roles)
+        self._roles.append(_ROLE_CODES[TranscriptRole(role)])
+        content = content.strip()
+        self._parts.append(content)
+        self._offsets.append(self._offsets[-1] + len(content))
+        if id is not None and id != _default_id(index):
+            self._ids[index] = sys.intern(id)
+        code = self._timestamps.get(timestamp)
+        if code is None:
+            code = self._timestamps[timestamp] = len(self._timestamp_table)
+            self._timestamp_table.append(sys.intern(timestamp) if timestamp else timestamp)
+        self._timestamp_codes.append(code)
+        self._source_indices.append(index if source_index is None else source_index)
+        if metadata:
+            self._message_metadata[index] = dict(metadata)
+        if extra:
+            self._message_extra[index] = extra
+        if self._hit_counts is not None:
+            self._hit_counts.append(0)
+        self._validated = False
+
+    @classmethod
+    def from_normalized(cls, thread: NormalizedThread) -> "CompactThread":
+        compact = cls(
+            thread_id=thread.thread_id,
+            source=thread.source,
+            created_at=thread.created_at,
+            metadata=dict(thread.metadata),
+            extra=dict(thread.model_extra or {}),
+        )
+        for message in thread.messages:
+            compact.append(
+                message.role,
+                message.content,
+                id=message.id,
+                timestamp=message.timestamp,
+                source_index=message.source_index,
+                metadata=message.metadata,
+                **(message.model_extra or {}),
+            )
+        compact._validated = True
+        return compact
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Any],
+        *,
+        thread_id: str | None = None,
+        source: str = "json",
+        created_at: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> "CompactThread":
+        """Build from JSON message objects, resolving the same key aliases as `normalize_transcript_json`."""
+
+        compact = cls(thread_id=thread_id, source=source, created_at=created_at, metadata=metadata)
+        for index, item in enumerate(records):
+            fields = message_fields_from_json(item, index)
+            compact.append(fields.pop("role"), fields.pop("content"), **fields)
+        return compact
+
+    # Read API shared with NormalizedThread ------------------------------
+
+    @property
+    def messages(self) -> "CompactMessages":
+        return CompactMessages(self)
+
+    @property
+    def exchange_pair_count(self) -> int:
+        users = self._roles.count(_ROLE_CODES[TranscriptRole.user])
+        assistants = self._roles.count(_ROLE_CODES[TranscriptRole.assistant])
+        return min(users, assistants)
+
+    @property
+    def char_count(self) -> int:
+        return self._offsets[-1]
+
+    def to_prompt_block(self, *, max_chars: int | None = None) -> str:
+        return render_prompt_block(self.messages, max_chars=max_chars)
+
+    def __len__(self) -> int:
+        return len(self._roles)
+
+    # Column access -------------------------------------------------------
+
+    def content(self, index: int) -> str:
+        return self._buffer()[self._offsets[index] : self._offsets[index + 1]]
+
+    def message_id(self, index: int) -> str:
+        return self._ids.get(index) or _default_id(index)
+
+    def role(self, index: int) -> TranscriptRole:
+        return _ROLES[self._roles[index]]
+
+    def rows(self) -> Iterator[MessageRow]:
+        """Yield `(id, role, content, timestamp, source_index)` without building models."""
+
+        text = self._buffer()
+        offsets = self._offsets
+        timestamps = self._timestamp_table
+        for index, code in enumerate(self._roles):
+            yield (
+                self._ids.get(index) or _default_id(index),
+                _ROLES[code],
+                text[offsets[index] : offsets[index + 1]],
+                timestamps[self._timestamp_codes[index]],
+                self._source_indices[index],
+            )
+
+    def message(self, index: int) -> TranscriptMessage:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("message index out of range")
+        return TranscriptMessage.model_construct(
+            id=self.message_id(index),
+            role=self.role(index),
+            content=self.content(index),
+            timestamp=self._timestamp_table[self._timestamp_codes[index]],
+            source_index=self._source_indices[index],
+            metadata=self._metadata_for(index),
+            **self._message_extra.get(index, {}),
+        )
+
+    def with_contents(self, contents: Sequence[str], *, hit_counts: Sequence[int] | None = None) -> "CompactThread":
+        """Return a copy with new message contents, sharing every other column.
+
+        `hit_counts` records per-message redaction hits, which surface as the
+        `redacted`/`redaction_hit_count` metadata `redact_thread` sets.
+        """
+
+        if len(contents) != len(self):
+            raise ValueError("contents must provide one entry per message")
+        copy = CompactThread(
+            thread_id=self.thread_id,
+            source=self.source,
+            created_at=self.created_at,
+            metadata=dict(self.metadata),
+            extra=dict(self.extra),
+        )
+        copy._roles = array("B", self._roles)
+        copy._parts = [content.strip() for content in contents]
+        offsets = array("Q", [0])
+        total = 0
+        for content in copy._parts:
+            total += len(content)
+            offsets.append(total)
+        copy._offsets = offsets
+        copy._ids = dict(self._ids)
+        copy._timestamps = dict(self._timestamps)
+        copy._timestamp_table = list(self._timestamp_table)
+        copy._timestamp_codes = array("I", self._timestamp_codes)
+        copy._source_indices = array("q", self._source_indices)
+        copy._message_metadata = dict(self._message_metadata)
+        copy._message_extra = dict(self._message_extra)
+        counts = hit_counts if hit_counts is not None else self._hit_counts
+        copy._hit_counts = None if counts is None else array("I", counts)
+        copy._validated = self._validated and all(copy._parts)
+        return copy
+
+    # Validation and conversion -------------------------------------------
+
+    def validate(self) -> "CompactThread":
+        """Apply `NormalizedThread`'s checks; each distinct timestamp is parsed once."""
+
+        if self._validated:
+            return self
+        if not len(self):
+            raise ValueError("normalized thread must contain at least one message")
+        datetime.fromisoformat(self.created_at.replace("Z", "+00:00"))
+        offsets = self._offsets
+        for index in range(len(self)):
+            if offsets[index] == offsets[index + 1]:
+                raise ValueError(f"message {self.message_id(index)}: message content cannot be empty")
+        for timestamp in self._timestamp_table:
+            if timestamp is None:
+                continue
+            try:
+                datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            except ValueError as exc:
+                raise ValueError(f"timestamp {timestamp!r} must be ISO-8601 compatible") from exc
+        self._validated = True
+        return self
+
+    def to_normalized(self) -> NormalizedThread:
+        self.validate()
+        return NormalizedThread(
+            thread_id=self.thread_id,
+            source=self.source,
+            created_at=self.created_at,
+            messages=list(self.messages),
+            metadata=self.metadata,
+            **self.extra,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON form `NormalizedThread.model_dump(mode="json")` would produce."""
+
+        messages = []
+        for index, (message_id, role, content, timestamp, source_index) in enumerate(self.rows()):
+            messages.append(
+                {
+                    "id": message_id,
+                    "role": role.value,
+                    "content": content,
+                    "timestamp": timestamp,
+                    "source_index": source_index,
+                    "metadata": self._metadata_for(index),
+                    **self._message_extra.get(index, {}),
+                }
+            )
+        return {
+            "thread_id": self.thread_id,
+            "source": self.source,
+            "created_at": self.created_at,
+            "messages": messages,
+            "metadata": self.metadata,
+            **self.extra,
+        }
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        # Accepted as-is in models such as RedactionResult and serialized in the
+        # NormalizedThread JSON form, so stored outputs load back as NormalizedThread.
+        return core_schema.is_instance_schema(
+            cls, serialization=core_schema.plain_serializer_function_ser_schema(lambda thread: thread.to_dict())
+        )
+
+    # Internals -----------------------------------------------------------
+
+    def _buffer(self) -> str:
+        # Appends are collected and joined into the shared buffer on first read.
+        if self._parts:
+            self._text += "".join(self._parts)
+            self._parts = []
+        return self._text
+
+    def _metadata_for(self, index: int) -> dict[str, Any]:
+        metadata = dict(self._message_metadata.get(index, {}))
+        if self._hit_counts is not None:
+            count = self._hit_counts[index]
+            metadata.update({"redacted": bool(count), "redaction_hit_count": count})
+        return metadata
+
+
+class CompactMessages(Sequence[TranscriptMessage]):
+    """Read-only message view over a `CompactThread`; items are built on access."""
+
+    __slots__ = ("_thread",)
+
+    def __init__(self, thread: CompactThread) -> None:
+        self._thread = thread
+
+    def __len__(self) -> int:
+        return len(self._thread)
+
+    @overload
+    def __getitem__(self, index: int) -> TranscriptMessage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TranscriptMessage]: ...
+
+    def __getitem__(self, index: int | slice) -> TranscriptMessage | list[TranscriptMessage]:
+        if isinstance(index, slice):
+            return [self._thread.message(position) for position in range(*index.indices(len(self)))]
+        return self._thread.message(index)
+
+    def __iter__(self) -> Iterator[TranscriptMessage]:
+        for index in range(len(self._thread)):
+            yield self._thread.message(index)
+
+
+def _default_id(index: int) -> str:
+    return f"msg_{index + 1:04d}"
+
+
+def load_compact_thread(path: str | Path) -> CompactThread:
+    """Load a transcript straight into a `CompactThread`, skipping per-message models.
+
+    JSON and JSONL files are streamed (see `open_thread_stream`); text files go
+    through the memory-mapped text scanner. Text messages get positional IDs.
+    """
+
+    input_path = Path(path)
+    suffix = input_path.suffix.lower()
+    if suffix in {".json", ".jsonl"}:
+        stream = open_thread_stream(input_path)
+        compact = CompactThread.from_records(stream.iter_records(), source=stream.source)
+        # Thread fields after a JSON message list are only known once it is read.
+        compact.thread_id, compact.source, compact.created_at = stream.thread_id, stream.source, stream.created_at
+        compact.metadata = stream.metadata
+        return compact
+
+    compact = CompactThread(source=suffix.lstrip(".") or "text")
+    for role, content in iter_text_file_messages(input_path):
+        compact.append(role, content)
+    return compact
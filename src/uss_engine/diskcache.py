@@ -0,0 +1,118 @@
+"""Directory of cached string values shared by the response and redaction caches.
+
+Entries are plain JSON files sharded by key prefix. Every hit refreshes the
+entry's mtime, and eviction removes entries unused for longer than
+`max_age_seconds` and then the least recently used entries until the cache fits
+in `max_bytes`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DISK_FORMAT_VERSION = 1
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+
+@dataclass(slots=True)
+class DiskCache:
+    """Directory of cached string values with size- and age-based LRU eviction."""
+
+    directory: Path
+    max_bytes: int = DEFAULT_MAX_BYTES
+    max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS
+    evict_interval: int = 1
+    _puts: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory)
+        if self.max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        if self.max_age_seconds <= 0:
+            raise ValueError("max_age_seconds must be positive")
+        if self.evict_interval < 1:
+            raise ValueError("evict_interval must be at least 1")
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        if time.time() - stat.st_mtime > self.max_age_seconds:
+            _unlink(path)
+            return None
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            _unlink(path)
+            return None
+        output = record.get("output") if isinstance(record, dict) else None
+        if not isinstance(output, str):
+            _unlink(path)
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return output
+
+    def put(self, key: str, output: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = {"version": DISK_FORMAT_VERSION, "key": key, "created_at": time.time(), "output": output}
+        # Write-then-rename so concurrent batch workers never read a partial entry.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(record, handle, ensure_ascii=False)
+            os.replace(tmp_name, path)
+        except BaseException:
+            _unlink(Path(tmp_name))
+            raise
+        # Eviction walks the whole directory, so high-volume callers run it only
+        # every `evict_interval` writes.
+        self._puts += 1
+        if self._puts % self.evict_interval == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """Apply the age and size limits; return the number of entries removed."""
+
+        now = time.time()
+        entries: list[tuple[float, int, Path]] = []
+        removed = 0
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if now - stat.st_mtime > self.max_age_seconds:
+                removed += _unlink(path)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            removed += _unlink(path)
+            total -= size
+        return removed
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+
+def _unlink(path: Path) -> int:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return 0
+    return 1
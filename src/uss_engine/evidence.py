@@ -13,7 +13,9 @@ from __future__ import annotations
 
 import hashlib
 import re
+from bisect import bisect_right
 from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import StrEnum
 from pathlib import Path
@@ -22,8 +24,10 @@ from typing import Any
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from .schema import InvocationMode
+from .compact_thread import CompactThread
+from .thread_cache import ThreadCache
 from .transcript import NormalizedThread, TranscriptMessage, load_thread
-from .validator import parse_fields, parse_frontmatter, parse_sections
+from .validator import ParsedArtifact, as_parsed_artifact, parse_artifact
 
 EVIDENCE_REF_RE = re.compile(
     r"(?:\[evidence\s*:\s*(?P<bracket>[^\]]+)\]|Evidence\s*:\s*(?P<plain>[^\n]+))",
@@ -87,6 +91,14 @@ class EvidenceConfidence(StrEnum):
     protocol_assessment = "protocol_assessment"
 
 
+class EvidenceScoring(StrEnum):
+    """Lexical scorer used to pick the best supporting message for a claim."""
+
+    lexical = "lexical"
+    vector = "vector"
+    bm25 = "bm25"
+
+
 class EvidenceAnchor(BaseModel):
     """A single source-thread anchor supporting a USS claim."""
 
@@ -174,30 +186,133 @@ class EvidenceValidationReport(BaseModel):
     unsupported_claim_ids: list[str] = Field(default_factory=list)
 
 
+@dataclass(slots=True)
+class EvidenceIndex:
+    """Per-thread lookup structures shared by every claim in one evidence run.
+
+    Messages are tokenized exactly once. Lexical scoring then walks the posting
+    lists of the claim tokens instead of re-tokenizing the whole thread for each
+    claim, and phrase bonuses are found with one substring scan over the joined
+    token text. Scores are identical to `_lexical_support_score`.
+    """
+
+    thread_id: str
+    messages: list[TranscriptMessage]
+    message_by_id: dict[str, TranscriptMessage]
+    message_counters: list[Counter[str]]
+    postings: dict[str, list[tuple[int, int]]]
+    phrase_text: str
+    phrase_offsets: list[int]
+
+    @classmethod
+    def from_thread(cls, thread: NormalizedThread | CompactThread) -> "EvidenceIndex":
+        messages = list(thread.messages)
+        message_by_id = {message.id: message for message in messages}
+        message_counters: list[Counter[str]] = []
+        postings: dict[str, list[tuple[int, int]]] = {}
+        cleaned: list[str] = []
+        phrase_offsets: list[int] = []
+        offset = 0
+        for index, message in enumerate(messages):
+            tokens = _tokens(message.content)
+            counter = Counter(tokens)
+            message_counters.append(counter)
+            for token, count in counter.items():
+                postings.setdefault(token, []).append((index, count))
+            clean = " ".join(tokens)
+            cleaned.append(clean)
+            phrase_offsets.append(offset)
+            # Claim phrases only contain word characters and spaces, so a newline
+            # separator can never let a phrase match across two messages.
+            offset += len(clean) + 1
+        return cls(
+            thread_id=thread.thread_id,
+            messages=messages,
+            message_by_id=message_by_id,
+            message_counters=message_counters,
+            postings=postings,
+            phrase_text="\n".join(cleaned),
+            phrase_offsets=phrase_offsets,
+        )
+
+    def scores(self, claim_text: str) -> dict[int, float]:
+        """Return non-zero lexical support scores keyed by message position."""
+
+        claim_tokens = _tokens(claim_text)
+        if not claim_tokens:
+            return {}
+        claim_counter = Counter(claim_tokens)
+        total = max(sum(claim_counter.values()), 1)
+
+        overlaps: dict[int, int] = {}
+        for token, count in claim_counter.items():
+            for index, message_count in self.postings.get(token, ()):
+                overlaps[index] = overlaps.get(index, 0) + min(count, message_count)
+
+        scores = {index: overlap / total for index, overlap in overlaps.items()}
+        for index in self.phrase_hits(" ".join(claim_tokens)):
+            scores[index] = min(1.0, scores.get(index, 0.0) + 0.25)
+        return scores
+
+    def best_match(self, claim_text: str) -> tuple[float, TranscriptMessage | None]:
+        """Return the best scoring message, preferring earlier messages on ties."""
+
+        if not self.messages:
+            return 0.0, None
+        scores = self.scores(claim_text)
+        if not scores:
+            return 0.0, self.messages[0]
+        best_index = min(scores, key=lambda index: (-scores[index], index))
+        return scores[best_index], self.messages[best_index]
+
+    def phrase_hits(self, claim_clean: str) -> set[int]:
+        """Return message positions whose token text contains the claim phrase."""
+
+        if len(claim_clean) < 24:
+            return set()
+        hits: set[int] = set()
+        position = self.phrase_text.find(claim_clean)
+        while position != -1:
+            hits.add(bisect_right(self.phrase_offsets, position) - 1)
+            position = self.phrase_text.find(claim_clean, position + 1)
+        return hits
+
+
 def build_evidence_map(
     *,
-    summary_text: str,
-    thread: NormalizedThread,
+    summary_text: str | ParsedArtifact,
+    thread: NormalizedThread | CompactThread,
     artifact_id: str | None = None,
     max_claims_per_field: int = 5,
+    index: EvidenceIndex | None = None,
+    scoring: EvidenceScoring | str = EvidenceScoring.lexical,
 ) -> EvidenceMap:
-    """Build an evidence map for a USS Markdown artifact against a normalized thread."""
+    """Build an evidence map for a USS Markdown artifact against a normalized thread.
 
-    frontmatter: dict[str, Any] = {}
-    body = summary_text
-    try:
-        frontmatter, body = parse_frontmatter(summary_text)
-    except ValueError:
-        # Evidence building can still run on malformed summaries so the inspector
-        # can return a complete diagnostic bundle.
-        body = summary_text
+    The thread is indexed once for all claims. Callers that also validate the map
+    can build the `EvidenceIndex` themselves and pass it to both functions.
+
+    `scoring="vector"` batches all claims through the NumPy scorer and produces
+    the same scores as `lexical`; it falls back to `lexical` when NumPy is not
+    installed. `scoring="bm25"` uses length-normalized BM25 and requires NumPy.
+    """
+
+    # Evidence building can still run on malformed summaries so the inspector can
+    # return a complete diagnostic bundle; a front matter error leaves it empty.
+    parsed = as_parsed_artifact(summary_text)
+    frontmatter = parsed.frontmatter
 
     mode = _resolve_mode(frontmatter.get("mode"))
     protocol_version = str(frontmatter.get("protocol_version") or frontmatter.get("version") or "") or None
-    artifact_key = artifact_id or _artifact_id(summary_text)
-    claims = extract_claims(summary_text, max_claims_per_field=max_claims_per_field)
-
-    anchored_claims = [anchor_claim(claim, thread) for claim in claims]
+    artifact_key = artifact_id or _artifact_id(parsed.text)
+    claims = extract_claims(parsed, max_claims_per_field=max_claims_per_field)
+
+    evidence_index = index or EvidenceIndex.from_thread(thread)
+    best_matches = _batch_best_matches(claims, evidence_index, EvidenceScoring(scoring))
+    anchored_claims = [
+        _anchor_claim(claim, evidence_index, best_matches.get(position))
+        for position, claim in enumerate(claims)
+    ]
     coverage = calculate_coverage(anchored_claims)
     warnings: list[str] = []
     if not anchored_claims:
@@ -222,20 +337,23 @@ def build_evidence_map_from_files(
     summary_path: str | Path,
     thread_path: str | Path,
     max_claims_per_field: int = 5,
+    scoring: EvidenceScoring | str = EvidenceScoring.lexical,
+    thread_cache: ThreadCache | None = None,
 ) -> EvidenceMap:
     """Load files and build an evidence map."""
 
-    summary = Path(summary_path).read_text(encoding="utf-8")
-    thread = load_thread(thread_path)
+    summary = parse_artifact(Path(summary_path).read_text(encoding="utf-8"))
+    thread = load_thread(thread_path, cache=thread_cache)
     return build_evidence_map(
         summary_text=summary,
         thread=thread,
         artifact_id=str(Path(summary_path)),
         max_claims_per_field=max_claims_per_field,
+        scoring=scoring,
     )
 
 
-def extract_claims(summary_text: str, *, max_claims_per_field: int = 5) -> list[EvidenceClaim]:
+def extract_claims(summary_text: str | ParsedArtifact, *, max_claims_per_field: int = 5) -> list[EvidenceClaim]:
     """Extract evidence-checkable claims from USS field values.
 
     The validator already checks required fields. This function converts each
@@ -243,23 +361,17 @@ def extract_claims(summary_text: str, *, max_claims_per_field: int = 5) -> list[
     declarations and the dedicated optional evidence section if present.
     """
 
-    try:
-        _, body = parse_frontmatter(summary_text)
-    except ValueError:
-        body = summary_text
-
-    sections = parse_sections(body)
+    parsed = as_parsed_artifact(summary_text)
     claims: list[EvidenceClaim] = []
-    for section_title, section_body in sections.items():
+    for section_title, section in parsed.sections.items():
         if section_title.upper().startswith("EVIDENCE MAP"):
             continue
         if section_title == "INVOCATION LOCK":
-            claim_texts = _split_claim_text(section_body, max_items=1)
+            claim_texts = _split_claim_text(section.body, max_items=1)
             for idx, claim_text in enumerate(claim_texts):
                 claims.append(_make_claim(section_title, "Invocation_Lock", claim_text, idx))
             continue
-        fields = parse_fields(section_body)
-        for field_name, value in fields.items():
+        for field_name, value in section.fields.items():
             if _is_structural_or_null(value):
                 claim_texts = [value.strip()]
             else:
@@ -269,9 +381,26 @@ def extract_claims(summary_text: str, *, max_claims_per_field: int = 5) -> list[
     return claims
 
 
-def anchor_claim(claim: EvidenceClaim, thread: NormalizedThread) -> EvidenceClaim:
-    """Attach best-effort thread anchors to one extracted claim."""
+def anchor_claim(
+    claim: EvidenceClaim,
+    thread: NormalizedThread,
+    *,
+    index: EvidenceIndex | None = None,
+) -> EvidenceClaim:
+    """Attach best-effort thread anchors to one extracted claim.
+
+    Pass a prebuilt `EvidenceIndex` when anchoring many claims against the same
+    thread; otherwise one is built for this call.
+    """
+
+    return _anchor_claim(claim, index or EvidenceIndex.from_thread(thread), None)
+
 
+def _anchor_claim(
+    claim: EvidenceClaim,
+    evidence_index: EvidenceIndex,
+    best_match: tuple[float, TranscriptMessage | None] | None,
+) -> EvidenceClaim:
     explicit_refs = _extract_explicit_refs(claim.claim_text)
     classification = _classified_status_for_claim(claim)
     if classification is not None:
@@ -285,7 +414,7 @@ def anchor_claim(claim: EvidenceClaim, thread: NormalizedThread) -> EvidenceClai
             }
         )
     valid_ref_anchors: list[EvidenceAnchor] = []
-    message_by_id = {message.id: message for message in thread.messages}
+    message_by_id = evidence_index.message_by_id
 
     for ref in explicit_refs:
         message = message_by_id.get(ref)
@@ -316,12 +445,7 @@ def anchor_claim(claim: EvidenceClaim, thread: NormalizedThread) -> EvidenceClai
             }
         )
 
-    scored = sorted(
-        ((_lexical_support_score(claim.claim_text, message.content), message) for message in thread.messages),
-        key=lambda item: item[0],
-        reverse=True,
-    )
-    best_score, best_message = scored[0] if scored else (0.0, None)
+    best_score, best_message = best_match or evidence_index.best_match(claim.claim_text)
 
     if best_message is None or best_score < 0.18:
         return claim.model_copy(
@@ -352,10 +476,15 @@ def anchor_claim(claim: EvidenceClaim, thread: NormalizedThread) -> EvidenceClai
     )
 
 
-def validate_evidence_map(evidence_map: EvidenceMap, thread: NormalizedThread) -> EvidenceValidationReport:
+def validate_evidence_map(
+    evidence_map: EvidenceMap,
+    thread: NormalizedThread,
+    *,
+    index: EvidenceIndex | None = None,
+) -> EvidenceValidationReport:
     """Validate references inside an evidence map against a normalized thread."""
 
-    valid_message_ids = {message.id for message in thread.messages}
+    valid_message_ids = index.message_by_id if index is not None else {message.id for message in thread.messages}
     issues: list[str] = []
     missing_refs: list[str] = []
     unsupported_claim_ids: list[str] = []
@@ -424,6 +553,37 @@ def calculate_coverage(claims: list[EvidenceClaim]) -> EvidenceCoverage:
     )
 
 
+def _batch_best_matches(
+    claims: list[EvidenceClaim],
+    index: EvidenceIndex,
+    scoring: EvidenceScoring,
+) -> dict[int, tuple[float, TranscriptMessage | None]]:
+    """Score every lexically-anchored claim in one vectorized pass.
+
+    Returns an empty mapping for the lexical scorer, in which case claims are
+    scored one at a time through the index.
+    """
+
+    if scoring == EvidenceScoring.lexical:
+        return {}
+    from . import evidence_matrix
+
+    if not evidence_matrix.numpy_available() and scoring == EvidenceScoring.vector:
+        return {}
+    positions = [
+        position for position, claim in enumerate(claims) if _classified_status_for_claim(claim) is None
+    ]
+    matches = evidence_matrix.best_matches(
+        index,
+        [claims[position].claim_text for position in positions],
+        scoring=scoring,
+    )
+    return {
+        position: (score, index.messages[message_position] if message_position is not None else None)
+        for position, (score, message_position) in zip(positions, matches)
+    }
+
+
 def _classified_status_for_claim(claim: EvidenceClaim) -> tuple[EvidenceStatus, EvidenceConfidence, str] | None:
     """Classify claims that do not require direct lexical anchoring.
 
@@ -0,0 +1,197 @@
+"""Vectorized claim x message scoring for USS evidence anchoring.
+
+`evidence.EvidenceIndex` scores one claim at a time in pure Python. For archive
+summaries anchored against very large threads this module scores every claim
+against every message in one batched NumPy pass over a sparse term matrix.
+
+Two modes are provided:
+
+- `vector` reproduces the lexical token-overlap score exactly, so the existing
+  0.18 / 0.34 support thresholds keep their calibration.
+- `bm25` weights terms by inverse document frequency and normalizes for message
+  length. Per-term saturation is capped at 1.0 and divided by the claim's total
+  term weight, so an average-length message containing every claim term once
+  scores 1.0 and the same thresholds remain meaningful.
+
+NumPy is an optional dependency (`pip install uss-engine[fast]`).
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from .evidence import EvidenceIndex, EvidenceScoring, _tokens
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+PHRASE_BONUS = 0.25
+MAX_BLOCK_CELLS = 4_000_000
+
+
+def numpy_available() -> bool:
+    """Return whether the vectorized scorer can run in this environment."""
+
+    return np is not None
+
+
+@dataclass(slots=True)
+class TermMatrix:
+    """Term-major sparse view of an `EvidenceIndex` (CSR over terms)."""
+
+    vocabulary: dict[str, int]
+    term_ptr: Any
+    posting_messages: Any
+    posting_counts: Any
+    message_lengths: Any
+    document_frequency: Any
+    message_count: int
+
+    @classmethod
+    def from_index(cls, index: EvidenceIndex) -> "TermMatrix":
+        _require_numpy()
+        vocabulary: dict[str, int] = {}
+        term_ptr = [0]
+        posting_messages: list[int] = []
+        posting_counts: list[int] = []
+        for term_id, (token, postings) in enumerate(index.postings.items()):
+            vocabulary[token] = term_id
+            for message_position, count in postings:
+                posting_messages.append(message_position)
+                posting_counts.append(count)
+            term_ptr.append(len(posting_messages))
+        ptr = np.asarray(term_ptr, dtype=np.int64)
+        return cls(
+            vocabulary=vocabulary,
+            term_ptr=ptr,
+            posting_messages=np.asarray(posting_messages, dtype=np.int64),
+            posting_counts=np.asarray(posting_counts, dtype=np.float64),
+            message_lengths=np.asarray(
+                [sum(counter.values()) for counter in index.message_counters],
+                dtype=np.float64,
+            ),
+            document_frequency=np.diff(ptr).astype(np.float64),
+            message_count=len(index.messages),
+        )
+
+
+def score_matrix(
+    index: EvidenceIndex,
+    claim_texts: list[str],
+    *,
+    scoring: EvidenceScoring | str = EvidenceScoring.vector,
+    matrix: TermMatrix | None = None,
+) -> Any:
+    """Return a dense claims x messages score array for the given claim texts."""
+
+    _require_numpy()
+    mode = EvidenceScoring(scoring)
+    if mode == EvidenceScoring.lexical:
+        raise ValueError("score_matrix only implements the vector and bm25 scorers")
+    terms = matrix or TermMatrix.from_index(index)
+    scores = np.zeros((len(claim_texts), terms.message_count), dtype=np.float64)
+    if not claim_texts or terms.message_count == 0:
+        return scores
+
+    claim_tokens = [_tokens(text) for text in claim_texts]
+    block = max(1, MAX_BLOCK_CELLS // terms.message_count)
+    for start in range(0, len(claim_texts), block):
+        stop = min(start + block, len(claim_texts))
+        scores[start:stop] = _score_block(terms, claim_tokens[start:stop], mode)
+
+    for row, tokens in enumerate(claim_tokens):
+        if not tokens:
+            continue
+        for position in index.phrase_hits(" ".join(tokens)):
+            scores[row, position] = min(1.0, scores[row, position] + PHRASE_BONUS)
+    return scores
+
+
+def best_matches(
+    index: EvidenceIndex,
+    claim_texts: list[str],
+    *,
+    scoring: EvidenceScoring | str = EvidenceScoring.vector,
+) -> list[tuple[float, int | None]]:
+    """Return `(best_score, message_position)` per claim, earliest message on ties."""
+
+    if not index.messages:
+        return [(0.0, None) for _ in claim_texts]
+    scores = score_matrix(index, claim_texts, scoring=scoring)
+    if not claim_texts:
+        return []
+    positions = scores.argmax(axis=1)
+    return [(float(scores[row, position]), int(position)) for row, position in enumerate(positions)]
+
+
+def _score_block(terms: TermMatrix, claim_tokens: list[list[str]], mode: EvidenceScoring) -> Any:
+    message_count = terms.message_count
+    block_scores = np.zeros(len(claim_tokens) * message_count, dtype=np.float64)
+
+    entry_rows: list[int] = []
+    entry_terms: list[int] = []
+    entry_counts: list[int] = []
+    denominators = np.zeros(len(claim_tokens), dtype=np.float64)
+    idf = _idf(terms) if mode == EvidenceScoring.bm25 else None
+    unseen_idf = math.log(1.0 + (message_count + 0.5) / 0.5)
+    for row, tokens in enumerate(claim_tokens):
+        for token, count in Counter(tokens).items():
+            term_id = terms.vocabulary.get(token)
+            if mode == EvidenceScoring.bm25:
+                weight = float(idf[term_id]) if term_id is not None else unseen_idf
+                denominators[row] += count * weight
+            else:
+                denominators[row] += count
+            if term_id is not None:
+                entry_rows.append(row)
+                entry_terms.append(term_id)
+                entry_counts.append(count)
+
+    if entry_rows:
+        rows = np.asarray(entry_rows, dtype=np.int64)
+        term_ids = np.asarray(entry_terms, dtype=np.int64)
+        counts = np.asarray(entry_counts, dtype=np.float64)
+        starts = terms.term_ptr[term_ids]
+        lengths = terms.term_ptr[term_ids + 1] - starts
+        owner = np.repeat(np.arange(len(rows)), lengths)
+        first = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        postings = starts[owner] + (np.arange(int(lengths.sum())) - first)
+        message_positions = terms.posting_messages[postings]
+        message_counts = terms.posting_counts[postings]
+
+        if mode == EvidenceScoring.bm25:
+            average_length = max(float(terms.message_lengths.mean()), 1.0)
+            norm = 1.0 - BM25_B + BM25_B * terms.message_lengths[message_positions] / average_length
+            saturation = message_counts * (BM25_K1 + 1.0) / (message_counts + BM25_K1 * norm)
+            # A claim term counts as covered at most once, as in the lexical
+            # `min(count, message_count)`: repeating it in a message adds no
+            # support. What BM25 keeps is the idf weighting and the length
+            # penalty: a term that occurs once in a longer-than-average message
+            # stays below 1.0.
+            values = counts[owner] * idf[term_ids[owner]] * np.minimum(saturation, 1.0)
+        else:
+            values = np.minimum(counts[owner], message_counts)
+
+        cells = rows[owner] * message_count + message_positions
+        block_scores += np.bincount(cells, weights=values, minlength=block_scores.size)
+
+    block_scores = block_scores.reshape(len(claim_tokens), message_count)
+    safe = np.where(denominators > 0, denominators, 1.0)
+    return np.minimum(block_scores / safe[:, None], 1.0)
+
+
+def _idf(terms: TermMatrix) -> Any:
+    df = terms.document_frequency
+    return np.log(1.0 + (terms.message_count - df + 0.5) / (df + 0.5))
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("Vectorized evidence scoring requires numpy; install uss-engine[fast].")
@@ -7,17 +7,19 @@ Ollama, or internal gateway clients by implementing `LLMClient`.
 
 from __future__ import annotations
 
+import time
+from contextlib import closing
 from dataclasses import dataclass
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
-from .clients.base import LLMClient, StaticLLMClient
+from .clients.base import ChatMessage, LLMClient, StaticLLMClient, supports_streaming
 from .prompt_compiler import RuntimePrompt, compile_repair_prompt, compile_runtime_prompt, load_protocol
 from .redactor import RedactionConfig, RedactionReport, redact_thread
 from .schema import InvocationMode, ValidationReport
 from .transcript import NormalizedThread, load_thread
-from .validator import validate_text
+from .validator import IncrementalValidator, validate_text
 
 
 class GenerationAttempt(BaseModel):
@@ -25,6 +27,20 @@ class GenerationAttempt(BaseModel):
     prompt_metadata: dict = Field(default_factory=dict)
     output: str
     validation_report: ValidationReport
+    streamed: bool = False
+    aborted: bool = False
+    abort_report: ValidationReport | None = None
+    time_to_first_token_ms: int | None = None
+    duration_ms: int | None = None
+
+
+class GenerationAttempts(BaseModel):
+    """Outcome of the attempt loop for one compiled prompt."""
+
+    valid: bool
+    attempts: list[GenerationAttempt]
+    final_output: str
+    final_report: ValidationReport
 
 
 class GenerationResult(BaseModel):
@@ -42,6 +58,7 @@ class GenerationConfig:
     max_attempts: int = 2
     max_transcript_chars: int | None = None
     redaction: RedactionConfig | None = None
+    stream: bool = True
 
     def __post_init__(self) -> None:
         if self.max_attempts < 1:
@@ -65,6 +82,13 @@ def generate_summary(
     4. Generate candidate output.
     5. Validate candidate output.
     6. Retry with repair prompt when invalid.
+
+    Clients implementing `StreamingLLMClient` are streamed (unless disabled in
+    `GenerationConfig`), which records time-to-first-token per attempt. Streamed
+    output is checked incrementally; a fatal structural error (missing front
+    matter, wrong mode, required sections out of order) cancels the request and
+    moves straight to the repair prompt. The last attempt is never cancelled, so
+    the final output is always a complete candidate.
     """
 
     cfg = config or GenerationConfig()
@@ -78,44 +102,125 @@ def generate_summary(
         redaction_report=redaction_result.report,
     )
 
+    loop = run_generation_attempts(
+        runtime_prompt=runtime_prompt,
+        protocol_version=str(protocol.get("version", "1.3")),
+        client=client,
+        config=cfg,
+    )
+
+    return GenerationResult(
+        valid=loop.valid,
+        mode=resolved_mode,
+        attempts=loop.attempts,
+        final_output=loop.final_output,
+        final_report=loop.final_report,
+        redaction_report=redaction_result.report,
+        redacted_thread=redaction_result.thread,
+    )
+
+
+def run_generation_attempts(
+    *,
+    runtime_prompt: RuntimePrompt,
+    protocol_version: str,
+    client: LLMClient,
+    config: GenerationConfig | None = None,
+) -> GenerationAttempts:
+    """Run the generate -> validate -> repair loop for an already compiled prompt.
+
+    This is the provider-calling part of `generate_summary`, exposed separately so
+    the incremental pipeline can cache redaction and prompt compilation on their
+    own.
+    """
+
+    cfg = config or GenerationConfig()
+    resolved_mode = InvocationMode(runtime_prompt.mode)
     attempts: list[GenerationAttempt] = []
     active_prompt = runtime_prompt
     output = ""
     report = ValidationReport.from_issues(
         issues=[],
         mode=resolved_mode,
-        protocol_version=str(protocol.get("version", "1.3")),
+        protocol_version=protocol_version,
     )
 
     for attempt_number in range(1, cfg.max_attempts + 1):
-        output = client.complete(active_prompt.as_messages()).strip()
-        report = validate_text(output)
+        # With no repair left to move on to, the last attempt runs to completion.
+        last_attempt = attempt_number == cfg.max_attempts
+        completion = _run_completion(
+            client,
+            active_prompt.as_messages(),
+            stream=cfg.stream,
+            monitor=None if last_attempt else IncrementalValidator(resolved_mode),
+        )
+        output = completion.output.strip()
+        report = validate_text(output, mode=resolved_mode)
         attempts.append(
             GenerationAttempt(
                 attempt_number=attempt_number,
                 prompt_metadata=active_prompt.metadata,
                 output=output,
                 validation_report=report,
+                streamed=completion.streamed,
+                aborted=completion.abort_report is not None,
+                abort_report=completion.abort_report,
+                time_to_first_token_ms=completion.time_to_first_token_ms,
+                duration_ms=completion.duration_ms,
             )
         )
         if report.valid:
             break
         if attempt_number < cfg.max_attempts:
+            # The fatal issue that stopped a stream is what the repair must fix;
+            # the truncated output is otherwise mostly missing sections.
             active_prompt = compile_repair_prompt(
                 previous_output=output,
-                validation_report=report,
+                validation_report=completion.abort_report or report,
                 runtime_prompt=runtime_prompt,
             )
 
-    return GenerationResult(
-        valid=report.valid,
-        mode=resolved_mode,
-        attempts=attempts,
-        final_output=output,
-        final_report=report,
-        redaction_report=redaction_result.report,
-        redacted_thread=redaction_result.thread,
-    )
+    return GenerationAttempts(valid=report.valid, attempts=attempts, final_output=output, final_report=report)
+
+
+@dataclass(slots=True)
+class _Completion:
+    output: str
+    streamed: bool
+    time_to_first_token_ms: int | None
+    duration_ms: int
+    abort_report: ValidationReport | None = None
+
+
+def _run_completion(
+    client: LLMClient,
+    messages: list[ChatMessage],
+    *,
+    stream: bool,
+    monitor: IncrementalValidator | None,
+) -> _Completion:
+    started = time.perf_counter()
+    if not (stream and supports_streaming(client)):
+        output = client.complete(messages)
+        return _Completion(output, False, None, _elapsed_ms(started))
+
+    chunks: list[str] = []
+    first_token_ms: int | None = None
+    abort_report: ValidationReport | None = None
+    with closing(client.stream(messages)) as deltas:
+        for chunk in deltas:
+            if first_token_ms is None and chunk:
+                first_token_ms = _elapsed_ms(started)
+            chunks.append(chunk)
+            if monitor is not None and monitor.feed(chunk):
+                # Leaving the loop closes the stream, which cancels the request.
+                abort_report = monitor.report()
+                break
+    return _Completion("".join(chunks), True, first_token_ms, _elapsed_ms(started), abort_report)
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.perf_counter() - started) * 1000)
 
 
 def generate_summary_from_files(
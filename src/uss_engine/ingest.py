@@ -0,0 +1,262 @@
+"""Bulk ingestion of multi-conversation chat exports.
+
+ChatGPT and Claude data exports ship every conversation in one
+`conversations.json` whose root is a JSON array. `ingest_export` decodes that
+array one conversation at a time, normalizes each in a process pool into its own
+saved thread file under `threads/`, and writes `index.json` listing every
+conversation's thread id, title, message count and char count.
+
+At most `workers` conversations are in flight, so memory stays bounded by one
+conversation per worker however large the export is. ChatGPT conversations are
+linearized along the branch ending at `current_node`, which is the branch the
+user last saw; edited-away branches are dropped.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from .transcript import iter_json_array, normalize_transcript_json, save_thread
+
+INDEX_NAME = "index.json"
+THREADS_DIR_NAME = "threads"
+INGESTED_STATUS = "ingested"
+EMPTY_STATUS = "empty"
+ERROR_STATUS = "error"
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+class IngestEntry(BaseModel):
+    """One conversation of an export, as listed in the ingest index."""
+
+    position: int
+    status: str
+    thread_id: str | None = None
+    title: str | None = None
+    path: str | None = None
+    message_count: int = 0
+    char_count: int = 0
+    error: str | None = None
+
+
+class IngestResult(BaseModel):
+    """Summary returned by `ingest_export`."""
+
+    source: str
+    index_path: str
+    threads_dir: str
+    duration_ms: int = 0
+    entries: list[IngestEntry] = Field(default_factory=list)
+
+    @property
+    def ingested_count(self) -> int:
+        return sum(1 for entry in self.entries if entry.status == INGESTED_STATUS)
+
+    @property
+    def empty_count(self) -> int:
+        return sum(1 for entry in self.entries if entry.status == EMPTY_STATUS)
+
+    @property
+    def failed_count(self) -> int:
+        return sum(1 for entry in self.entries if entry.status == ERROR_STATUS)
+
+
+@dataclass(slots=True)
+class IngestConfig:
+    """Process-pool settings for an export ingest."""
+
+    workers: int | None = None
+    index_name: str = INDEX_NAME
+
+    def __post_init__(self) -> None:
+        if self.workers is not None and self.workers < 1:
+            raise ValueError("workers must be at least 1")
+
+
+def ingest_export(
+    *,
+    source: str | Path,
+    output_dir: str | Path,
+    config: IngestConfig | None = None,
+) -> IngestResult:
+    """Normalize every conversation in a `conversations.json` export into its own thread file."""
+
+    cfg = config or IngestConfig()
+    started = time.perf_counter()
+    output_root = Path(output_dir)
+    threads_dir = output_root / THREADS_DIR_NAME
+    threads_dir.mkdir(parents=True, exist_ok=True)
+
+    conversations = enumerate(iter_json_array(source))
+    workers = cfg.workers or os.cpu_count() or 1
+    entries: list[IngestEntry] = []
+    if workers == 1:
+        entries.extend(_ingest_one(position, item, str(threads_dir)) for position, item in conversations)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: set[Future[IngestEntry]] = set()
+            for position, item in conversations:
+                if len(pending) >= workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    entries.extend(future.result() for future in done)
+                pending.add(pool.submit(_ingest_one, position, item, str(threads_dir)))
+                # Drop the decoded conversation before decoding the next one.
+                del item
+            entries.extend(future.result() for future in wait(pending).done)
+    entries.sort(key=lambda entry: entry.position)
+
+    result = IngestResult(
+        source=str(source),
+        index_path=str(output_root / cfg.index_name),
+        threads_dir=str(threads_dir),
+        duration_ms=int((time.perf_counter() - started) * 1000),
+        entries=entries,
+    )
+    index = {
+        "source": result.source,
+        "threads_dir": result.threads_dir,
+        "thread_count": result.ingested_count,
+        "threads": [entry.model_dump(mode="json") for entry in entries],
+    }
+    tmp_path = output_root / f"{cfg.index_name}.tmp"
+    tmp_path.write_text(json.dumps(index, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    tmp_path.replace(output_root / cfg.index_name)
+    return result
+
+
+def conversation_payload(conversation: Any) -> dict[str, Any]:
+    """Map one export conversation onto the JSON shape `normalize_transcript_json` reads.
+
+    ChatGPT (`mapping` tree) and Claude (`chat_messages` list) conversations are
+    converted; any other object is passed through unchanged.
+    """
+
+    if not isinstance(conversation, dict):
+        raise ValueError("conversation must be a JSON object")
+    if isinstance(conversation.get("mapping"), dict):
+        return _chatgpt_payload(conversation)
+    if isinstance(conversation.get("chat_messages"), list):
+        return _claude_payload(conversation)
+    return conversation
+
+
+def _ingest_one(position: int, conversation: Any, threads_dir: str) -> IngestEntry:
+    try:
+        payload = conversation_payload(conversation)
+        title = payload.get("title")
+        if not any(payload.get(key) for key in ("messages", "conversation", "items")):
+            return IngestEntry(position=position, status=EMPTY_STATUS, thread_id=_thread_id(payload), title=title)
+        thread = normalize_transcript_json(payload)
+        path = Path(threads_dir) / f"{position:05d}-{_safe_name(thread.thread_id)}.json"
+        save_thread(thread, path)
+    except Exception as exc:  # noqa: BLE001 - one malformed conversation must not stop the ingest
+        return IngestEntry(position=position, status=ERROR_STATUS, error=f"{type(exc).__name__}: {exc}")
+    return IngestEntry(
+        position=position,
+        status=INGESTED_STATUS,
+        thread_id=thread.thread_id,
+        title=title if isinstance(title, str) else None,
+        path=str(path),
+        message_count=len(thread.messages),
+        char_count=thread.char_count,
+    )
+
+
+def _chatgpt_payload(conversation: dict[str, Any]) -> dict[str, Any]:
+    mapping: dict[str, Any] = conversation["mapping"]
+    node_id = conversation.get("current_node")
+    if node_id not in mapping:
+        # Without a current node, follow the newest child from the root.
+        node_id = next((key for key, node in mapping.items() if not node.get("parent")), None)
+        while node_id in mapping and mapping[node_id].get("children"):
+            node_id = mapping[node_id]["children"][-1]
+    branch: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    while node_id in mapping and node_id not in seen:
+        seen.add(node_id)
+        branch.append(mapping[node_id])
+        node_id = mapping[node_id].get("parent")
+
+    messages: list[dict[str, Any]] = []
+    for node in reversed(branch):
+        message = node.get("message")
+        if not isinstance(message, dict) or (message.get("metadata") or {}).get("is_visually_hidden_from_conversation"):
+            continue
+        content = message.get("content") or {}
+        parts = [part for part in content.get("parts") or [] if isinstance(part, str) and part.strip()]
+        text = "\n".join(parts) if parts else content.get("text")
+        if not isinstance(text, str) or not text.strip():
+            continue
+        messages.append(
+            {
+                "id": message.get("id") or node.get("id"),
+                "role": (message.get("author") or {}).get("role") or "unknown",
+                "content": text,
+                "timestamp": _epoch_to_iso(message.get("create_time")),
+                "content_type": content.get("content_type"),
+            }
+        )
+    return {
+        "thread_id": conversation.get("conversation_id") or conversation.get("id"),
+        "source": "chatgpt_export",
+        "created_at": _epoch_to_iso(conversation.get("create_time")),
+        "title": conversation.get("title"),
+        "messages": messages,
+    }
+
+
+def _claude_payload(conversation: dict[str, Any]) -> dict[str, Any]:
+    messages: list[dict[str, Any]] = []
+    for message in conversation["chat_messages"]:
+        if not isinstance(message, dict):
+            continue
+        blocks = message.get("content")
+        texts = [
+            block["text"]
+            for block in blocks or []
+            if isinstance(block, dict) and block.get("type") == "text" and isinstance(block.get("text"), str)
+        ]
+        text = "\n".join(texts) if texts else message.get("text")
+        if not isinstance(text, str) or not text.strip():
+            continue
+        messages.append(
+            {
+                "id": message.get("uuid"),
+                "role": message.get("sender") or "unknown",
+                "content": text,
+                "timestamp": message.get("created_at"),
+            }
+        )
+    return {
+        "thread_id": conversation.get("uuid"),
+        "source": "claude_export",
+        "created_at": conversation.get("created_at"),
+        "title": conversation.get("name"),
+        "messages": messages,
+    }
+
+
+def _epoch_to_iso(value: Any) -> str | None:
+    if not isinstance(value, int | float):
+        return None
+    moment = datetime.fromtimestamp(value, tz=timezone.utc).replace(microsecond=0)
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def _thread_id(payload: dict[str, Any]) -> str | None:
+    value = payload.get("thread_id") or payload.get("id")
+    return str(value) if value else None
+
+
+def _safe_name(thread_id: str) -> str:
+    return _UNSAFE_NAME_RE.sub("_", thread_id).strip("._")[:80] or "thread"
@@ -8,11 +8,18 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from .evidence import EvidenceMap, EvidenceValidationReport, build_evidence_map, validate_evidence_map
+from .evidence import (
+    EvidenceIndex,
+    EvidenceMap,
+    EvidenceValidationReport,
+    build_evidence_map,
+    validate_evidence_map,
+)
 from .scoring import ArtifactScore, score_artifact
 from .schema import ValidationReport
+from .thread_cache import ThreadCache
 from .transcript import NormalizedThread, load_thread
-from .validator import validate_text
+from .validator import ParsedArtifact, as_parsed_artifact, parse_artifact, validate_text
 
 
 class ArtifactInspection(BaseModel):
@@ -34,26 +41,56 @@ class ArtifactInspection(BaseModel):
 
 def inspect_text(
     *,
-    summary_text: str,
+    summary_text: str | ParsedArtifact,
     thread: NormalizedThread | None = None,
     artifact_path: str | None = None,
     thread_path: str | None = None,
 ) -> ArtifactInspection:
-    """Inspect an artifact string, optionally with its source thread."""
+    """Inspect an artifact string, optionally with its source thread.
 
-    validation_report = validate_text(summary_text)
-    validation_report.artifact_path = artifact_path
+    The artifact is parsed once and shared by validation and evidence mapping.
+    """
+
+    parsed = as_parsed_artifact(summary_text)
+    validation_report = validate_text(parsed)
 
     evidence_map: EvidenceMap | None = None
     evidence_validation: EvidenceValidationReport | None = None
     if thread is not None:
+        index = EvidenceIndex.from_thread(thread)
         evidence_map = build_evidence_map(
-            summary_text=summary_text,
+            summary_text=parsed,
             thread=thread,
             artifact_id=artifact_path,
+            index=index,
         )
-        evidence_validation = validate_evidence_map(evidence_map, thread)
+        evidence_validation = validate_evidence_map(evidence_map, thread, index=index)
+
+    return inspect_precomputed(
+        validation_report=validation_report,
+        evidence_map=evidence_map,
+        evidence_validation=evidence_validation,
+        artifact_path=artifact_path,
+        thread_path=thread_path,
+    )
+
+
+def inspect_precomputed(
+    *,
+    validation_report: ValidationReport,
+    evidence_map: EvidenceMap | None = None,
+    evidence_validation: EvidenceValidationReport | None = None,
+    artifact_path: str | None = None,
+    thread_path: str | None = None,
+) -> ArtifactInspection:
+    """Assemble an inspection from reports the caller has already computed.
+
+    Use this when validation and evidence mapping already ran for the artifact,
+    as in `run_uss_pipeline`, to avoid repeating that work. The validation report
+    is copied with `artifact_path` set; the caller's report is not modified.
+    """
 
+    validation_report = validation_report.model_copy(update={"artifact_path": artifact_path})
     score = score_artifact(
         validation_report=validation_report,
         evidence_map=evidence_map,
@@ -99,14 +136,15 @@ def inspect_files(
     *,
     summary_path: str | Path,
     thread_path: str | Path | None = None,
+    thread_cache: ThreadCache | None = None,
 ) -> ArtifactInspection:
     """Inspect a USS artifact file, optionally with the source thread file."""
 
     summary_file = Path(summary_path)
-    summary_text = summary_file.read_text(encoding="utf-8")
-    thread = load_thread(thread_path) if thread_path is not None else None
+    summary = parse_artifact(summary_file.read_text(encoding="utf-8"))
+    thread = load_thread(thread_path, cache=thread_cache) if thread_path is not None else None
     return inspect_text(
-        summary_text=summary_text,
+        summary_text=summary,
         thread=thread,
         artifact_path=str(summary_file),
         thread_path=str(thread_path) if thread_path is not None else None,
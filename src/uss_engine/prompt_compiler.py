@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
-from .redactor import RedactionReport
+from .compact_thread import CompactThread
+from .redactor import DEFAULT_REPORT_SAMPLE_HITS, RedactionReport, RedactionReportMode
 from .schema import InvocationMode, ValidationReport
-from .transcript import NormalizedThread
+from .transcript import NormalizedThread, StreamingThread, TranscriptMessage, TranscriptRole, render_prompt_block
 
 
 class RuntimePrompt(BaseModel):
@@ -46,12 +49,18 @@ def load_protocol(path: str | Path) -> dict[str, Any]:
 def compile_runtime_prompt(
     *,
     protocol: dict[str, Any],
-    thread: NormalizedThread,
+    thread: NormalizedThread | CompactThread | StreamingThread,
     mode: InvocationMode | str,
     max_transcript_chars: int | None = None,
     redaction_report: RedactionReport | None = None,
+    redaction_report_mode: RedactionReportMode | str = RedactionReportMode.compact,
 ) -> RuntimePrompt:
-    """Compile USS v1.3 protocol + normalized thread into LLM runtime prompts."""
+    """Compile USS v1.3 protocol + normalized thread into LLM runtime prompts.
+
+    The redaction report is embedded in compact form (counts plus a small hit
+    sample) unless `redaction_report_mode` is `full`. A `StreamingThread` is read
+    in one pass: its messages are counted while the transcript block is rendered.
+    """
 
     resolved_mode = InvocationMode(mode)
     protocol_name = str(protocol.get("protocol", "Universal Seed Summary Invoker"))
@@ -64,12 +73,30 @@ def compile_runtime_prompt(
     checklist = protocol.get("validation_checklist", {})
 
     required_section_titles = _extract_required_section_titles(sections, resolved_mode)
-    transcript_block = thread.to_prompt_block(max_chars=max_transcript_chars)
-    redaction_payload = (
-        redaction_report.model_dump(mode="json")
-        if redaction_report is not None
-        else {"redacted": False, "hit_count": 0, "hits": [], "categories": {}}
-    )
+    if isinstance(thread, StreamingThread):
+        tally = _MessageTally()
+        messages = tally.count(thread)
+        transcript_block = render_prompt_block(messages, max_chars=max_transcript_chars)
+        # Count the messages past the budget too; this also merges trailing thread fields.
+        for _ in messages:
+            pass
+        message_count, exchange_pair_count, char_count = (
+            tally.message_count,
+            tally.exchange_pair_count,
+            tally.char_count,
+        )
+    else:
+        transcript_block = thread.to_prompt_block(max_chars=max_transcript_chars)
+        message_count, exchange_pair_count, char_count = (
+            len(thread.messages),
+            thread.exchange_pair_count,
+            thread.char_count,
+        )
+    if redaction_report is None:
+        redaction_report = RedactionReport(redacted=False)
+    if RedactionReportMode(redaction_report_mode) == RedactionReportMode.compact:
+        redaction_report = redaction_report.compact(DEFAULT_REPORT_SAMPLE_HITS)
+    redaction_payload = redaction_report.model_dump(mode="json")
 
     system_prompt = f"""You are executing {protocol_name} v{protocol_version} as a strict runtime protocol.
 
@@ -112,9 +139,9 @@ USS Engine v0.4 can inspect deterministic evidence anchors after generation. Whe
 - thread_id: {thread.thread_id}
 - source: {thread.source}
 - created_at: {thread.created_at}
-- message_count: {len(thread.messages)}
-- exchange_pair_count: {thread.exchange_pair_count}
-- char_count: {thread.char_count}
+- message_count: {message_count}
+- exchange_pair_count: {exchange_pair_count}
+- char_count: {char_count}
 
 # Redaction Report
 {json.dumps(redaction_payload, indent=2, ensure_ascii=False)}
@@ -133,8 +160,8 @@ Generate one valid USS Markdown artifact for invocation mode `{resolved_mode.val
         user_prompt=user_prompt,
         metadata={
             "thread_id": thread.thread_id,
-            "message_count": len(thread.messages),
-            "exchange_pair_count": thread.exchange_pair_count,
+            "message_count": message_count,
+            "exchange_pair_count": exchange_pair_count,
             "required_sections": required_section_titles,
             "redaction_hit_count": int(redaction_payload.get("hit_count", 0)),
         },
@@ -189,3 +216,27 @@ def _extract_required_section_titles(sections: Any, mode: InvocationMode) -> lis
             if title:
                 titles.append(str(title))
     return titles
+
+
+@dataclass(slots=True)
+class _MessageTally:
+    """Running counts of the messages a stream has yielded so far."""
+
+    message_count: int = 0
+    user_count: int = 0
+    assistant_count: int = 0
+    char_count: int = 0
+
+    @property
+    def exchange_pair_count(self) -> int:
+        return min(self.user_count, self.assistant_count)
+
+    def count(self, messages: Iterable[TranscriptMessage]) -> Iterator[TranscriptMessage]:
+        for message in messages:
+            self.message_count += 1
+            self.char_count += len(message.content)
+            if message.role == TranscriptRole.user:
+                self.user_count += 1
+            elif message.role == TranscriptRole.assistant:
+                self.assistant_count += 1
+            yield message
@@ -7,16 +7,58 @@ not get sent to LLM providers or preserved in generated summaries.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
+import signal
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import StrEnum
-from typing import Pattern
+from itertools import repeat
+from pathlib import Path
+from re import _constants as sre_constants
+from re import _parser as sre_parse
+from typing import Any, NamedTuple, Pattern, TypeVar
 
-from pydantic import BaseModel, Field
+import yaml
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
+from .compact_thread import CompactThread
+from .diskcache import DiskCache
 from .transcript import NormalizedThread, TranscriptMessage
 
 
+# Below this much message content, process start-up and pickling cost more than
+# a parallel scan saves.
+DEFAULT_PARALLEL_MIN_CHARS = 4_000_000
+_SHARDS_PER_WORKER = 4
+# Streaming redaction holds back this many trailing characters of each chunk, so
+# any match (and any lookaround) up to this length is found across boundaries.
+DEFAULT_STREAM_OVERLAP = 8192
+# How far past a rule's `opener` streaming redaction waits for the match to close
+# before giving up and emitting the text as is.
+DEFAULT_STREAM_HOLD = 1 << 20
+DEFAULT_STREAM_CHUNK_CHARS = 1 << 20
+# Redaction cache bounds: total cached characters held in memory, and the size
+# below which a message is cheaper to rescan than to hash and look up.
+DEFAULT_CACHE_MAX_CHARS = 64 * 1024 * 1024
+DEFAULT_CACHE_MIN_CHARS = 256
+_DISK_EVICT_INTERVAL = 512
+# Hits kept in a compact report; counts always cover every hit.
+DEFAULT_REPORT_SAMPLE_HITS = 20
+# Wall-clock budget for redacting one message while custom rules are active.
+DEFAULT_RULE_TIMEOUT_SECONDS = 2.0
+
+_T = TypeVar("_T")
+
+
 class RedactionCategory(StrEnum):
     email = "email"
     phone = "phone"
@@ -28,6 +70,12 @@ class RedactionCategory(StrEnum):
     url_credentials = "url_credentials"
     private_key_block = "private_key_block"
     generic_secret_assignment = "generic_secret_assignment"
+    custom = "custom"
+
+
+class RedactionReportMode(StrEnum):
+    full = "full"
+    compact = "compact"
 
 
 class RedactionMode(StrEnum):
@@ -37,10 +85,25 @@ class RedactionMode(StrEnum):
 
 @dataclass(frozen=True, slots=True)
 class RedactionRule:
+    """One detector. Rules apply in descending `priority`, ties in rule-list
+    order, so where matches overlap the higher-priority rule redacts first.
+
+    `literals` lists strings of which at least one occurs in every match; a text
+    containing none of them skips the rule. When omitted they are derived from
+    the pattern, and an empty tuple means the rule always runs.
+
+    `opener` marks a rule whose matches can run longer than a stream's overlap
+    (a PEM block): every match starts with it and ends at a fixed terminator, so
+    `StreamingRedactor` holds output back from an opener until the match closes.
+    """
+
     category: RedactionCategory
     pattern: Pattern[str]
     replacement: str
     description: str
+    priority: int = 0
+    literals: tuple[str, ...] | None = None
+    opener: str | None = None
 
 
 class RedactionHit(BaseModel):
@@ -53,33 +116,160 @@ class RedactionHit(BaseModel):
     placeholder: str
 
 
+class MessageRedaction(NamedTuple):
+    """One redacted text: its hits and the count of every hit by category.
+
+    When redaction runs with `max_hits`, `hits` holds only the first few hits and
+    `categories` is the only complete record.
+    """
+
+    text: str
+    hits: list[RedactionHit]
+    categories: dict[str, int]
+
+    @property
+    def hit_count(self) -> int:
+        return sum(self.categories.values())
+
+
+class DisabledRule(BaseModel):
+    """A custom rule that was switched off instead of being allowed to stall redaction."""
+
+    category: RedactionCategory
+    description: str
+    pattern: str
+    reason: str
+
+
 class RedactionReport(BaseModel):
+    """Redaction outcome for a thread.
+
+    `categories` and `message_counts` (keyed by message ID) always cover every
+    hit. A compact report keeps only the first few hits and sets `hits_truncated`.
+    """
+
     redacted: bool
     hit_count: int = 0
     hits: list[RedactionHit] = Field(default_factory=list)
     categories: dict[str, int] = Field(default_factory=dict)
+    message_counts: dict[str, int] = Field(default_factory=dict)
+    hits_truncated: bool = False
+    disabled_rules: list[DisabledRule] = Field(default_factory=list)
 
     @classmethod
-    def from_hits(cls, hits: list[RedactionHit]) -> "RedactionReport":
+    def from_hits(
+        cls,
+        hits: Iterable[RedactionHit],
+        disabled_rules: list[DisabledRule] | None = None,
+        *,
+        max_hits: int | None = None,
+    ) -> "RedactionReport":
+        kept: list[RedactionHit] = []
         categories: dict[str, int] = {}
+        message_counts: dict[str, int] = {}
+        count = 0
         for hit in hits:
+            count += 1
             categories[hit.category.value] = categories.get(hit.category.value, 0) + 1
-        return cls(redacted=bool(hits), hit_count=len(hits), hits=hits, categories=categories)
+            message_counts[hit.message_id] = message_counts.get(hit.message_id, 0) + 1
+            if max_hits is None or len(kept) < max_hits:
+                kept.append(hit)
+        return cls(
+            redacted=bool(count),
+            hit_count=count,
+            hits=kept,
+            categories=categories,
+            message_counts=message_counts,
+            hits_truncated=len(kept) < count,
+            disabled_rules=disabled_rules or [],
+        )
+
+    @classmethod
+    def from_messages(
+        cls,
+        results: Iterable[tuple[str, MessageRedaction]],
+        disabled_rules: list[DisabledRule] | None = None,
+        *,
+        max_hits: int | None = None,
+    ) -> "RedactionReport":
+        """Build a report from `(message_id, result)` pairs without expanding their counts."""
+
+        kept: list[RedactionHit] = []
+        categories: dict[str, int] = {}
+        message_counts: dict[str, int] = {}
+        for message_id, result in results:
+            if not result.categories:
+                continue
+            for category, count in result.categories.items():
+                categories[category] = categories.get(category, 0) + count
+            message_counts[message_id] = message_counts.get(message_id, 0) + result.hit_count
+            room = len(result.hits) if max_hits is None else max_hits - len(kept)
+            kept.extend(result.hits[:room])
+        count = sum(categories.values())
+        return cls(
+            redacted=bool(count),
+            hit_count=count,
+            hits=kept,
+            categories=categories,
+            message_counts=message_counts,
+            hits_truncated=len(kept) < count,
+            disabled_rules=disabled_rules or [],
+        )
+
+    def compact(self, max_hits: int = DEFAULT_REPORT_SAMPLE_HITS) -> "RedactionReport":
+        """Return a copy that keeps at most `max_hits` hits."""
+
+        if len(self.hits) <= max_hits:
+            return self
+        return self.model_copy(update={"hits": self.hits[:max_hits], "hits_truncated": True})
 
 
 class RedactionResult(BaseModel):
-    thread: NormalizedThread
+    thread: NormalizedThread | CompactThread
     report: RedactionReport
 
 
 @dataclass(slots=True)
 class RedactionConfig:
+    """Redaction settings.
+
+    Threads whose total content is at least `parallel_min_chars` are split into
+    contiguous shards and redacted across `workers` processes (default: CPU
+    count); `workers=1` always redacts in-process. With a `cache`, each distinct
+    message body is redacted once per rule set.
+
+    Custom rules come from `custom_rules` and/or a YAML/JSON `custom_rules_path`
+    (see `load_custom_rules`). They are screened for catastrophic-backtracking
+    shapes before use. While any is active, a message that takes longer than
+    `rule_timeout_seconds` to redact has each custom rule timed on its own;
+    rules that cannot scan it within that budget are disabled and reported.
+
+    `report_mode=compact` keeps only `report_sample_hits` hits in the report,
+    which otherwise holds one entry per match. Each message then builds at most
+    that many hits and counts the rest by category.
+    """
+
     enabled: bool = True
     mode: RedactionMode = RedactionMode.placeholder
     redact_emails: bool = True
     redact_phone_numbers: bool = True
     redact_secret_assignments: bool = True
     custom_rules: list[RedactionRule] | None = None
+    custom_rules_path: str | Path | None = None
+    rule_timeout_seconds: float | None = DEFAULT_RULE_TIMEOUT_SECONDS
+    report_mode: RedactionReportMode = RedactionReportMode.full
+    report_sample_hits: int = DEFAULT_REPORT_SAMPLE_HITS
+    workers: int | None = None
+    parallel_min_chars: int = DEFAULT_PARALLEL_MIN_CHARS
+    cache: RedactionCache | None = None
+
+    def __post_init__(self) -> None:
+        if self.workers is not None and self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        if self.rule_timeout_seconds is not None and self.rule_timeout_seconds <= 0:
+            raise ValueError("rule_timeout_seconds must be positive")
+        if self.report_sample_hits < 0:
+            raise ValueError("report_sample_hits must not be negative")
 
 
 DEFAULT_RULES: list[RedactionRule] = [
@@ -91,54 +281,64 @@ DEFAULT_RULES: list[RedactionRule] = [
         ),
         replacement="[REDACTED_PRIVATE_KEY_BLOCK]",
         description="PEM private key block",
+        literals=("-----BEGIN ",),
+        opener="-----BEGIN ",
     ),
     RedactionRule(
         category=RedactionCategory.openai_api_key,
         pattern=re.compile(r"\bsk-(?:proj-)?[A-Za-z0-9_-]{20,}\b"),
         replacement="[REDACTED_OPENAI_API_KEY]",
         description="OpenAI-style API key",
+        literals=("sk-",),
     ),
     RedactionRule(
         category=RedactionCategory.anthropic_api_key,
         pattern=re.compile(r"\bsk-ant-[A-Za-z0-9_-]{20,}\b"),
         replacement="[REDACTED_ANTHROPIC_API_KEY]",
         description="Anthropic-style API key",
+        literals=("sk-ant-",),
     ),
     RedactionRule(
         category=RedactionCategory.github_token,
         pattern=re.compile(r"\b(?:ghp|gho|ghu|ghs|ghr)_[A-Za-z0-9_]{20,}\b"),
         replacement="[REDACTED_GITHUB_TOKEN]",
         description="GitHub token",
+        literals=("ghp_", "gho_", "ghu_", "ghs_", "ghr_"),
     ),
     RedactionRule(
         category=RedactionCategory.aws_access_key,
         pattern=re.compile(r"\b(?:AKIA|ASIA)[A-Z0-9]{16}\b"),
         replacement="[REDACTED_AWS_ACCESS_KEY]",
         description="AWS access key ID",
+        literals=("AKIA", "ASIA"),
     ),
     RedactionRule(
         category=RedactionCategory.bearer_token,
         pattern=re.compile(r"(?i)\bBearer\s+[A-Za-z0-9._~+/=-]{20,}"),
         replacement="Bearer [REDACTED_BEARER_TOKEN]",
         description="Bearer token",
+        literals=("bearer",),
     ),
     RedactionRule(
         category=RedactionCategory.url_credentials,
         pattern=re.compile(r"\b([a-z][a-z0-9+.-]*://)([^\s/@:]+):([^\s/@]+)@", re.IGNORECASE),
         replacement=r"\1[REDACTED_USER]:[REDACTED_PASSWORD]@",
         description="URL embedded username/password",
+        literals=("://",),
     ),
     RedactionRule(
         category=RedactionCategory.email,
         pattern=re.compile(r"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE),
         replacement="[REDACTED_EMAIL]",
         description="Email address",
+        literals=("@",),
     ),
     RedactionRule(
         category=RedactionCategory.phone,
         pattern=re.compile(r"(?<!\w)(?:\+?1[\s.-]?)?(?:\(?\d{3}\)?[\s.-]?)\d{3}[\s.-]?\d{4}(?!\w)"),
         replacement="[REDACTED_PHONE]",
         description="US phone number",
+        # No explicit literals: the derived prefilter is "contains a digit".
     ),
     RedactionRule(
         category=RedactionCategory.generic_secret_assignment,
@@ -147,56 +347,431 @@ DEFAULT_RULES: list[RedactionRule] = [
         ),
         replacement=r"\1=[REDACTED_SECRET]",
         description="Generic secret assignment",
+        literals=("api", "secret", "passw", "token"),
     ),
 ]
 
+# Built-in rules are reviewed here and exempt from the ReDoS screen and time budget.
+_TRUSTED_RULES = frozenset(DEFAULT_RULES)
+# Custom rules disabled at runtime in this process, with the reason.
+_RUNTIME_DISABLED: dict[RedactionRule, str] = {}
+
 
-def redact_thread(thread: NormalizedThread, config: RedactionConfig | None = None) -> RedactionResult:
-    """Return a redacted copy of a normalized thread plus a redaction report."""
+def redact_thread(thread: NormalizedThread | CompactThread, config: RedactionConfig | None = None) -> RedactionResult:
+    """Return a redacted copy of a normalized thread plus a redaction report.
+
+    Messages are updated copy-on-write: each copy shares every field except its
+    new content and metadata with the input message. A `CompactThread` comes
+    back as a `CompactThread` with only its content column replaced.
+    """
 
     cfg = config or RedactionConfig()
     if not cfg.enabled:
         return RedactionResult(thread=thread, report=RedactionReport.from_hits([]))
 
-    rules = _select_rules(cfg)
-    all_hits: list[RedactionHit] = []
-    redacted_messages: list[TranscriptMessage] = []
-
-    for message in thread.messages:
-        redacted_content, hits = redact_text(
-            message.content,
-            message_id=message.id,
-            role=message.role.value,
-            source_index=message.source_index,
-            rules=rules,
-        )
-        all_hits.extend(hits)
-        redacted_messages.append(
-            message.model_copy(
-                update={
-                    "content": redacted_content,
-                    "metadata": {
-                        **message.metadata,
-                        "redacted": bool(hits),
-                        "redaction_hit_count": len(hits),
-                    },
-                },
-                deep=True,
-            )
+    rules, disabled = screen_rules(select_rules(cfg))
+    if isinstance(thread, CompactThread):
+        items = [(content, message_id, role.value, index) for message_id, role, content, _, index in thread.rows()]
+    else:
+        items = [(message.content, message.id, message.role.value, message.source_index) for message in thread.messages]
+    if cfg.cache is None:
+        results, disabled_at_runtime = _redact_items(cfg, rules, items)
+    else:
+        results, disabled_at_runtime = _redact_items_cached(cfg, rules, items, cfg.cache)
+    disabled.extend(disabled_at_runtime)
+
+    hit_count = sum(result.hit_count for result in results)
+    metadata = {**thread.metadata, "redaction_applied": bool(hit_count), "redaction_hit_count": hit_count}
+    redacted_thread: NormalizedThread | CompactThread
+    if isinstance(thread, CompactThread):
+        redacted_thread = thread.with_contents(
+            [result.text for result in results], hit_counts=[result.hit_count for result in results]
         )
+        redacted_thread.metadata = metadata
+    else:
+        redacted_messages = [_redacted_message(message, result) for message, result in zip(thread.messages, results)]
+        redacted_thread = thread.model_copy(update={"messages": redacted_messages, "metadata": metadata})
+    report = RedactionReport.from_messages(
+        ((item[1], result) for item, result in zip(items, results)), disabled, max_hits=_sample_hits(cfg)
+    )
+    return RedactionResult(thread=redacted_thread, report=report)
+
+
+def iter_redacted_messages(
+    messages: Iterable[TranscriptMessage], config: RedactionConfig | None = None
+) -> Iterator[tuple[TranscriptMessage, list[RedactionHit]]]:
+    """Redact messages one at a time as they arrive, e.g. from a `StreamingThread`.
+
+    Each message is redacted in-process with the same rules, time budget, and
+    cache as `redact_thread`; `workers` is ignored. In compact report mode only
+    the first `report_sample_hits` hits of each message are yielded. Rules
+    disabled along the way are reported by `screen_rules` afterwards.
+    """
+
+    cfg = config or RedactionConfig()
+    if not cfg.enabled:
+        for message in messages:
+            yield message, []
+        return
+    rules, _ = screen_rules(select_rules(cfg))
+    for message in messages:
+        item = (message.content, message.id, message.role.value, message.source_index)
+        if cfg.cache is None:
+            [result], _ = _redact_messages(rules, [item], cfg.rule_timeout_seconds, _sample_hits(cfg))
+        else:
+            [result], _ = _redact_items_cached(cfg, rules, [item], cfg.cache)
+        yield _redacted_message(message, result), result.hits
+
 
-    redacted_thread = thread.model_copy(
+def _redacted_message(message: TranscriptMessage, result: MessageRedaction) -> TranscriptMessage:
+    return message.model_copy(
         update={
-            "messages": redacted_messages,
+            "content": result.text,
             "metadata": {
-                **thread.metadata,
-                "redaction_applied": bool(all_hits),
-                "redaction_hit_count": len(all_hits),
+                **message.metadata,
+                "redacted": bool(result.hit_count),
+                "redaction_hit_count": result.hit_count,
             },
-        },
-        deep=True,
+        }
+    )
+
+
+def _sample_hits(config: RedactionConfig) -> int | None:
+    return config.report_sample_hits if config.report_mode == RedactionReportMode.compact else None
+
+
+_MessageItem = tuple[str, str, str, int | None]
+
+
+def _redact_items(
+    config: RedactionConfig, rules: tuple[RedactionRule, ...], items: list[_MessageItem]
+) -> tuple[list[MessageRedaction], list[DisabledRule]]:
+    workers = _parallel_workers(config, items)
+    timeout = config.rule_timeout_seconds
+    if workers > 1:
+        return _redact_parallel(rules, items, workers, timeout, _sample_hits(config))
+    return _redact_messages(rules, items, timeout, _sample_hits(config))
+
+
+def _redact_items_cached(
+    config: RedactionConfig,
+    rules: tuple[RedactionRule, ...],
+    items: list[_MessageItem],
+    cache: RedactionCache,
+) -> tuple[list[MessageRedaction], list[DisabledRule]]:
+    fingerprint = rules_fingerprint(rules)
+    max_hits = _sample_hits(config)
+    if max_hits is not None:
+        # A sampled result holds fewer hits than a full one for the same rules.
+        fingerprint = f"{fingerprint}:sample{max_hits}"
+    results: list[MessageRedaction | None] = [None] * len(items)
+    uncached: list[int] = []
+    # Misses are grouped by key so bodies repeated within the thread are also
+    # redacted only once.
+    pending: dict[str, list[int]] = {}
+    for index, item in enumerate(items):
+        key = cache.key(item[0], fingerprint)
+        if key is None:
+            uncached.append(index)
+            continue
+        entry = cache.get(key)
+        if entry is not None:
+            results[index] = entry.apply(item)
+        else:
+            pending.setdefault(key, []).append(index)
+
+    keys = list(pending)
+    redacted, disabled = _redact_items(
+        config, rules, [items[index] for index in uncached] + [items[pending[key][0]] for key in keys]
     )
-    return RedactionResult(thread=redacted_thread, report=RedactionReport.from_hits(all_hits))
+    for index, result in zip(uncached, redacted):
+        results[index] = result
+    for key, result in zip(keys, redacted[len(uncached) :]):
+        entry = CachedRedaction.from_result(result)
+        # Results produced after a rule was disabled do not reflect the full rule set.
+        if not disabled:
+            cache.put(key, entry)
+        for index in pending[key]:
+            results[index] = entry.apply(items[index])
+    return results, disabled  # type: ignore[return-value]
+
+
+def _redact_messages(
+    rules: tuple[RedactionRule, ...],
+    items: list[_MessageItem],
+    timeout: float | None = None,
+    max_hits: int | None = None,
+) -> tuple[list[MessageRedaction], list[DisabledRule]]:
+    if timeout is None or all(rule in _TRUSTED_RULES for rule in rules) or not _can_time_limit():
+        engine = compile_rules(rules)
+        results = [
+            engine.redact_counted(
+                content, message_id=message_id, role=role, source_index=source_index, max_hits=max_hits
+            )
+            for content, message_id, role, source_index in items
+        ]
+        return results, []
+
+    active = rules
+    disabled: list[DisabledRule] = []
+    results = []
+    for content, message_id, role, source_index in items:
+        result, active, newly_disabled = run_with_time_budget(
+            active,
+            content,
+            timeout,
+            lambda rules: compile_rules(rules).redact_counted(
+                content, message_id=message_id, role=role, source_index=source_index, max_hits=max_hits
+            ),
+        )
+        disabled.extend(newly_disabled)
+        results.append(result)
+    return results, disabled
+
+
+def run_with_time_budget(
+    rules: tuple[RedactionRule, ...],
+    text: str,
+    timeout: float | None,
+    scan: Callable[[tuple[RedactionRule, ...]], _T],
+) -> tuple[_T, tuple[RedactionRule, ...], list[DisabledRule]]:
+    """Run `scan(rules)` over `text`, disabling custom rules that blow the time budget.
+
+    Returns the scan result, the rules still active afterwards, and the rules
+    disabled along the way. Without a timeout, or with only built-in rules
+    active, `scan` runs unguarded.
+    """
+
+    disabled: list[DisabledRule] = []
+    active = tuple(rule for rule in rules if rule not in _RUNTIME_DISABLED)
+    while True:
+        if timeout is None or all(rule in _TRUSTED_RULES for rule in active) or not _can_time_limit():
+            return scan(active), active, disabled
+        try:
+            with _time_limit(timeout):
+                return scan(active), active, disabled
+        except _RuleTimeout:
+            slow = _disable_slow_rules(active, text, timeout)
+            disabled.extend(slow)
+            active = tuple(rule for rule in active if rule not in _RUNTIME_DISABLED)
+            if not slow:
+                # Every custom rule scans `text` within budget on its own, so the
+                # overrun comes from the text's size; finish the pass unguarded.
+                return scan(active), active, disabled
+
+
+def _disable_slow_rules(rules: tuple[RedactionRule, ...], text: str, timeout: float) -> list[DisabledRule]:
+    """Find and disable the custom rules that cannot scan `text` within `timeout`."""
+
+    custom = [rule for rule in rules if rule not in _TRUSTED_RULES]
+    offenders = []
+    for rule in custom:
+        try:
+            with _time_limit(timeout):
+                for _ in rule.pattern.finditer(text):
+                    pass
+        except _RuleTimeout:
+            offenders.append(rule)
+    reason = f"exceeded the {timeout:g}s per-message time budget"
+    disabled = []
+    for rule in offenders:
+        _RUNTIME_DISABLED[rule] = reason
+        disabled.append(_disabled(rule, reason))
+    return disabled
+
+
+def _parallel_workers(config: RedactionConfig, items: list[_MessageItem]) -> int:
+    workers = config.workers or os.cpu_count() or 1
+    if workers < 2 or len(items) < 2:
+        return 1
+    if sum(len(item[0]) for item in items) < config.parallel_min_chars:
+        return 1
+    return min(workers, len(items))
+
+
+def _redact_parallel(
+    rules: tuple[RedactionRule, ...],
+    items: list[_MessageItem],
+    workers: int,
+    timeout: float | None,
+    max_hits: int | None = None,
+) -> tuple[list[MessageRedaction], list[DisabledRule]]:
+    # Contiguous shards of roughly equal size: concatenating the results in
+    # shard order keeps messages and hits in source order.
+    shards = _contiguous_shards(items, workers * _SHARDS_PER_WORKER)
+    results: list[MessageRedaction] = []
+    disabled: dict[str, DisabledRule] = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        shard_runs = pool.map(_redact_messages, repeat(rules), shards, repeat(timeout), repeat(max_hits))
+        for shard_results, shard_disabled in shard_runs:
+            results.extend(shard_results)
+            for rule in shard_disabled:
+                disabled.setdefault(rule.pattern, rule)
+    # Remember the workers' verdicts so later threads in this process skip the rules.
+    for rule in rules:
+        if rule.pattern.pattern in disabled:
+            _RUNTIME_DISABLED.setdefault(rule, disabled[rule.pattern.pattern].reason)
+    return results, list(disabled.values())
+
+
+def _contiguous_shards(items: list[_MessageItem], count: int) -> list[list[_MessageItem]]:
+    target = sum(len(item[0]) for item in items) / max(count, 1)
+    shards: list[list[_MessageItem]] = [[]]
+    size = 0
+    for item in items:
+        if size >= target and len(shards) < count:
+            shards.append([])
+            size = 0
+        shards[-1].append(item)
+        size += len(item[0])
+    return shards
+
+
+@dataclass(frozen=True, slots=True)
+class CachedRedaction:
+    """A cached result: redacted text (None when unchanged), message-relative hits
+    and per-category hit counts."""
+
+    text: str | None
+    hits: tuple[tuple[RedactionCategory, int, int, str], ...]
+    categories: tuple[tuple[str, int], ...]
+
+    @classmethod
+    def from_result(cls, result: MessageRedaction) -> "CachedRedaction":
+        return cls(
+            text=result.text if result.hit_count else None,
+            hits=tuple((hit.category, hit.start, hit.end, hit.placeholder) for hit in result.hits),
+            categories=tuple(result.categories.items()),
+        )
+
+    def apply(self, item: _MessageItem) -> MessageRedaction:
+        content, message_id, role, source_index = item
+        hits = [
+            RedactionHit(
+                category=category,
+                message_id=message_id,
+                role=role,
+                source_index=source_index,
+                start=start,
+                end=end,
+                placeholder=placeholder,
+            )
+            for category, start, end, placeholder in self.hits
+        ]
+        return MessageRedaction(content if self.text is None else self.text, hits, dict(self.categories))
+
+    def size(self) -> int:
+        return len(self.text or "") + sum(len(hit[3]) for hit in self.hits)
+
+    def to_json(self) -> str:
+        hits = [[category.value, start, end, placeholder] for category, start, end, placeholder in self.hits]
+        return json.dumps(
+            {"text": self.text, "hits": hits, "categories": dict(self.categories)}, ensure_ascii=False
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CachedRedaction":
+        record = json.loads(raw)
+        hits = tuple(
+            (RedactionCategory(category), int(start), int(end), str(placeholder))
+            for category, start, end, placeholder in record["hits"]
+        )
+        categories = record.get("categories")
+        if categories is None:
+            # Entries written before counts were stored hold every hit.
+            categories = {}
+            for category, _, _, _ in hits:
+                categories[category.value] = categories.get(category.value, 0) + 1
+        return cls(
+            text=record["text"],
+            hits=hits,
+            categories=tuple((str(category), int(count)) for category, count in categories.items()),
+        )
+
+
+class RedactionCache:
+    """Memoized redaction results keyed by message content and rule-set fingerprint.
+
+    The in-memory tier is an LRU bounded by the characters it holds, counting
+    each entry's key too, so entries for unchanged messages (which hold no
+    text) are bounded as well. With a
+    `directory`, results are also written to an on-disk tier (a `DiskCache`)
+    that survives the process and is shared by batch workers. Only redacted
+    output is stored, never the original content; unchanged messages store no
+    text at all.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_chars: int = DEFAULT_CACHE_MAX_CHARS,
+        min_chars: int = DEFAULT_CACHE_MIN_CHARS,
+        directory: str | Path | None = None,
+    ) -> None:
+        if max_chars < 1:
+            raise ValueError("max_chars must be positive")
+        self.max_chars = max_chars
+        self.min_chars = min_chars
+        self.disk = None if directory is None else DiskCache(Path(directory), evict_interval=_DISK_EVICT_INTERVAL)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, CachedRedaction] = OrderedDict()
+        self._chars = 0
+
+    def key(self, content: str, fingerprint: str) -> str | None:
+        """Return the cache key for `content`, or None if it is too short to cache."""
+
+        if len(content) < self.min_chars:
+            return None
+        digest = hashlib.sha256(fingerprint.encode("ascii"))
+        digest.update(b"\0")
+        digest.update(content.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> CachedRedaction | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        if self.disk is not None:
+            raw = self.disk.get(key)
+            if raw is not None:
+                try:
+                    entry = CachedRedaction.from_json(raw)
+                except (ValueError, KeyError, TypeError):
+                    entry = None
+                if entry is not None:
+                    self._remember(key, entry)
+                    self.hits += 1
+                    return entry
+        self.misses += 1
+        return None
+
+    def put(self, key: str, entry: CachedRedaction) -> None:
+        self._remember(key, entry)
+        if self.disk is not None:
+            self.disk.put(key, entry.to_json())
+
+    def _remember(self, key: str, entry: CachedRedaction) -> None:
+        size = len(key) + entry.size()
+        if size > self.max_chars:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._chars -= len(key) + previous.size()
+        self._entries[key] = entry
+        self._chars += size
+        while self._chars > self.max_chars:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._chars -= len(evicted_key) + evicted.size()
+
+
+@lru_cache(maxsize=8)
+def shared_redaction_cache(directory: str) -> RedactionCache:
+    """Process-wide cache for `directory`, so consecutive runs reuse the memory tier."""
+
+    return RedactionCache(directory=directory)
 
 
 def redact_text(
@@ -206,38 +781,883 @@ def redact_text(
     role: str = "unknown",
     source_index: int | None = None,
     rules: list[RedactionRule] | None = None,
+    cache: RedactionCache | None = None,
 ) -> tuple[str, list[RedactionHit]]:
-    """Redact one text block and return replacement hits."""
+    """Redact one text block and return replacement hits.
+
+    All active rules run as one compiled alternation (see `RedactionEngine`), so
+    a clean text is scanned once. Hit offsets refer to the original `text`; a
+    hit that covers an earlier rule's placeholder covers what it replaced.
+    """
+
+    rule_set = tuple(rules or DEFAULT_RULES)
+    key = None if cache is None else cache.key(text, rules_fingerprint(rule_set))
+    if cache is not None and key is not None:
+        entry = cache.get(key)
+        if entry is not None:
+            cached = entry.apply((text, message_id, role, source_index))
+            return cached.text, cached.hits
+    result = compile_rules(rule_set).redact_counted(
+        text, message_id=message_id, role=role, source_index=source_index
+    )
+    if cache is not None and key is not None:
+        cache.put(key, CachedRedaction.from_result(result))
+    return result.text, result.hits
+
+
+def redact_chunks(
+    chunks: Iterable[str],
+    *,
+    rules: list[RedactionRule] | None = None,
+    overlap: int = DEFAULT_STREAM_OVERLAP,
+    hold: int = DEFAULT_STREAM_HOLD,
+    message_id: str = "text",
+    role: str = "unknown",
+    source_index: int | None = None,
+) -> Iterator[tuple[str, list[RedactionHit]]]:
+    """Redact a text supplied in pieces, yielding `(redacted_piece, hits)`.
+
+    Joining the yielded pieces gives the same output as `redact_text` on the
+    joined input, provided every match can be told apart within `overlap`
+    characters of its start, or starts with its rule's `opener` and closes
+    within `hold` (see `StreamingRedactor`). Hit offsets are absolute positions
+    in the original (unredacted) stream.
+    """
+
+    redactor = StreamingRedactor(
+        rules,
+        overlap=overlap,
+        hold=hold,
+        message_id=message_id,
+        role=role,
+        source_index=source_index,
+    )
+    for chunk in chunks:
+        redacted = redactor.feed(chunk)
+        # A long match's hit is only complete once its end arrives, which can be
+        # after its placeholder was yielded.
+        if redacted or redactor.hits:
+            yield redacted, redactor.take_hits()
+    redacted = redactor.finish()
+    if redacted or redactor.hits:
+        yield redacted, redactor.take_hits()
+
+
+def iter_text_chunks(handle: Any, chunk_chars: int = DEFAULT_STREAM_CHUNK_CHARS) -> Iterator[str]:
+    """Read a text file handle in fixed-size pieces for `redact_chunks`."""
+
+    return iter(lambda: handle.read(chunk_chars), "")
+
+
+class StreamingRedactor:
+    """Incremental redaction with bounded memory.
+
+    `feed` scans the pending text and emits everything up to `overlap`
+    characters before its end, except that a match reaching into that tail is
+    held back whole; the tail is rescanned once more text arrives. A match that
+    is already `overlap` characters long is not held back further: its
+    placeholder is emitted, and later input that still continues the match
+    (as judged by the rule's pattern over the first `overlap` characters of the
+    match plus the new text) is swallowed. The last `overlap` emitted
+    characters are kept as left context for lookbehinds and `\\b`.
+
+    A match is only found if it is recognisable within `overlap` characters of
+    its start: a secret whose telling part arrives later (the `@domain` of a
+    longer email address) has already been emitted unredacted by then. The
+    exception is a rule with an `opener`: output stops before an opener no match
+    has closed yet, so a PEM block is redacted whole once its END line arrives,
+    unless that is more than `hold` characters after the opener, in which case
+    the text is emitted as is. Memory is therefore bounded by one chunk plus
+    `hold` and a few overlaps, apart from the hits collected between `take_hits`
+    calls.
+    """
+
+    def __init__(
+        self,
+        rules: list[RedactionRule] | None = None,
+        *,
+        overlap: int = DEFAULT_STREAM_OVERLAP,
+        hold: int = DEFAULT_STREAM_HOLD,
+        message_id: str = "text",
+        role: str = "unknown",
+        source_index: int | None = None,
+    ) -> None:
+        if overlap < 1:
+            raise ValueError("overlap must be at least 1")
+        if hold < 0:
+            raise ValueError("hold must not be negative")
+        self.engine = compile_rules(tuple(rules or DEFAULT_RULES))
+        if self.engine.pattern is None:
+            raise ValueError("streaming redaction needs rules that combine into one pattern")
+        self.overlap = overlap
+        self.hold = hold
+        self._openers = tuple({rule.opener for rule in self.engine.rules if rule.opener})
+        self.message_id = message_id
+        self.role = role
+        self.source_index = source_index
+        self.hits: list[RedactionHit] = []
+        self._context = ""
+        self._pending = ""
+        self._offset = 0
+        # A long match whose placeholder is already emitted but whose end is not
+        # yet known: its rule, its first `overlap` characters, and its hit.
+        self._open: tuple[RedactionRule, str, RedactionHit] | None = None
+
+    def feed(self, chunk: str) -> str:
+        """Consume one piece of input and return the redacted text now final."""
+
+        self._pending += chunk
+        if len(self._pending) <= self.overlap:
+            return ""
+        return self._emit(final=False)
+
+    def finish(self) -> str:
+        """Redact and return everything still pending."""
+
+        return self._emit(final=True)
+
+    def take_hits(self) -> list[RedactionHit]:
+        hits, self.hits = self.hits, []
+        return hits
+
+    def _emit(self, *, final: bool) -> str:
+        parts: list[str] = []
+        while True:
+            if self._open is not None:
+                self._continue_open(final=final)
+                if self._open is not None:
+                    break
+            parts.append(self._scan(final=final))
+            if self._open is None or not (self._pending or final):
+                break
+        return "".join(parts)
+
+    def _scan(self, *, final: bool) -> str:
+        text = self._context + self._pending
+        base = len(self._context)
+        cutoff = len(text) if final else max(base, len(text) - self.overlap)
+        parts: list[str] = []
+        position = base
+        engine = self.engine.narrow(text)
+        matches = engine.iter_matches(text, base) if engine is not None else iter(())
+        for start, end, rule, placeholder in matches:
+            held = self._unclosed_opener(text, position, min(start, cutoff), final=final)
+            if held is not None:
+                cutoff = held
+                break
+            # A match of an opener rule ends at its terminator, so it is complete
+            # however close to the end of the text it is found.
+            if rule.opener is None and (start >= cutoff or end > cutoff):
+                if end - start >= self.overlap:
+                    # Too long to hold back: redact it now and keep swallowing
+                    # whatever continues it.
+                    parts.append(text[position:start])
+                    parts.append(placeholder)
+                    hit = self._hit(rule, start - base, end - base, placeholder)
+                    self._open = (rule, text[start : start + self.overlap], hit)
+                    position = cutoff = end
+                    break
+                # Not final yet: more input could change or extend this match.
+                cutoff = min(cutoff, start)
+                break
+            parts.append(text[position:start])
+            parts.append(placeholder)
+            position = end
+            cutoff = max(cutoff, end)
+            self.hits.append(self._hit(rule, start - base, end - base, placeholder))
+        held = self._unclosed_opener(text, position, cutoff, final=final)
+        if held is not None:
+            cutoff = held
+        parts.append(text[position:cutoff])
+        self._offset += cutoff - base
+        self._context = text[max(0, cutoff - self.overlap) : cutoff]
+        self._pending = text[cutoff:]
+        return "".join(parts)
+
+    def _unclosed_opener(self, text: str, start: int, stop: int, *, final: bool) -> int | None:
+        """Return where the first opener in `text[start:stop]` begins, or None.
+
+        Only unmatched text is searched, so an opener found there has not been
+        closed yet; one more than `hold` characters from the end is given up on.
+        """
+
+        if final or not self._openers:
+            return None
+        held = stop
+        for opener in self._openers:
+            # Also find an opener that begins before `stop` and runs past it.
+            index = text.find(opener, start, held + len(opener) - 1)
+            while index != -1 and len(text) - index > self.hold:
+                index = text.find(opener, index + 1, held + len(opener) - 1)
+            if index != -1:
+                held = index
+        return held if held < stop else None
+
+    def _continue_open(self, *, final: bool) -> None:
+        assert self._open is not None
+        rule, head, hit = self._open
+        match = rule.pattern.match(head + self._pending)
+        consumed = max(0, (match.end() if match is not None else 0) - len(head))
+        self._offset += consumed
+        self._context = (self._context + self._pending[:consumed])[-self.overlap :]
+        self._pending = self._pending[consumed:]
+        if final or self._pending:
+            self.hits.append(hit.model_copy(update={"end": self._offset}))
+            self._open = None
+
+    def _hit(self, rule: RedactionRule, start: int, end: int, placeholder: str) -> RedactionHit:
+        return RedactionHit(
+            category=rule.category,
+            message_id=self.message_id,
+            role=self.role,
+            source_index=self.source_index,
+            start=self._offset + start,
+            end=self._offset + end,
+            placeholder=placeholder,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RedactionEngine:
+    """A rule set compiled into a single-pass scanner.
+
+    Every rule becomes one branch of a combined alternation, ordered by priority
+    and tagged with an empty marker group `(?P<_rN>)`, with its own groups and
+    backreferences renumbered and its flags scoped to the branch. At any position the first branch that matches
+    wins; matches never overlap. If the rules cannot be combined (for example an
+    unsupported construct in a custom pattern) `pattern` is None and the rules are
+    applied one after another as before.
+
+    `redact` keeps the sequential results: a text the combined pattern does not
+    match is returned after that one scan, and a text matched while only one
+    rule can apply is redacted from the combined matches. Otherwise rules may
+    overlap (a bearer token that is also an API key, a secret assignment whose
+    value is one), so the candidate rules run one after another, each on the
+    previous one's output, and their categories, placeholders and hit counts
+    stay what they always were. Hits are still reported in text order with
+    offsets into the original text.
+
+    With a `prefilter`, a text that contains none of the rules' literals is
+    returned untouched after one scan, and otherwise only the rules whose
+    literals occur are run.
+    """
+
+    rules: tuple[RedactionRule, ...]
+    pattern: Pattern[str] | None
+    literal_replacements: tuple[str | None, ...]
+    prefilter: LiteralPrefilter | None = None
+
+    def redact(
+        self,
+        text: str,
+        *,
+        message_id: str = "text",
+        role: str = "unknown",
+        source_index: int | None = None,
+    ) -> tuple[str, list[RedactionHit]]:
+        result = self.redact_counted(text, message_id=message_id, role=role, source_index=source_index)
+        return result.text, result.hits
+
+    def redact_counted(
+        self,
+        text: str,
+        *,
+        message_id: str = "text",
+        role: str = "unknown",
+        source_index: int | None = None,
+        max_hits: int | None = None,
+    ) -> MessageRedaction:
+        """Redact `text`, building at most `max_hits` hits and counting the rest by category."""
+
+        engine = self.narrow(text)
+        if engine is None:
+            return MessageRedaction(text, [], {})
+        if engine.pattern is None:
+            return _redact_sequential(
+                text,
+                engine.rules,
+                message_id=message_id,
+                role=role,
+                source_index=source_index,
+                max_hits=max_hits,
+            )
+
+        if len(engine.rules) > 1:
+            if engine.pattern.search(text) is None:
+                return MessageRedaction(text, [], {})
+            return _redact_sequential(
+                text,
+                engine.rules,
+                message_id=message_id,
+                role=role,
+                source_index=source_index,
+                max_hits=max_hits,
+            )
+
+        parts: list[str] = []
+        hits: list[RedactionHit] = []
+        categories: dict[str, int] = {}
+        position = 0
+        for start, end, rule, placeholder in engine.iter_matches(text):
+            parts.append(text[position:start])
+            parts.append(placeholder)
+            position = end
+            categories[rule.category.value] = categories.get(rule.category.value, 0) + 1
+            if max_hits is None or len(hits) < max_hits:
+                hits.append(
+                    RedactionHit(
+                        category=rule.category,
+                        message_id=message_id,
+                        role=role,
+                        source_index=source_index,
+                        start=start,
+                        end=end,
+                        placeholder=placeholder,
+                    )
+                )
+        if not categories:
+            return MessageRedaction(text, hits, categories)
+        parts.append(text[position:])
+        return MessageRedaction("".join(parts), hits, categories)
+
+    def narrow(self, text: str) -> RedactionEngine | None:
+        """Return the engine for the rules that may match `text`, or None if none can."""
+
+        if self.prefilter is None:
+            return self
+        active = self.prefilter.select(text)
+        if not active:
+            return None
+        if len(active) < len(self.rules):
+            # Dropping rules that cannot match leaves every remaining match unchanged.
+            return _subset_engine(tuple(self.rules[index] for index in active))
+        return self
+
+    def iter_matches(self, text: str, pos: int = 0) -> Iterator[tuple[int, int, RedactionRule, str]]:
+        """Yield `(start, end, rule, placeholder)` for each match at or after `pos`.
+
+        Characters before `pos` are still visible to lookbehinds and `\\b`.
+        Requires the combined pattern.
+        """
+
+        if self.pattern is None:
+            raise ValueError("rules that cannot be combined into one pattern do not support match iteration")
+        for match in self.pattern.finditer(text, pos):
+            rule_index = int(match.lastgroup[2:])  # type: ignore[index]
+            rule = self.rules[rule_index]
+            start, end = match.span()
+            placeholder = self.literal_replacements[rule_index]
+            if placeholder is None:
+                placeholder = _expand_rule(rule, text, start, end)
+            yield start, end, rule, placeholder
+
+    def sequential_matches(self, text: str) -> list[tuple[int, int, RedactionRule, str]]:
+        """Return `(start, end, rule, placeholder)` for each match in text order,
+        applying the rules one after another as `redact` does without a combined
+        pattern. Offsets refer to `text`.
+        """
+
+        _, found = _apply_sequential(text, self.rules)
+        return [(start, end, self.rules[rule_index], placeholder) for start, rule_index, end, placeholder in found]
+
+
+@dataclass(frozen=True, slots=True)
+class RuleTrigger:
+    """Literals of which at least one occurs in every match of a rule.
+
+    `folded` literals are looked up in `text.casefold()`; `digits` stands for
+    "any decimal digit", the requirement of patterns built on `\\d`.
+    """
+
+    plain: tuple[str, ...] = ()
+    folded: tuple[str, ...] = ()
+    digits: bool = False
+
+    def occurs(self, text: str, folded_text: str) -> bool:
+        return (
+            any(literal in text for literal in self.plain)
+            or any(literal in folded_text for literal in self.folded)
+            or (self.digits and _has_digit(text))
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class LiteralPrefilter:
+    """Per-rule triggers, checked with plain substring tests before any pattern runs.
+
+    `combined` merges every rule's literals, so a text that can match none of
+    the rules is rejected with a handful of `in` checks.
+    """
+
+    combined: RuleTrigger | None
+    triggers: tuple[RuleTrigger | None, ...]
+    casefold: bool
+
+    def select(self, text: str) -> tuple[int, ...]:
+        """Return the indexes of the rules that may match `text`."""
+
+        folded_text = text.casefold() if self.casefold else ""
+        if self.combined is not None and not self.combined.occurs(text, folded_text):
+            return ()
+        return tuple(
+            index
+            for index, trigger in enumerate(self.triggers)
+            if trigger is None or trigger.occurs(text, folded_text)
+        )
+
+
+@lru_cache(maxsize=64)
+def compile_rules(rules: tuple[RedactionRule, ...]) -> RedactionEngine:
+    """Compile (and memoize) the single-pass engine for an ordered rule set."""
+
+    ordered = tuple(
+        rule for _, rule in sorted(enumerate(rules), key=lambda item: (-item[1].priority, item[0]))
+    )
+    engine = _build_engine(ordered)
+    requirements = [_rule_requirements(rule) for rule in ordered]
+    if all(requirement is None for requirement in requirements):
+        return engine
+    return RedactionEngine(
+        rules=engine.rules,
+        pattern=engine.pattern,
+        literal_replacements=engine.literal_replacements,
+        prefilter=_build_prefilter(requirements),
+    )
+
+
+@lru_cache(maxsize=256)
+def _subset_engine(ordered: tuple[RedactionRule, ...]) -> RedactionEngine:
+    return _build_engine(ordered)
+
+
+def _build_engine(ordered: tuple[RedactionRule, ...]) -> RedactionEngine:
+    literals = tuple(None if "\\" in rule.replacement else rule.replacement for rule in ordered)
+    try:
+        branches: list[str] = []
+        group_offset = 0
+        for index, rule in enumerate(ordered):
+            # The empty marker group closes last, so `match.lastgroup` names the
+            # rule. Keeping it at the end of the branch (rather than wrapping the
+            # branch) leaves the rule's first opcode visible to the regex engine's
+            # per-branch fast rejection.
+            branch, group_count = _scoped_branch(rule.pattern, prefix=f"_r{index}_", group_offset=group_offset)
+            branches.append(f"{branch}(?P<_r{index}>)")
+            group_offset += group_count + 1
+        combined = re.compile("|".join(branches))
+    except (re.error, ValueError):
+        return RedactionEngine(rules=ordered, pattern=None, literal_replacements=literals)
+    return RedactionEngine(rules=ordered, pattern=combined, literal_replacements=literals)
+
+
+def _redact_sequential(
+    text: str,
+    rules: tuple[RedactionRule, ...],
+    *,
+    message_id: str,
+    role: str,
+    source_index: int | None,
+    max_hits: int | None = None,
+) -> MessageRedaction:
+    output, found = _apply_sequential(text, rules)
+    categories: dict[str, int] = {}
+    for _, rule_index, _, _ in found:
+        category = rules[rule_index].category.value
+        categories[category] = categories.get(category, 0) + 1
+    hits = [
+        RedactionHit(
+            category=rules[rule_index].category,
+            message_id=message_id,
+            role=role,
+            source_index=source_index,
+            start=start,
+            end=end,
+            placeholder=placeholder,
+        )
+        for start, rule_index, end, placeholder in (found if max_hits is None else found[:max_hits])
+    ]
+    return MessageRedaction(output, hits, categories)
+
+
+def _apply_sequential(
+    text: str, rules: tuple[RedactionRule, ...]
+) -> tuple[str, list[tuple[int, int, int, str]]]:
+    """Apply `rules` one after another to `text`.
+
+    Returns the output and every match as `(start, rule index, end, placeholder)`
+    with offsets in `text`, in text order.
+    """
 
-    active_rules = rules or DEFAULT_RULES
     output = text
-    hits: list[RedactionHit] = []
+    offsets = _OffsetMap()
+    found: list[tuple[int, int, int, str]] = []
 
-    for rule in active_rules:
-        current_hits: list[RedactionHit] = []
+    for rule_index, rule in enumerate(rules):
+        replaced: list[tuple[int, int, int]] = []
 
         def replace(match: re.Match[str]) -> str:
             placeholder = match.expand(rule.replacement)
-            current_hits.append(
-                RedactionHit(
-                    category=rule.category,
-                    message_id=message_id,
-                    role=role,
-                    source_index=source_index,
-                    start=match.start(),
-                    end=match.end(),
-                    placeholder=placeholder,
-                )
-            )
+            start, end = match.span()
+            replaced.append((start, end, len(placeholder)))
+            found.append((offsets.start(start), rule_index, offsets.end(end), placeholder))
             return placeholder
 
         output = rule.pattern.sub(replace, output)
-        hits.extend(current_hits)
+        if replaced:
+            offsets.replace(replaced)
+
+    found.sort(key=lambda record: record[:2])
+    return output, found
+
+
+class _OffsetMap:
+    """Maps offsets in a text after successive replacements back to the original.
+
+    A span that starts or ends inside an earlier placeholder is widened to cover
+    everything that placeholder replaced.
+    """
+
+    def __init__(self) -> None:
+        # (output start, output end, original start, original end), sorted.
+        self._spans: list[tuple[int, int, int, int]] = []
+        self._starts: list[int] = []
+
+    def start(self, position: int) -> int:
+        index = bisect_right(self._starts, position) - 1
+        if index < 0:
+            return position
+        out_start, out_end, orig_start, orig_end = self._spans[index]
+        return orig_start if position < out_end else position - out_end + orig_end
+
+    def end(self, position: int) -> int:
+        index = bisect_left(self._starts, position) - 1
+        if index < 0:
+            return position
+        _, out_end, _, orig_end = self._spans[index]
+        return orig_end if position <= out_end else position - out_end + orig_end
+
+    def replace(self, replaced: list[tuple[int, int, int]]) -> None:
+        """Record one pass of `(start, end, new length)` replacements, in current offsets."""
+
+        old = self._spans
+        # [start, end, original start, original end, length change], in current offsets.
+        merged: list[list[int]] = []
+        index = 0
+        for start, end, length in replaced:
+            while index < len(old) and old[index][1] <= start and old[index][0] < start:
+                merged.append([*old[index], 0])
+                index += 1
+            span = [start, end, self.start(start), self.end(end), length - (end - start)]
+            # Earlier placeholders the match touches are folded into one span.
+            while index < len(old) and old[index][0] < end:
+                out_start, out_end, orig_start, orig_end = old[index]
+                span[0], span[1] = min(span[0], out_start), max(span[1], out_end)
+                span[2], span[3] = min(span[2], orig_start), max(span[3], orig_end)
+                index += 1
+            if merged and merged[-1][1] > span[0]:
+                last = merged.pop()
+                span = [last[0], max(last[1], span[1]), last[2], max(last[3], span[3]), last[4] + span[4]]
+            merged.append(span)
+        merged.extend([*span, 0] for span in old[index:])
+
+        spans: list[tuple[int, int, int, int]] = []
+        shift = 0
+        for out_start, out_end, orig_start, orig_end, change in merged:
+            spans.append((out_start + shift, out_end + shift + change, orig_start, orig_end))
+            shift += change
+        self._spans = spans
+        self._starts = [span[0] for span in spans]
+
+
+def _expand_rule(rule: RedactionRule, text: str, start: int, end: int) -> str:
+    # Re-match the span with the rule's own pattern so group references in the
+    # replacement keep the numbering the rule author wrote.
+    match = rule.pattern.fullmatch(text, start, end) or rule.pattern.match(text, start)
+    return match.expand(rule.replacement) if match is not None else rule.replacement
+
+
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?([aiLmsux]+)\)")
+_FLAG_LETTERS = {"a": re.ASCII, "i": re.IGNORECASE, "L": re.LOCALE, "m": re.MULTILINE, "s": re.DOTALL, "x": re.VERBOSE}
+
+
+def _scoped_branch(pattern: Pattern[str], *, prefix: str, group_offset: int) -> tuple[str, int]:
+    """Return `pattern` rewritten to sit inside a combined alternation.
+
+    Leading global inline flags and compile flags become a scoped `(?flags:...)`
+    group, capture groups are renamed/renumbered from `group_offset`, and the
+    number of capture groups is returned.
+    """
+
+    source = pattern.pattern
+    flags = pattern.flags
+    while match := _GLOBAL_FLAGS_RE.match(source):
+        for letter in match.group(1):
+            flags |= _FLAG_LETTERS.get(letter, 0)
+        source = source[match.end() :]
+    if flags & re.LOCALE:
+        raise ValueError("LOCALE patterns cannot be combined")
+
+    body, group_count = _renumber_groups(source, prefix=prefix, group_offset=group_offset, verbose=bool(flags & re.VERBOSE))
+    letters = "".join(letter for letter in "aimsx" if flags & _FLAG_LETTERS[letter])
+    if flags & re.VERBOSE:
+        # A trailing comment would otherwise swallow the closing parenthesis.
+        body += "\n"
+    return (f"(?{letters}:{body})" if letters else f"(?:{body})"), group_count
+
+
+def _renumber_groups(source: str, *, prefix: str, group_offset: int, verbose: bool) -> tuple[str, int]:
+    out: list[str] = []
+    group_count = 0
+    index = 0
+    length = len(source)
+    in_class = False
+    while index < length:
+        char = source[index]
+        if char == "\\":
+            nxt = source[index + 1 : index + 2]
+            if not in_class and nxt.isdigit() and nxt != "0":
+                digits = nxt
+                if source[index + 2 : index + 3].isdigit():
+                    third = source[index + 3 : index + 4]
+                    if third.isdigit() and all(d in "01234567" for d in source[index + 1 : index + 4]):
+                        out.append(source[index : index + 4])  # three-digit octal escape
+                        index += 4
+                        continue
+                    digits = source[index + 1 : index + 3]
+                out.append(f"(?:\\{int(digits) + group_offset})")
+                index += 1 + len(digits)
+                continue
+            out.append(source[index : index + 2])
+            index += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+            out.append(char)
+            index += 1
+            continue
+        if char == "[":
+            in_class = True
+            out.append(char)
+            index += 1
+            # A `]` directly after `[` or `[^` is a literal member.
+            if source[index : index + 1] == "^":
+                out.append("^")
+                index += 1
+            if source[index : index + 1] == "]":
+                out.append("]")
+                index += 1
+            continue
+        if verbose and char == "#":
+            newline = source.find("\n", index)
+            newline = length if newline == -1 else newline
+            out.append(source[index:newline])
+            index = newline
+            continue
+        if char == "(":
+            if source.startswith("(?P<", index):
+                close = source.index(">", index)
+                out.append(f"(?P<{prefix}{source[index + 4 : close]}>")
+                group_count += 1
+                index = close + 1
+                continue
+            if source.startswith("(?P=", index):
+                close = source.index(")", index)
+                out.append(f"(?P={prefix}{source[index + 4 : close]})")
+                index = close + 1
+                continue
+            if source.startswith("(?(", index):
+                close = source.index(")", index + 3)
+                reference = source[index + 3 : close]
+                reference = str(int(reference) + group_offset) if reference.isdigit() else prefix + reference
+                out.append(f"(?({reference})")
+                index = close + 1
+                continue
+            if source.startswith("(?", index):
+                out.append("(?")
+                index += 2
+                continue
+            group_count += 1
+        out.append(char)
+        index += 1
+    return "".join(out), group_count
+
+
+# A requirement is a set of alternatives `(folded, literal, length)`: every match
+# of the rule contains at least one of them. The empty literal `_DIGIT` stands for
+# any `\d` match.
+_Requirement = frozenset[tuple[bool, str, int]]
+_DIGIT = ""
+_ASCII_DIGITS = "0123456789"
+_MAX_RUN_ALTERNATIVES = 16
+_MAX_CLASS_CHARS = 10
+
+
+def _rule_requirements(rule: RedactionRule) -> _Requirement | None:
+    """Return the literals gating `rule`, or None when it must always run."""
 
-    return output, hits
+    if rule.literals is not None:
+        if not rule.literals or not all(rule.literals):
+            return None
+        ignore_case = bool(rule.pattern.flags & re.IGNORECASE)
+        return frozenset(_literal_alternative(literal, ignore_case) for literal in rule.literals)
+    try:
+        parsed = sre_parse.parse(rule.pattern.pattern, rule.pattern.flags)
+    except (re.error, RecursionError):
+        return None
+    return _derive_requirements(parsed, parsed.state.flags)
 
 
-def _select_rules(config: RedactionConfig) -> list[RedactionRule]:
+def _literal_alternative(literal: str, ignore_case: bool) -> tuple[bool, str, int]:
+    folded = ignore_case and (literal.lower() != literal.upper() or literal.casefold() != literal)
+    text = literal.casefold() if folded else literal
+    return folded, text, len(text)
+
+
+def _has_digit(text: str) -> bool:
+    if text.isascii():
+        return any(digit in text for digit in _ASCII_DIGITS)
+    return _UNICODE_DIGIT_RE.search(text) is not None
+
+
+_UNICODE_DIGIT_RE = re.compile(r"\d")
+
+
+def _derive_requirements(items: sre_parse.SubPattern, flags: int) -> _Requirement | None:
+    """Pick the most selective literal requirement in a parsed sequence.
+
+    Adjacent literals (and small character classes, expanded) form runs; groups,
+    alternations and repeats with a minimum of one contribute their own
+    requirement. Anything else only breaks the current run, so the result is
+    always implied by a match.
+    """
+
+    ignore_case = bool(flags & re.IGNORECASE)
+    candidates: list[_Requirement] = []
+    run = [""]
+
+    def close_run() -> None:
+        nonlocal run
+        if run != [""]:
+            candidates.append(frozenset(_literal_alternative(value, ignore_case) for value in run))
+        run = [""]
+
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            char = chr(av)
+            run = [value + char for value in run]
+            continue
+        if op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            continue  # zero-width: the surrounding literals stay adjacent
+        chars = _class_chars(av, flags) if op is sre_constants.IN else None
+        if chars is not None and len(run) * len(chars) <= _MAX_RUN_ALTERNATIVES:
+            run = [value + char for value in run for char in chars]
+            continue
+        close_run()
+        requirement: _Requirement | None = None
+        if op is sre_constants.IN:
+            if chars is not None:
+                requirement = frozenset(_literal_alternative(char, ignore_case) for char in chars)
+            elif av == [(sre_constants.CATEGORY, sre_constants.CATEGORY_DIGIT)]:
+                requirement = frozenset({(False, _DIGIT, 1)})
+        elif op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, body = av
+            requirement = _derive_requirements(body, (flags | add_flags) & ~del_flags)
+        elif op is sre_constants.ATOMIC_GROUP:
+            requirement = _derive_requirements(av, flags)
+        elif op is sre_constants.BRANCH:
+            branches = [_derive_requirements(branch, flags) for branch in av[1]]
+            if all(branch is not None for branch in branches):
+                requirement = frozenset().union(*branches)  # type: ignore[arg-type]
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, sre_constants.POSSESSIVE_REPEAT):
+            if av[0] >= 1:
+                requirement = _derive_requirements(av[2], flags)
+        if requirement:
+            candidates.append(requirement)
+    close_run()
+    # Prefer the requirement whose shortest alternative is longest, then the one
+    # with fewer alternatives.
+    return max(candidates, key=lambda item: (min(length for _, _, length in item), -len(item)), default=None)
+
+
+def _class_chars(items: list[tuple[object, object]], flags: int) -> list[str] | None:
+    chars: list[str] = []
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            chars.append(chr(av))  # type: ignore[arg-type]
+        elif op is sre_constants.RANGE and av[1] - av[0] < _MAX_CLASS_CHARS:  # type: ignore[index]
+            chars.extend(chr(code) for code in range(av[0], av[1] + 1))  # type: ignore[index]
+        elif op is sre_constants.CATEGORY and av is sre_constants.CATEGORY_DIGIT and flags & re.ASCII:
+            chars.extend("0123456789")
+        else:
+            return None  # NEGATE, wide ranges, Unicode categories
+    if flags & re.IGNORECASE:
+        chars = [char.casefold() for char in chars]
+    unique = list(dict.fromkeys(chars))
+    return unique if 0 < len(unique) <= _MAX_CLASS_CHARS else None
+
+
+def _build_prefilter(requirements: list[_Requirement | None]) -> LiteralPrefilter:
+    triggers = tuple(None if requirement is None else _trigger(requirement) for requirement in requirements)
+    combined = None
+    if None not in triggers:
+        combined = _trigger(frozenset().union(*requirements))  # type: ignore[arg-type]
+    casefold = any(trigger is not None and trigger.folded for trigger in triggers)
+    return LiteralPrefilter(combined=combined, triggers=triggers, casefold=casefold)
+
+
+def _trigger(requirement: _Requirement) -> RuleTrigger:
+    def minimal(literals: set[str]) -> tuple[str, ...]:
+        # A literal containing a shorter one is implied by it.
+        ordered = sorted(literals, key=lambda item: (len(item), item))
+        kept: list[str] = []
+        for literal in ordered:
+            if not any(shorter in literal for shorter in kept):
+                kept.append(literal)
+        return tuple(kept)
+
+    return RuleTrigger(
+        plain=minimal({literal for folded, literal, _ in requirement if not folded and literal != _DIGIT}),
+        folded=minimal({literal for folded, literal, _ in requirement if folded}),
+        digits=any(literal == _DIGIT and not folded for folded, literal, _ in requirement),
+    )
+
+
+def redaction_fingerprint(config: RedactionConfig | None = None) -> str:
+    """Return a stable hash of every setting and rule that affects redaction output."""
+
+    cfg = config or RedactionConfig()
+    material = {
+        "enabled": cfg.enabled,
+        "mode": cfg.mode.value,
+        "report": [cfg.report_mode.value, cfg.report_sample_hits],
+        "rules": rules_fingerprint(tuple(select_rules(cfg))) if cfg.enabled else None,
+    }
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@lru_cache(maxsize=64)
+def rules_fingerprint(rules: tuple[RedactionRule, ...]) -> str:
+    """Return a stable hash of an ordered rule set."""
+
+    material = [
+        [
+            rule.category.value,
+            rule.pattern.pattern,
+            rule.pattern.flags,
+            rule.replacement,
+            rule.priority,
+            None if rule.literals is None else list(rule.literals),
+        ]
+        for rule in rules
+    ]
+    encoded = json.dumps(material, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def select_rules(config: RedactionConfig) -> list[RedactionRule]:
+    """Return the default rules enabled by `config` followed by its custom rules."""
+
     rules: list[RedactionRule] = []
     for rule in DEFAULT_RULES:
         if rule.category == RedactionCategory.email and not config.redact_emails:
@@ -252,4 +1672,225 @@ def _select_rules(config: RedactionConfig) -> list[RedactionRule]:
         rules.append(rule)
     if config.custom_rules:
         rules.extend(config.custom_rules)
+    if config.custom_rules_path is not None:
+        rules.extend(load_custom_rules(config.custom_rules_path))
     return rules
+
+
+class CustomRuleSpec(BaseModel):
+    """One entry of a custom rules file."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    pattern: str
+    replacement: str = "[REDACTED]"
+    category: RedactionCategory = RedactionCategory.custom
+    description: str = "Custom rule"
+    flags: list[str] = Field(default_factory=list)
+    priority: int = 0
+    literals: list[str] | None = None
+    opener: str | None = None
+
+    def to_rule(self) -> RedactionRule:
+        flags = 0
+        for name in self.flags:
+            if name.upper() not in _RULE_FLAGS:
+                raise ValueError(f"unknown regex flag {name!r}; expected one of {', '.join(_RULE_FLAGS)}")
+            flags |= _RULE_FLAGS[name.upper()]
+        try:
+            pattern = re.compile(self.pattern, flags)
+        except re.error as exc:
+            raise ValueError(f"invalid pattern {self.pattern!r}: {exc}") from exc
+        return RedactionRule(
+            category=self.category,
+            pattern=pattern,
+            replacement=self.replacement,
+            description=self.description,
+            priority=self.priority,
+            literals=None if self.literals is None else tuple(self.literals),
+            opener=self.opener,
+        )
+
+
+_RULE_FLAGS = {
+    "IGNORECASE": re.IGNORECASE,
+    "MULTILINE": re.MULTILINE,
+    "DOTALL": re.DOTALL,
+    "VERBOSE": re.VERBOSE,
+    "ASCII": re.ASCII,
+}
+
+
+def load_custom_rules(path: str | Path) -> tuple[RedactionRule, ...]:
+    """Load custom redaction rules from a YAML or JSON file.
+
+    The file holds a list of rule entries (see `CustomRuleSpec`), optionally
+    under a top-level `rules` key. Patterns are compiled once per file version,
+    so batch runs and pool workers share the same compiled rules.
+    """
+
+    resolved = Path(path).resolve()
+    try:
+        stat = resolved.stat()
+    except OSError as exc:
+        raise ValueError(f"cannot read custom redaction rules {path}: {exc}") from exc
+    return _load_custom_rules(str(resolved), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=16)
+def _load_custom_rules(path: str, mtime_ns: int, size: int) -> tuple[RedactionRule, ...]:
+    text = Path(path).read_text(encoding="utf-8")
+    try:
+        data = json.loads(text) if path.endswith(".json") else yaml.safe_load(text)
+    except (ValueError, yaml.YAMLError) as exc:
+        raise ValueError(f"cannot parse custom redaction rules {path}: {exc}") from exc
+    if isinstance(data, dict):
+        data = data.get("rules")
+    if data is None:
+        return ()
+    if not isinstance(data, list):
+        raise ValueError(f"custom redaction rules {path} must be a list or a mapping with a 'rules' list")
+    rules = []
+    for index, entry in enumerate(data):
+        try:
+            rules.append(CustomRuleSpec.model_validate(entry).to_rule())
+        except (ValidationError, ValueError) as exc:
+            raise ValueError(f"custom redaction rule #{index} in {path}: {exc}") from exc
+    return tuple(rules)
+
+
+def screen_rules(rules: Iterable[RedactionRule]) -> tuple[tuple[RedactionRule, ...], list[DisabledRule]]:
+    """Split `rules` into usable rules and custom rules that must not run.
+
+    A custom rule is dropped when `redos_risk` finds a catastrophic-backtracking
+    shape in it or when it already blew the time budget in this process.
+    """
+
+    kept: list[RedactionRule] = []
+    disabled: list[DisabledRule] = []
+    for rule in rules:
+        if rule in _TRUSTED_RULES:
+            kept.append(rule)
+            continue
+        reason = _RUNTIME_DISABLED.get(rule) or redos_risk(rule.pattern)
+        if reason is None:
+            kept.append(rule)
+        else:
+            disabled.append(_disabled(rule, reason))
+    return tuple(kept), disabled
+
+
+def _disabled(rule: RedactionRule, reason: str) -> DisabledRule:
+    return DisabledRule(
+        category=rule.category, description=rule.description, pattern=rule.pattern.pattern, reason=reason
+    )
+
+
+@lru_cache(maxsize=256)
+def redos_risk(pattern: Pattern[str]) -> str | None:
+    """Return why `pattern` risks catastrophic backtracking, or None if it looks safe.
+
+    This is a static screen over the parsed pattern. It flags an unbounded
+    repeat nested in another unbounded repeat with nothing mandatory between
+    iterations (`(a+)+`, `(\\w+\\s?)*`) and an unbounded repeat over an
+    alternation whose branches can match the same text (`(a|aa)+`).
+    Possessive and atomic constructs are never flagged.
+    """
+
+    return _repeat_risk(sre_parse.parse(pattern.pattern, pattern.flags), nested=False)
+
+
+def _repeat_risk(items: Any, *, nested: bool) -> str | None:
+    for op, av in items:
+        reason = None
+        if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            _, high, body = av
+            if high != sre_constants.MAXREPEAT:
+                reason = _repeat_risk(body, nested=nested)
+            elif nested:
+                return "nested unbounded quantifiers can backtrack exponentially"
+            elif _ambiguous_alternation(body):
+                return "unbounded repeat over overlapping alternatives can backtrack exponentially"
+            else:
+                reason = _repeat_risk(body, nested=_mandatory_width(body) == 0)
+        elif op == sre_constants.SUBPATTERN:
+            reason = _repeat_risk(av[3], nested=nested)
+        elif op == sre_constants.BRANCH:
+            for branch in av[1]:
+                reason = reason or _repeat_risk(branch, nested=nested)
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            reason = _repeat_risk(av[1], nested=False)
+        if reason is not None:
+            return reason
+    return None
+
+
+def _mandatory_width(items: Any) -> int:
+    """Minimum width of `items`, not counting unbounded repeats."""
+
+    width = 0
+    for op, av in items:
+        if op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL, sre_constants.IN, sre_constants.ANY):
+            width += 1
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, sre_constants.POSSESSIVE_REPEAT):
+            low, high, body = av
+            if high != sre_constants.MAXREPEAT:
+                width += low * _mandatory_width(body)
+        elif op in (sre_constants.SUBPATTERN, sre_constants.ATOMIC_GROUP):
+            width += _mandatory_width(av[3] if op == sre_constants.SUBPATTERN else av)
+        elif op == sre_constants.BRANCH:
+            width += min(_mandatory_width(branch) for branch in av[1])
+    return width
+
+
+def _ambiguous_alternation(items: Any) -> bool:
+    for op, av in items:
+        if op == sre_constants.SUBPATTERN and _ambiguous_alternation(av[3]):
+            return True
+        if op != sre_constants.BRANCH:
+            continue
+        # The parser factors shared prefixes out of alternatives, so `a|aa`
+        # arrives as `a(?:|a)`: an empty branch or two branches starting with
+        # the same literal means the same text can be split several ways.
+        firsts = set()
+        for branch in av[1]:
+            if not branch or _mandatory_width(branch) == 0:
+                return True
+            first = branch[0]
+            if first[0] == sre_constants.LITERAL:
+                if first in firsts:
+                    return True
+                firsts.add(first)
+    return False
+
+
+class _RuleTimeout(Exception):
+    pass
+
+
+def _can_time_limit() -> bool:
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+@contextmanager
+def _time_limit(seconds: float) -> Iterator[None]:
+    """Raise `_RuleTimeout` if the block runs longer than `seconds`.
+
+    `re` checks for signals while matching, so SIGALRM interrupts a runaway
+    pattern. Only available on the main thread; elsewhere this is a no-op.
+    """
+
+    if not _can_time_limit():
+        yield
+        return
+
+    def expire(signum: int, frame: Any) -> None:
+        raise _RuleTimeout
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
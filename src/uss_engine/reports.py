@@ -26,6 +26,12 @@ class ProviderKind(StrEnum):
     xai = "xai"
     ollama = "ollama"
 
+    @property
+    def canonical(self) -> ProviderKind:
+        """The provider this name selects; `xai` is an alias of `grok`."""
+
+        return ProviderKind.grok if self is ProviderKind.xai else self
+
 
 class RunStatus(StrEnum):
     """Terminal status for a full USS run."""
@@ -63,6 +69,10 @@ class GenerationAttemptSummary(BaseModel):
     prompt_metadata: dict[str, Any] = Field(default_factory=dict)
     output_char_count: int = 0
     output_preview: str = ""
+    streamed: bool = False
+    aborted: bool = False
+    time_to_first_token_ms: int | None = None
+    duration_ms: int | None = None
 
 
 class GenerationRunReport(BaseModel):
@@ -118,6 +128,10 @@ def build_attempt_summaries(attempts: list[Any]) -> list[GenerationAttemptSummar
                 prompt_metadata=prompt_metadata,
                 output_char_count=len(output),
                 output_preview=_preview(output),
+                streamed=bool(getattr(attempt, "streamed", False)),
+                aborted=bool(getattr(attempt, "aborted", False)),
+                time_to_first_token_ms=getattr(attempt, "time_to_first_token_ms", None),
+                duration_ms=getattr(attempt, "duration_ms", None),
             )
         )
     return summaries
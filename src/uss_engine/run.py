@@ -4,18 +4,43 @@ from __future__ import annotations
 
 import hashlib
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
-
-from pydantic import BaseModel
-
-from .clients import AnthropicClient, GeminiClient, GrokClient, OllamaClient, OpenAIClient, StaticLLMClient
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from .clients import (
+    AnthropicClient,
+    CachedLLMClient,
+    GeminiClient,
+    GrokClient,
+    OllamaClient,
+    OpenAIClient,
+    ResponseCache,
+    StaticLLMClient,
+    client_fingerprint,
+)
 from .clients.base import LLMClient
-from .evidence import build_evidence_map, validate_evidence_map
-from .generator import GenerationConfig, GenerationResult, generate_summary
-from .inspector import inspect_text
-from .prompt_compiler import load_protocol
-from .redactor import RedactionConfig
+from .compact_thread import CompactThread
+from .evidence import (
+    EvidenceIndex,
+    EvidenceMap,
+    EvidenceValidationReport,
+    build_evidence_map,
+    validate_evidence_map,
+)
+from .generator import GenerationAttempts, GenerationConfig, GenerationResult, run_generation_attempts
+from .inspector import ArtifactInspection, inspect_precomputed
+from .prompt_compiler import RuntimePrompt, compile_runtime_prompt, load_protocol
+from .redactor import (
+    RedactionConfig,
+    RedactionReport,
+    RedactionResult,
+    redact_thread,
+    redaction_fingerprint,
+    shared_redaction_cache,
+)
 from .reports import (
     GenerationRunReport,
     ProviderKind,
@@ -25,8 +50,11 @@ from .reports import (
     now_utc,
     write_json_report,
 )
-from .schema import InvocationMode
-from .transcript import NormalizedThread, load_thread
+from .schema import InvocationMode, ValidationReport
+from .stages import STAGE_DIR_NAME, StageStore, content_hash, file_hash
+from .thread_cache import ThreadCache
+from .transcript import NormalizedThread, construct_thread, load_thread
+from .validator import as_parsed_artifact, validate_text
 
 
 class E2ERunResult(BaseModel):
@@ -35,6 +63,15 @@ class E2ERunResult(BaseModel):
     report: GenerationRunReport
     generation: GenerationResult
     output_paths: ReportArtifactPaths
+    executed_stages: list[str] = Field(default_factory=list)
+    skipped_stages: list[str] = Field(default_factory=list)
+
+
+class EvidenceStageResult(BaseModel):
+    """Cached output of the evidence stage."""
+
+    evidence_map: EvidenceMap
+    evidence_validation: EvidenceValidationReport
 
 
 @dataclass(slots=True)
@@ -49,6 +86,9 @@ class RunConfig:
     redaction: RedactionConfig | None = None
     static_candidate_path: str | Path | None = None
     fail_on_invalid: bool = False
+    cache_dir: str | Path | None = None
+    incremental: bool = False
+    thread_cache_dir: str | Path | None = None
 
     def __post_init__(self) -> None:
         self.mode = InvocationMode(self.mode)
@@ -64,6 +104,7 @@ def run_uss_pipeline(
     protocol_path: str | Path = "protocols/uss_v1_3.protocol.json",
     config: RunConfig | None = None,
     client: LLMClient | None = None,
+    protocol: dict[str, Any] | None = None,
 ) -> E2ERunResult:
     """Execute the complete v1.0 MVP pipeline and write all expected artifacts.
 
@@ -74,6 +115,20 @@ def run_uss_pipeline(
     - evidence_map.json
     - inspection_report.json
     - generation_report.json
+
+    Pass an already loaded `protocol` to skip reading `protocol_path` again; the
+    path is still recorded in the generation report. With `RunConfig.cache_dir`
+    set, provider completions are served from an on-disk response cache whenever
+    the compiled prompt is unchanged (static runs are never cached), and redaction
+    results are cached per message body under `cache_dir/redaction`.
+
+    With `RunConfig.incremental` each stage's output is stored under
+    `output_dir/.uss_stages` keyed by a hash of its inputs and code version, and a
+    rerun skips every stage whose key is unchanged (see `stages`). With
+    `RunConfig.thread_cache_dir` an unchanged transcript is loaded from the
+    normalized-thread cache instead of being parsed again (see `thread_cache`);
+    combined with `incremental`, a transcript that was only appended to is
+    parsed from its last checkpoint on.
     """
 
     cfg = config or RunConfig()
@@ -85,38 +140,104 @@ def run_uss_pipeline(
     output_root.mkdir(parents=True, exist_ok=True)
     paths = _artifact_paths(output_root)
 
-    protocol = load_protocol(protocol_path)
-    thread = load_thread(thread_path)
-    selected_client = client or build_provider_client(
-        provider=cfg.provider,
-        model=cfg.model,
-        thread=thread,
-        mode=cfg.mode,
-        candidate_path=cfg.static_candidate_path,
+    if protocol is None:
+        protocol = load_protocol(protocol_path)
+    protocol_version = str(protocol.get("version", "1.3"))
+    store = StageStore(output_root / STAGE_DIR_NAME if cfg.incremental else None)
+    thread_cache = None if cfg.thread_cache_dir is None else ThreadCache(Path(cfg.thread_cache_dir))
+
+    thread, thread_hash = store.run(
+        "normalize",
+        {"source": file_hash(thread_path), "suffix": Path(thread_path).suffix.lower()},
+        lambda: load_thread(
+            thread_path, cache=thread_cache, incremental=cfg.incremental and thread_cache is not None
+        ),
+        NormalizedThread,
+        load=construct_thread,
     )
 
     errors: list[str] = []
     warnings: list[str] = []
 
+    redaction_cfg = cfg.redaction or RedactionConfig()
+    if cfg.cache_dir is not None and redaction_cfg.cache is None:
+        redaction_cfg = replace(redaction_cfg, cache=shared_redaction_cache(str(Path(cfg.cache_dir) / "redaction")))
+
     try:
-        generation = generate_summary(
-            protocol=protocol,
-            thread=thread,
-            mode=cfg.mode,
-            client=selected_client,
-            config=GenerationConfig(
-                max_attempts=cfg.max_attempts,
+        redaction, redaction_hash = store.run(
+            "redact",
+            {"thread": thread_hash, "config": redaction_fingerprint(redaction_cfg)},
+            lambda: redact_thread(thread, redaction_cfg),
+            RedactionResult,
+            load=_load_redaction_result,
+        )
+        for rule in redaction.report.disabled_rules:
+            warnings.append(f"Redaction rule disabled ({rule.description}: {rule.pattern}): {rule.reason}.")
+        runtime_prompt, prompt_hash = store.run(
+            "compile",
+            {
+                "redaction": redaction_hash,
+                "protocol": content_hash(protocol),
+                "mode": cfg.mode.value,
+                "max_transcript_chars": cfg.max_transcript_chars,
+            },
+            lambda: compile_runtime_prompt(
+                protocol=protocol,
+                thread=redaction.thread,
+                mode=cfg.mode,
                 max_transcript_chars=cfg.max_transcript_chars,
-                redaction=cfg.redaction,
+                redaction_report=redaction.report,
             ),
+            RuntimePrompt,
         )
+
+        def _generate() -> GenerationAttempts:
+            selected_client = client or build_provider_client(
+                provider=cfg.provider,
+                model=cfg.model,
+                thread=thread,
+                mode=cfg.mode,
+                candidate_path=cfg.static_candidate_path,
+            )
+            if cfg.cache_dir is not None and not isinstance(selected_client, StaticLLMClient):
+                selected_client = CachedLLMClient(
+                    selected_client,
+                    ResponseCache(Path(cfg.cache_dir)),
+                    provider=cfg.provider.canonical.value,
+                )
+            return run_generation_attempts(
+                runtime_prompt=runtime_prompt,
+                protocol_version=protocol_version,
+                client=selected_client,
+                config=GenerationConfig(max_attempts=cfg.max_attempts),
+            )
+
+        injected_fingerprint = client_fingerprint(client) if client is not None else None
+        if client is not None and injected_fingerprint is None:
+            # Nothing tells this client apart from another of its class, so its
+            # generation is never reused.
+            attempts = _generate()
+            store.mark_executed("generate")
+        else:
+            attempts, _ = store.run(
+                "generate",
+                {
+                    "prompt": prompt_hash,
+                    "provider": cfg.provider.value,
+                    "model": cfg.model,
+                    "max_attempts": cfg.max_attempts,
+                    "candidate": file_hash(cfg.static_candidate_path) if cfg.static_candidate_path else None,
+                    "client": injected_fingerprint,
+                },
+                _generate,
+                GenerationAttempts,
+            )
     except Exception as exc:  # pragma: no cover - defensive fatal report path
         finished_at = now_utc()
         duration_ms = int((time.perf_counter() - started_monotonic) * 1000)
-        validation_stub = __import__("uss_engine.schema", fromlist=["ValidationReport"]).ValidationReport.from_issues(
-            issues=[], mode=cfg.mode, protocol_version=str(protocol.get("version", "1.3"))
+        validation_stub = ValidationReport.from_issues(
+            issues=[], mode=cfg.mode, protocol_version=protocol_version
         )
-        redaction_stub = __import__("uss_engine.redactor", fromlist=["RedactionReport"]).RedactionReport.from_hits([])
         report = build_run_report(
             run_id=run_id,
             status=RunStatus.failed_generation,
@@ -130,7 +251,7 @@ def run_uss_pipeline(
             protocol_path=str(protocol_path),
             output_paths=paths,
             validation_report=validation_stub,
-            redaction_report=redaction_stub,
+            redaction_report=RedactionReport.from_hits([]),
             inspection=None,
             attempts=[],
             errors=[str(exc)],
@@ -138,22 +259,77 @@ def run_uss_pipeline(
         write_json_report(report, paths.generation_report_json)
         raise
 
+    # The attempt loop already validated the final output; the validate stage only
+    # re-runs the validator when generation was reused from an earlier run.
+    generate_ran = "generate" in store.executed
+    final_report, _ = store.run(
+        "validate",
+        {"output": content_hash(attempts.final_output), "mode": cfg.mode.value},
+        lambda: attempts.final_report if generate_ran else validate_text(attempts.final_output, mode=cfg.mode),
+        ValidationReport,
+    )
+    generation = GenerationResult(
+        valid=final_report.valid,
+        mode=cfg.mode,
+        attempts=attempts.attempts,
+        final_output=attempts.final_output,
+        final_report=final_report,
+        redaction_report=redaction.report,
+        redacted_thread=redaction.thread,
+    )
+
     paths_summary = Path(paths.summary_md)
     paths_summary.write_text(generation.final_output.rstrip() + "\n", encoding="utf-8")
     write_json_report(generation.final_report, paths.validation_report_json)
     write_json_report(generation.redaction_report, paths.redaction_report_json)
 
-    evidence_map = build_evidence_map(
-        summary_text=generation.final_output,
-        thread=generation.redacted_thread,
-        artifact_id=str(paths_summary),
+    # The summary is parsed once for evidence mapping and inspection, and the
+    # evidence map and its validation are handed to the inspector as-is.
+    parsed_summary = as_parsed_artifact(generation.final_output)
+
+    def _evidence() -> EvidenceStageResult:
+        evidence_index = EvidenceIndex.from_thread(generation.redacted_thread)
+        built_map = build_evidence_map(
+            summary_text=parsed_summary,
+            thread=generation.redacted_thread,
+            artifact_id=str(paths_summary),
+            index=evidence_index,
+        )
+        return EvidenceStageResult(
+            evidence_map=built_map,
+            evidence_validation=validate_evidence_map(built_map, generation.redacted_thread, index=evidence_index),
+        )
+
+    evidence, evidence_hash = store.run(
+        "evidence",
+        {
+            "output": content_hash(generation.final_output),
+            "thread": redaction_hash,
+            "artifact_id": str(paths_summary),
+        },
+        _evidence,
+        EvidenceStageResult,
     )
-    evidence_validation = validate_evidence_map(evidence_map, generation.redacted_thread)
-    inspection = inspect_text(
-        summary_text=generation.final_output,
-        thread=generation.redacted_thread,
-        artifact_path=str(paths_summary),
-        thread_path=str(thread_path),
+    evidence_map = evidence.evidence_map
+    evidence_validation = evidence.evidence_validation
+    inspection, _ = store.run(
+        "inspect",
+        {
+            "output": content_hash(generation.final_output),
+            "evidence": evidence_hash,
+            "artifact_path": str(paths_summary),
+            "thread_path": str(thread_path),
+        },
+        # Inspection validates without the requested mode, as `inspect_text`
+        # does, so a mode mismatch is reported by validation alone.
+        lambda: inspect_precomputed(
+            validation_report=validate_text(parsed_summary),
+            evidence_map=evidence_map,
+            evidence_validation=evidence_validation,
+            artifact_path=str(paths_summary),
+            thread_path=str(thread_path),
+        ),
+        ArtifactInspection,
     )
 
     write_json_report(evidence_map, paths.evidence_map_json)
@@ -196,10 +372,18 @@ def run_uss_pipeline(
     )
     write_json_report(report, paths.generation_report_json)
 
+    store.mark_executed("report")
+
     if cfg.fail_on_invalid and not report.valid:
         raise RuntimeError("USS run completed but produced an invalid artifact")
 
-    return E2ERunResult(report=report, generation=generation, output_paths=paths)
+    return E2ERunResult(
+        report=report,
+        generation=generation,
+        output_paths=paths,
+        executed_stages=store.executed,
+        skipped_stages=store.skipped,
+    )
 
 
 def build_provider_client(
@@ -240,7 +424,14 @@ def build_provider_client(
     raise ValueError(f"Unsupported provider: {provider}")
 
 
-def render_static_uss_summary(*, thread: NormalizedThread, mode: InvocationMode | str) -> str:
+def _load_redaction_result(output: dict[str, Any]) -> RedactionResult:
+    # Stage records are written by this package, so the thread skips re-validation.
+    return RedactionResult(
+        thread=construct_thread(output["thread"]), report=RedactionReport.model_validate(output["report"])
+    )
+
+
+def render_static_uss_summary(*, thread: NormalizedThread | CompactThread, mode: InvocationMode | str) -> str:
     """Render a deterministic USS artifact for static E2E testing.
 
     This is not a substitute for LLM generation. It is a contract fixture that
@@ -0,0 +1,392 @@
+"""Secret scanner for repositories and vaults.
+
+`scan_paths` walks files with `os.scandir`, runs the compiled redaction rules in
+detection-only mode (no redacted text is built) across a process pool, and
+returns findings with line and column positions. Results are cached per file
+under its (mtime, size) together with the rule fingerprint, so a repeated
+pre-commit run only reads the files that changed. Findings never include the
+matched text.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import StrEnum
+from itertools import repeat
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from . import __version__
+from .redactor import (
+    DisabledRule,
+    RedactionCategory,
+    RedactionConfig,
+    RedactionRule,
+    compile_rules,
+    rules_fingerprint,
+    run_with_time_budget,
+    screen_rules,
+    select_rules,
+)
+from .stages import STAGE_DIR_NAME
+
+SCAN_CACHE_VERSION = 1
+DEFAULT_SCAN_CACHE = ".uss_scan_cache.json"
+DEFAULT_MAX_FILE_BYTES = 2 * 1024 * 1024
+DEFAULT_EXCLUDED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".tox",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        STAGE_DIR_NAME,
+    }
+)
+_BINARY_SNIFF_BYTES = 8192
+_FILES_PER_TASK = 64
+# `_scan_files` result for a binary file; unlike an unreadable file it is cached.
+_BINARY = "binary"
+
+
+class ScanFormat(StrEnum):
+    text = "text"
+    json = "json"
+    sarif = "sarif"
+
+
+class ScanFinding(BaseModel):
+    """One detector match. Positions are 1-based lines/columns and 0-based offsets."""
+
+    path: str
+    category: RedactionCategory
+    description: str
+    line: int
+    column: int
+    start: int
+    end: int
+
+
+class ScanResult(BaseModel):
+    fingerprint: str
+    files_scanned: int = 0
+    files_cached: int = 0
+    files_skipped: int = 0
+    duration_ms: int = 0
+    findings: list[ScanFinding] = Field(default_factory=list)
+    disabled_rules: list[DisabledRule] = Field(default_factory=list)
+
+    @property
+    def clean(self) -> bool:
+        return not self.findings
+
+
+@dataclass(slots=True)
+class ScanConfig:
+    """Scanner settings. `cache_path=None`, the default, disables the file cache;
+    see `default_cache_path` for where the CLI keeps it.
+    """
+
+    redaction: RedactionConfig = field(default_factory=RedactionConfig)
+    workers: int | None = None
+    cache_path: str | Path | None = None
+    max_file_bytes: int = DEFAULT_MAX_FILE_BYTES
+    excluded_dirs: frozenset[str] = DEFAULT_EXCLUDED_DIRS
+
+    def __post_init__(self) -> None:
+        if self.workers is not None and self.workers < 1:
+            raise ValueError("workers must be at least 1")
+
+
+# (category, description, line, column, start, end) as stored in the cache.
+_Detection = tuple[str, str, int, int, int, int]
+
+
+def default_cache_path(paths: Iterable[str | Path]) -> Path:
+    """Return the cache file inside the first scanned directory (a file's directory)."""
+
+    first = Path(next(iter(paths), "."))
+    return (first if first.is_dir() else first.parent) / DEFAULT_SCAN_CACHE
+
+
+def scan_paths(paths: Iterable[str | Path], config: ScanConfig | None = None) -> ScanResult:
+    """Scan files and directories for secrets, reusing cached results for unchanged files.
+
+    Cache entries under the scanned paths for files the walk no longer finds are
+    dropped; entries for paths outside this scan are kept.
+    """
+
+    cfg = config or ScanConfig()
+    paths = list(paths)
+    started = time.perf_counter()
+    rules, disabled = screen_rules(select_rules(cfg.redaction))
+    fingerprint = rules_fingerprint(rules)
+    cache_file = None if cfg.cache_path is None else os.path.abspath(cfg.cache_path)
+    cache = _load_cache(cache_file, fingerprint)
+
+    detections: dict[str, list[_Detection]] = {}
+    pending: list[tuple[str, int, int]] = []
+    cached = skipped = 0
+    dirty = False
+    seen: set[str] = set()
+    for path, mtime_ns, size in iter_files(paths, excluded_dirs=cfg.excluded_dirs, skip={cache_file}):
+        seen.add(path)
+        entry = cache.get(path)
+        if entry is not None and entry[0] == mtime_ns and entry[1] == size:
+            if entry[2] is None:
+                skipped += 1
+            else:
+                detections[path] = [tuple(item) for item in entry[2]]  # type: ignore[misc]
+                cached += 1
+            continue
+        # Oversized and unreadable files are never cached; binary files are
+        # cached as skipped so they are not re-read on every run.
+        dirty = cache.pop(path, None) is not None or dirty
+        if size > cfg.max_file_bytes:
+            skipped += 1
+            continue
+        pending.append((path, mtime_ns, size))
+    roots = tuple(os.path.abspath(root) for root in paths)
+    stale = [path for path in cache if path not in seen and _is_under(path, roots)]
+    for path in stale:
+        del cache[path]
+    dirty = dirty or bool(stale)
+
+    scanned = 0
+    results, disabled_at_runtime = _scan_pending(
+        rules, [item[0] for item in pending], cfg.workers, cfg.redaction.rule_timeout_seconds
+    )
+    disabled.extend(disabled_at_runtime)
+    for (path, mtime_ns, size), found in zip(pending, results):
+        if found is None or found == _BINARY:
+            skipped += 1
+            if found == _BINARY:
+                cache[path] = [mtime_ns, size, None]
+                dirty = True
+            continue
+        scanned += 1
+        detections[path] = found
+        cache[path] = [mtime_ns, size, [list(item) for item in found]]
+        dirty = True
+
+    findings = [
+        ScanFinding(
+            path=_display_path(path),
+            category=RedactionCategory(category),
+            description=description,
+            line=line,
+            column=column,
+            start=start,
+            end=end,
+        )
+        for path in sorted(detections)
+        for category, description, line, column, start, end in detections[path]
+    ]
+    # Results produced after a rule was disabled do not reflect the full rule set.
+    if cache_file is not None and dirty and not disabled_at_runtime:
+        _save_cache(cache_file, fingerprint, cache)
+    return ScanResult(
+        fingerprint=fingerprint,
+        files_scanned=scanned,
+        files_cached=cached,
+        files_skipped=skipped,
+        duration_ms=int((time.perf_counter() - started) * 1000),
+        findings=findings,
+        disabled_rules=disabled,
+    )
+
+
+def iter_files(
+    paths: Iterable[str | Path],
+    *,
+    excluded_dirs: frozenset[str] = DEFAULT_EXCLUDED_DIRS,
+    skip: set[str | None] | None = None,
+) -> Iterator[tuple[str, int, int]]:
+    """Yield `(absolute_path, mtime_ns, size)` for regular files under `paths`.
+
+    Symlinks are not followed and directories named in `excluded_dirs` are pruned.
+    Raises FileNotFoundError for a root that does not exist.
+    """
+
+    skipped = skip or set()
+    for root in paths:
+        root_path = os.path.abspath(root)
+        if not os.path.exists(root_path):
+            raise FileNotFoundError(f"no such file or directory: {root}")
+        if os.path.isfile(root_path):
+            if root_path not in skipped:
+                stat = os.stat(root_path)
+                yield root_path, stat.st_mtime_ns, stat.st_size
+            continue
+        stack = [root_path]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    children = sorted(entries, key=lambda entry: entry.name, reverse=True)
+            except OSError:
+                continue
+            for entry in children:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in excluded_dirs:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.path not in skipped:
+                    stat = entry.stat(follow_symlinks=False)
+                    yield entry.path, stat.st_mtime_ns, stat.st_size
+
+
+def _is_under(path: str, roots: tuple[str, ...]) -> bool:
+    return any(path == root or path.startswith(root.rstrip(os.sep) + os.sep) for root in roots)
+
+
+def _display_path(path: str) -> str:
+    relative = os.path.relpath(path)
+    return path if relative.startswith("..") else relative
+
+
+def detect_secrets(text: str, rules: tuple[RedactionRule, ...]) -> list[_Detection]:
+    """Return detections in `text` without building redacted output."""
+
+    engine = compile_rules(rules).narrow(text)
+    if engine is None:
+        return []
+    # Rules that cannot be combined are applied one after another; offsets
+    # still refer to `text`.
+    found = engine.iter_matches(text) if engine.pattern is not None else engine.sequential_matches(text)
+    matches = [(rule.category, rule.description, start, end) for start, end, rule, _ in found]
+
+    detections: list[_Detection] = []
+    line, line_start, position = 1, 0, 0
+    for category, description, start, end in matches:
+        newlines = text.count("\n", position, start)
+        if newlines:
+            line += newlines
+            line_start = text.rindex("\n", position, start) + 1
+        position = start
+        detections.append((category.value, description, line, start - line_start + 1, start, end))
+    return detections
+
+
+def to_sarif(result: ScanResult) -> dict[str, Any]:
+    """Return `result` as a SARIF 2.1.0 log."""
+
+    descriptions: dict[str, str] = {}
+    for finding in result.findings:
+        descriptions.setdefault(finding.category.value, finding.description)
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "uss-scan",
+                        "version": __version__,
+                        "rules": [
+                            {"id": category, "shortDescription": {"text": description}}
+                            for category, description in sorted(descriptions.items())
+                        ],
+                    }
+                },
+                "results": [
+                    {
+                        "ruleId": finding.category.value,
+                        "level": "error",
+                        "message": {"text": f"Possible {finding.description} detected."},
+                        "locations": [
+                            {
+                                "physicalLocation": {
+                                    "artifactLocation": {"uri": Path(finding.path).as_posix()},
+                                    "region": {"startLine": finding.line, "startColumn": finding.column},
+                                }
+                            }
+                        ],
+                    }
+                    for finding in result.findings
+                ],
+            }
+        ],
+    }
+
+
+def _scan_pending(
+    rules: tuple[RedactionRule, ...], paths: list[str], workers: int | None, timeout: float | None
+) -> tuple[list[list[_Detection] | str | None], list[DisabledRule]]:
+    tasks = [paths[index : index + _FILES_PER_TASK] for index in range(0, len(paths), _FILES_PER_TASK)]
+    worker_count = min(workers or os.cpu_count() or 1, len(tasks))
+    if worker_count <= 1:
+        results: list[list[_Detection] | str | None] = []
+        disabled: list[DisabledRule] = []
+        for task in tasks:
+            task_results, task_disabled = _scan_files(rules, task, timeout)
+            results.extend(task_results)
+            disabled.extend(task_disabled)
+        return results, disabled
+    results = []
+    seen: dict[str, DisabledRule] = {}
+    with ProcessPoolExecutor(max_workers=worker_count) as pool:
+        for task_results, task_disabled in pool.map(_scan_files, repeat(rules), tasks, repeat(timeout)):
+            results.extend(task_results)
+            for rule in task_disabled:
+                seen.setdefault(rule.pattern, rule)
+    return results, list(seen.values())
+
+
+def _scan_files(
+    rules: tuple[RedactionRule, ...], paths: list[str], timeout: float | None = None
+) -> tuple[list[list[_Detection] | str | None], list[DisabledRule]]:
+    results: list[list[_Detection] | str | None] = []
+    disabled: list[DisabledRule] = []
+    for path in paths:
+        try:
+            with open(path, "rb") as handle:
+                data = handle.read()
+        except OSError:
+            results.append(None)
+            continue
+        if b"\0" in data[:_BINARY_SNIFF_BYTES]:
+            results.append(_BINARY)
+            continue
+        text = data.decode("utf-8", errors="replace")
+        found, rules, newly_disabled = run_with_time_budget(
+            rules, text, timeout, lambda active: detect_secrets(text, active)
+        )
+        disabled.extend(newly_disabled)
+        results.append(found)
+    return results, disabled
+
+
+def _load_cache(path: str | None, fingerprint: str) -> dict[str, list[Any]]:
+    if path is None:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as handle:
+            record = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(record, dict) or record.get("version") != SCAN_CACHE_VERSION:
+        return {}
+    if record.get("fingerprint") != fingerprint:
+        return {}
+    files = record.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_cache(path: str, fingerprint: str, files: dict[str, list[Any]]) -> None:
+    record = {"version": SCAN_CACHE_VERSION, "fingerprint": fingerprint, "files": files}
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        handle.write(json.dumps(record, separators=(",", ":")))
+    os.replace(tmp_path, path)
@@ -0,0 +1,154 @@
+"""Incremental stage cache for the USS Engine pipeline.
+
+`run_uss_pipeline` runs as a fixed chain of stages:
+
+    normalize -> redact -> compile -> generate -> validate -> evidence -> inspect -> report
+
+Each cacheable stage is keyed by a hash of its inputs (upstream output hashes,
+the settings that affect it) plus a code version derived from the source of the
+modules that implement it. When a stage's key matches the one recorded in the
+stage directory its stored output is reused; otherwise it re-executes, and every
+downstream stage whose inputs changed follows. Changing only `RedactionConfig`
+therefore re-runs redaction onward, while changing scoring weights re-runs only
+inspection. The report stage is always rebuilt because it records run timing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+STAGE_ORDER = ("normalize", "redact", "compile", "generate", "validate", "evidence", "inspect", "report")
+STAGE_DIR_NAME = ".uss_stages"
+
+# Modules (or subpackages) whose source determines each stage's behaviour.
+# Editing one of these files invalidates that stage (and, through changed
+# outputs, its dependents).
+STAGE_CODE_MODULES: dict[str, tuple[str, ...]] = {
+    "normalize": ("transcript", "compact_thread", "thread_cache"),
+    "redact": ("redactor", "compact_thread"),
+    # The compiled prompt embeds `RedactionReport.compact()`.
+    "compile": ("prompt_compiler", "redactor"),
+    # The attempt loop validates (and may abort) each candidate.
+    "generate": ("generator", "prompt_compiler", "clients", "validator"),
+    "validate": ("validator", "schema"),
+    "evidence": ("evidence", "evidence_matrix", "validator"),
+    "inspect": ("inspector", "scoring", "validator"),
+}
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class StageRecord(BaseModel):
+    """Stored output of one stage, as written to `<stage>.json`."""
+
+    stage: str
+    key: str
+    output_hash: str
+    output: Any
+
+
+@dataclass(slots=True)
+class StageStore:
+    """Per-run stage cache rooted at `directory`.
+
+    With `directory=None` nothing is read or written and every stage executes,
+    which is how non-incremental runs share the same code path.
+    """
+
+    directory: Path | None = None
+    executed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+
+    def run(
+        self,
+        stage: str,
+        inputs: dict[str, Any],
+        compute: Callable[[], ModelT],
+        model: type[ModelT],
+        load: Callable[[Any], ModelT] | None = None,
+    ) -> tuple[ModelT, str]:
+        """Return `(output, output_hash)`, reusing the stored output when the key matches.
+
+        Without a directory the stage always executes and the hash is empty, since
+        no downstream key will be stored. Stored outputs are rebuilt with
+        `model.model_validate` unless a trusted `load` function is given.
+        """
+
+        path = self._path(stage)
+        if path is None:
+            value = compute()
+            self.executed.append(stage)
+            return value, ""
+
+        key = stage_key(stage, inputs)
+        if path.exists():
+            try:
+                record = StageRecord.model_validate_json(path.read_text(encoding="utf-8"))
+                if record.key == key:
+                    value = (load or model.model_validate)(record.output)
+                    self.skipped.append(stage)
+                    return value, record.output_hash
+            except ValueError:
+                # A corrupt or outdated record is simply recomputed.
+                pass
+
+        value = compute()
+        payload = value.model_dump(mode="json")
+        output_hash = content_hash(payload)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = StageRecord(stage=stage, key=key, output_hash=output_hash, output=payload)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(record.model_dump_json(), encoding="utf-8")
+        tmp_path.replace(path)
+        self.executed.append(stage)
+        return value, output_hash
+
+    def mark_executed(self, stage: str) -> None:
+        self.executed.append(stage)
+
+    def _path(self, stage: str) -> Path | None:
+        return None if self.directory is None else self.directory / f"{stage}.json"
+
+
+def stage_key(stage: str, inputs: dict[str, Any]) -> str:
+    return content_hash({"stage": stage, "code": code_version(stage), "inputs": inputs})
+
+
+def content_hash(value: Any) -> str:
+    """sha256 over canonical JSON; pydantic models are dumped in JSON mode first."""
+
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json")
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def file_hash(path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def code_version(stage: str) -> str:
+    """Hash of the source files implementing `stage`."""
+
+    package_dir = Path(__file__).resolve().parent
+    digest = hashlib.sha256()
+    for module in STAGE_CODE_MODULES.get(stage, ()):
+        subpackage = package_dir / module
+        sources = sorted(subpackage.rglob("*.py")) if subpackage.is_dir() else [package_dir / f"{module}.py"]
+        for source in sources:
+            digest.update(source.relative_to(package_dir).as_posix().encode("utf-8"))
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
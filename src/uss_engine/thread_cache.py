@@ -0,0 +1,338 @@
+"""Binary on-disk cache of normalized threads.
+
+`ThreadCache` keeps every thread that `load_thread(path, cache=...)` normalizes
+in one append-only file, `threads.bin`, inside the cache directory. Each record
+is length-prefixed:
+
+    header   magic, key CRC32, payload CRC32, key length, payload length
+    key      JSON: source path, size, mtime_ns, sha256, normalizer version
+    payload  marshal-encoded `NormalizedThread.model_dump(mode="json")`
+
+Opening the cache reads only headers and keys, seeking over payloads. A source
+whose path, size and mtime match its latest record is served without reading
+the source again; when only the mtime differs the source is hashed and the
+record is reused if the content is unchanged. The normalizer version covers the
+transcript module source and the interpreter's marshal format, so a code or
+Python upgrade turns every record into a miss.
+
+Records written by `load(path, incremental=True)` also carry the
+`ParseCheckpoint` of their parse. When such a source has grown and its first
+`size` bytes still hash to the recorded sha256, only the appended bytes are
+parsed, and the new record is a delta: its key names the base record (by file
+offset and sha256) and how many of the base's messages to keep, and its payload
+holds only the messages that follow them. Chains are capped at
+`MAX_DELTA_CHAIN` records, after which a full record is written again.
+
+Records no longer reachable from the latest record of any source stay in the
+file until they outweigh the live ones; the file is then rewritten with one
+full record per source. A torn or corrupt record ends the scan and is discarded
+by the next rewrite.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from .stages import code_version, file_hash
+from .transcript import NormalizedThread, ParseCheckpoint, construct_thread, load_thread, parse_appended, resume_thread
+
+THREAD_CACHE_FILE = "threads.bin"
+MAX_DELTA_CHAIN = 16
+_MAGIC = b"USTC"
+_HEADER = struct.Struct("<4sIIIQ")
+_DELTA_KEYS = ("base", "base_sha256", "keep")
+
+
+@dataclass(slots=True)
+class _Record:
+    key: dict[str, Any]
+    start: int
+    size: int
+    payload_crc: int
+    payload_length: int
+
+    @property
+    def payload_offset(self) -> int:
+        return self.start + self.size - self.payload_length
+
+
+@dataclass(slots=True)
+class ThreadCache:
+    """Directory holding a single length-prefixed record file of normalized threads."""
+
+    directory: Path
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    resumed: int = field(default=0, init=False)
+    _records: dict[int, _Record] = field(default_factory=dict, init=False)
+    _latest: dict[str, _Record] = field(default_factory=dict, init=False)
+    _file_id: tuple[int, int] | None = field(default=None, init=False)
+    _scanned: int = field(default=0, init=False)
+    _torn_bytes: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory)
+
+    @property
+    def path(self) -> Path:
+        return self.directory / THREAD_CACHE_FILE
+
+    def load(self, source: str | Path, *, incremental: bool = False) -> NormalizedThread:
+        """Return the normalized thread for `source`, normalizing and storing it on a miss.
+
+        With `incremental=True` records carry a parse checkpoint, and a source
+        that only grew since its record was stored is parsed from that
+        checkpoint on (see `parse_appended`) instead of from the start.
+        """
+
+        source_path = os.path.abspath(source)
+        stat = os.stat(source_path)
+        self._refresh()
+        record = self._latest.get(source_path)
+        digest = None
+        if record is not None and record.key["size"] == stat.st_size:
+            if record.key["mtime_ns"] != stat.st_mtime_ns:
+                digest = file_hash(source_path)
+            if digest is None or record.key["sha256"] == digest:
+                data = self._data(record)
+                if data is not None:
+                    self.hits += 1
+                    if digest is not None:
+                        # Touched but unchanged: re-key the same payload under the new mtime.
+                        payload = self._payload(record)
+                        if payload is not None:
+                            self._append({**record.key, "mtime_ns": stat.st_mtime_ns}, payload)
+                    return construct_thread(data)
+
+        if incremental:
+            return self._resume(source_path, stat, record)
+        self.misses += 1
+        thread = load_thread(source_path)
+        payload = marshal.dumps(thread.model_dump(mode="json"))
+        self._append(_key(source_path, stat, digest or file_hash(source_path)), payload)
+        return thread
+
+    def compact(self) -> None:
+        """Rewrite the record file as one full record per source, dropping everything else."""
+
+        self._refresh()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".bin")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                for record in self._latest.values():
+                    data = self._data(record)
+                    if data is not None:
+                        key = {name: value for name, value in record.key.items() if name not in _DELTA_KEYS}
+                        handle.write(_encode_record(key, marshal.dumps(data)))
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._refresh()
+
+    def _resume(self, source_path: str, stat: os.stat_result, record: _Record | None) -> NormalizedThread:
+        stored = record.key.get("checkpoint") if record is not None else None
+        if record is not None and stored is not None and stat.st_size > record.key["size"]:
+            # Resuming is only sound when the stored bytes are an unchanged prefix.
+            prefix_digest, digest = _file_digests(source_path, record.key["size"], stat.st_size)
+            data = self._data(record) if prefix_digest == record.key["sha256"] else None
+            if data is not None:
+                thread = self._append_tail(source_path, stat, digest, record, data, ParseCheckpoint.from_dict(stored))
+                if thread is not None:
+                    return thread
+        else:
+            _, digest = _file_digests(source_path, 0, stat.st_size)
+
+        self.misses += 1
+        thread, checkpoint = resume_thread(source_path, size=stat.st_size)
+        self._append(_key(source_path, stat, digest, checkpoint), marshal.dumps(thread.model_dump(mode="json")))
+        return thread
+
+    def _append_tail(
+        self,
+        source_path: str,
+        stat: os.stat_result,
+        digest: str,
+        record: _Record,
+        data: dict[str, Any],
+        checkpoint: ParseCheckpoint,
+    ) -> NormalizedThread | None:
+        keep = checkpoint.messages
+        messages = data["messages"]
+        open_id = messages[keep]["id"] if keep < len(messages) else None
+        appended = parse_appended(source_path, checkpoint, size=stat.st_size, open_message_id=open_id)
+        if appended is None:
+            return None
+        new_messages, next_checkpoint = appended
+        tail = [message.model_dump(mode="json") for message in new_messages]
+        key = _key(source_path, stat, digest, next_checkpoint)
+        del messages[keep:]
+        messages.extend(tail)
+        if self._chain_length(record) < MAX_DELTA_CHAIN:
+            key.update(base=record.start, base_sha256=record.key["sha256"], keep=keep)
+            payload = marshal.dumps(tail)
+        else:
+            payload = marshal.dumps(data)
+        self.resumed += 1
+        self._append(key, payload)
+        return construct_thread(data)
+
+    def _refresh(self) -> None:
+        # Pick up records appended since the last scan, including by other processes.
+        try:
+            handle = self.path.open("rb")
+        except FileNotFoundError:
+            self._reset(None)
+            return
+        with handle:
+            stat = os.fstat(handle.fileno())
+            end = stat.st_size
+            if (stat.st_dev, stat.st_ino) != self._file_id or end < self._scanned:
+                # New file, or rewritten by another process since the last scan.
+                self._reset((stat.st_dev, stat.st_ino))
+            handle.seek(self._scanned)
+            version = normalizer_version()
+            while self._scanned + _HEADER.size <= end:
+                magic, key_crc, payload_crc, key_length, payload_length = _HEADER.unpack(handle.read(_HEADER.size))
+                size = _HEADER.size + key_length + payload_length
+                raw_key = handle.read(key_length)
+                if magic != _MAGIC or len(raw_key) != key_length or zlib.crc32(raw_key) != key_crc:
+                    break
+                if self._scanned + size > end:
+                    break
+                try:
+                    key = json.loads(raw_key)
+                except ValueError:
+                    break
+                handle.seek(payload_length, os.SEEK_CUR)
+                if key.get("normalizer") == version:
+                    record = _Record(key, self._scanned, size, payload_crc, payload_length)
+                    self._records[record.start] = record
+                    self._latest[key["path"]] = record
+                self._scanned += size
+            # Anything past the last good record is a torn write.
+            self._torn_bytes = end - self._scanned
+
+    def _reset(self, file_id: tuple[int, int] | None) -> None:
+        self._records.clear()
+        self._latest.clear()
+        self._file_id = file_id
+        self._scanned = self._torn_bytes = 0
+
+    def _chain(self, record: _Record) -> list[_Record] | None:
+        """`record` and the records it builds on, newest first; None if a base is missing."""
+
+        chain = [record]
+        while "base" in chain[-1].key:
+            if len(chain) > MAX_DELTA_CHAIN:
+                return None
+            delta = chain[-1]
+            base = self._records.get(delta.key["base"])
+            if base is None or base.key["path"] != delta.key["path"] or base.key["sha256"] != delta.key["base_sha256"]:
+                return None
+            chain.append(base)
+        return chain
+
+    def _chain_length(self, record: _Record) -> int:
+        chain = self._chain(record)
+        return MAX_DELTA_CHAIN if chain is None else len(chain) - 1
+
+    def _data(self, record: _Record) -> dict[str, Any] | None:
+        chain = self._chain(record)
+        if chain is None:
+            return None
+        payloads = [self._payload(item) for item in reversed(chain)]
+        if any(payload is None for payload in payloads):
+            return None
+        try:
+            data = marshal.loads(payloads[0])  # type: ignore[arg-type]
+            for delta, payload in zip(reversed(chain[:-1]), payloads[1:]):
+                messages = data["messages"]
+                del messages[delta.key["keep"] :]
+                messages.extend(marshal.loads(payload))  # type: ignore[arg-type]
+        except (ValueError, EOFError, TypeError, KeyError):
+            return None
+        return data
+
+    def _payload(self, record: _Record) -> bytes | None:
+        try:
+            with self.path.open("rb") as handle:
+                handle.seek(record.payload_offset)
+                payload = handle.read(record.payload_length)
+        except OSError:
+            return None
+        if len(payload) != record.payload_length or zlib.crc32(payload) != record.payload_crc:
+            return None
+        return payload
+
+    def _append(self, key: dict[str, Any], payload: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # One write per record on an O_APPEND handle keeps concurrent writers
+        # from interleaving within a record.
+        with self.path.open("ab") as handle:
+            handle.write(_encode_record(key, payload))
+        self._refresh()
+        live: set[int] = set()
+        for record in self._latest.values():
+            live.update(item.start for item in self._chain(record) or [record])
+        live_bytes = sum(self._records[start].size for start in live)
+        if self._scanned + self._torn_bytes - live_bytes > live_bytes:
+            self.compact()
+
+
+def normalizer_version() -> str:
+    """Version tag stored with each record; a mismatch invalidates it."""
+
+    return f"{code_version('normalize')[:16]}-py{sys.version_info[0]}.{sys.version_info[1]}-m{marshal.version}"
+
+
+def _key(
+    source_path: str, stat: os.stat_result, digest: str, checkpoint: ParseCheckpoint | None = None
+) -> dict[str, Any]:
+    key: dict[str, Any] = {
+        "path": source_path,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest,
+        "normalizer": normalizer_version(),
+    }
+    if checkpoint is not None:
+        key["checkpoint"] = checkpoint.to_dict()
+    return key
+
+
+def _file_digests(path: str, prefix: int, size: int) -> tuple[str, str]:
+    """sha256 hex digests of the first `prefix` and first `size` bytes, in one read."""
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        _hash_bytes(digest, handle, prefix)
+        prefix_digest = digest.hexdigest()
+        _hash_bytes(digest, handle, size - prefix)
+    return prefix_digest, digest.hexdigest()
+
+
+def _hash_bytes(digest: Any, handle: BinaryIO, length: int) -> None:
+    while length > 0:
+        block = handle.read(min(length, 1 << 20))
+        if not block:
+            return
+        digest.update(block)
+        length -= len(block)
+
+
+def _encode_record(key: dict[str, Any], payload: bytes) -> bytes:
+    raw_key = json.dumps(key, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    header = _HEADER.pack(_MAGIC, zlib.crc32(raw_key), zlib.crc32(payload), len(raw_key), len(payload))
+    return header + raw_key + payload
@@ -7,16 +7,26 @@ LLM generation.
 
 from __future__ import annotations
 
+import gc
+import hashlib
 import json
+import mmap
+import os
 import re
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import StrEnum
 from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any
 from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+if TYPE_CHECKING:
+    from .thread_cache import ThreadCache
+
 
 class TranscriptRole(StrEnum):
     """Supported normalized speaker roles."""
@@ -50,6 +60,33 @@ ROLE_LINE_RE = re.compile(
 
 DELIMITER_RE = re.compile(r"^\s*(?:---+|===+|\*\*\*+)\s*$")
 
+MESSAGE_LIST_KEYS = ("messages", "conversation", "items")
+THREAD_KEYS = frozenset({"thread_id", "id", "source", "created_at", *MESSAGE_LIST_KEYS})
+MESSAGE_KEYS = frozenset(
+    {"id", "message_id", "role", "speaker", "author", "content", "text", "message", "timestamp", "created_at"}
+)
+STREAM_CHUNK_CHARS = 1 << 16
+
+# Marker written by `save_thread`. Files carrying it hold a dumped, already
+# validated NormalizedThread and are loaded without re-normalizing; only those
+# whose checksum verifies also skip re-validation.
+NORMALIZED_THREAD_FORMAT = "uss.normalized_thread"
+NORMALIZED_THREAD_FORMAT_VERSION = 1
+_FORMAT_KEYS = frozenset({"format", "format_version", "checksum"})
+
+# Lines that may be role lines: the role word after optional whitespace/heading
+# marks. Non-ASCII bytes and the \x1c-\x1f separators are allowed in the prefix
+# because `ROLE_LINE_RE` treats them as `\s`; every candidate is confirmed with
+# `ROLE_LINE_RE`.
+ROLE_PREFIX_RE = re.compile(
+    rb"^(?:[ \t\x1c-\x1f#]|[\x80-\xff])*(?:system|developer|user|human|me|assistant|ai|chatgpt|model|tool|function)",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Line breaks `str.splitlines` honours besides \n and \r\n. Files containing any
+# of them are normalized through the in-memory path.
+_EXOTIC_LINE_BREAK_RE = re.compile(rb"\r(?!\n)|[\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+_ASCII_WHITESPACE = bytes(byte for byte in range(128) if chr(byte).isspace())
+
 
 class TranscriptMessage(BaseModel):
     """One normalized message in a conversation thread."""
@@ -128,23 +165,29 @@ class NormalizedThread(BaseModel):
     def to_prompt_block(self, *, max_chars: int | None = None) -> str:
         """Render a deterministic transcript block for runtime prompt compilation."""
 
-        lines: list[str] = []
-        total_chars = 0
-        for message in self.messages:
-            header = f"[{message.id}] role={message.role.value}"
-            if message.timestamp:
-                header += f" timestamp={message.timestamp}"
-            content = message.content.strip()
-            chunk = f"{header}\n{content}"
-            if max_chars is not None and total_chars + len(chunk) > max_chars:
-                remaining = max_chars - total_chars
-                if remaining > 200:
-                    lines.append(chunk[:remaining].rstrip() + "\n[TRUNCATED_BY_PROMPT_BUDGET]")
-                lines.append("[TRANSCRIPT_TRUNCATED]")
-                break
-            lines.append(chunk)
-            total_chars += len(chunk)
-        return "\n\n--- MESSAGE ---\n\n".join(lines)
+        return render_prompt_block(self.messages, max_chars=max_chars)
+
+
+def render_prompt_block(messages: Iterable[TranscriptMessage], *, max_chars: int | None = None) -> str:
+    """Render messages as a transcript block, consuming `messages` only up to the budget."""
+
+    lines: list[str] = []
+    total_chars = 0
+    for message in messages:
+        header = f"[{message.id}] role={message.role.value}"
+        if message.timestamp:
+            header += f" timestamp={message.timestamp}"
+        content = message.content.strip()
+        chunk = f"{header}\n{content}"
+        if max_chars is not None and total_chars + len(chunk) > max_chars:
+            remaining = max_chars - total_chars
+            if remaining > 200:
+                lines.append(chunk[:remaining].rstrip() + "\n[TRUNCATED_BY_PROMPT_BUDGET]")
+            lines.append("[TRANSCRIPT_TRUNCATED]")
+            break
+        lines.append(chunk)
+        total_chars += len(chunk)
+    return "\n\n--- MESSAGE ---\n\n".join(lines)
 
 
 def normalize_transcript_text(
@@ -215,6 +258,56 @@ def normalize_transcript_text(
     )
 
 
+def normalize_transcript_file(
+    path: str | Path,
+    *,
+    thread_id: str | None = None,
+    source: str = "raw_text",
+    created_at: str | None = None,
+) -> NormalizedThread:
+    """Normalize a role-prefixed text file through a memory map.
+
+    Produces the same thread as `normalize_transcript_text(path.read_text())`
+    without holding extra copies of the text: candidate role lines are found
+    with a byte-level prefix scan over the mapped file, messages are kept as
+    byte spans, and each message is decoded only when it is built.
+    """
+
+    messages = [
+        TranscriptMessage(role=role, content=content, source_index=index)
+        for index, (role, content) in enumerate(iter_text_file_messages(path))
+    ]
+    return NormalizedThread(
+        thread_id=thread_id or f"thread_{uuid4().hex[:12]}",
+        source=source,
+        created_at=created_at or _now_utc(),
+        messages=messages,
+    )
+
+
+def iter_text_file_messages(path: str | Path) -> Iterator[tuple[TranscriptRole, str]]:
+    """Yield `(role, content)` per message of a role-prefixed text file, decoding lazily."""
+
+    with open(path, "rb") as handle:
+        if not os.fstat(handle.fileno()).st_size:
+            raise ValueError("transcript text cannot be empty")
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if _EXOTIC_LINE_BREAK_RE.search(mapped):
+                thread = normalize_transcript_text(Path(path).read_text(encoding="utf-8"))
+                yield from ((message.role, message.content) for message in thread.messages)
+                return
+
+            start, end = _strip_span(mapped, 0, len(mapped))
+            if start == end:
+                raise ValueError("transcript text cannot be empty")
+            found = False
+            for role, content in _iter_text_messages(mapped, start, end):
+                found = True
+                yield role, content
+            if not found:
+                yield TranscriptRole.user, _decode(mapped, start, end).replace("\r\n", "\n")
+
+
 def normalize_transcript_json(
     payload: dict[str, Any],
     *,
@@ -245,61 +338,759 @@ def normalize_transcript_json(
     if not isinstance(raw_messages, list) or not raw_messages:
         raise ValueError("JSON transcript must contain a non-empty 'messages' list")
 
-    messages: list[TranscriptMessage] = []
-    for index, item in enumerate(raw_messages):
-        if not isinstance(item, dict):
-            raise ValueError(f"message at index {index} must be an object")
-
-        role_raw = str(item.get("role") or item.get("speaker") or item.get("author") or "unknown")
-        role = ROLE_ALIASES.get(role_raw.lower().strip(), TranscriptRole.unknown)
-        content = item.get("content") or item.get("text") or item.get("message")
-        if isinstance(content, list):
-            content = "\n".join(str(part) for part in content)
-        if content is None:
-            raise ValueError(f"message at index {index} is missing content/text/message")
-
-        message_id = str(item.get("id") or item.get("message_id") or f"msg_{index + 1:04d}")
-        metadata = {key: value for key, value in item.items() if key not in {"id", "message_id", "role", "speaker", "author", "content", "text", "message", "timestamp", "created_at"}}
-        messages.append(
-            TranscriptMessage(
-                id=message_id,
-                role=role,
-                content=str(content),
-                timestamp=item.get("timestamp") or item.get("created_at"),
-                source_index=index,
-                metadata=metadata,
-            )
-        )
-
+    messages = [normalize_message_json(item, index) for index, item in enumerate(raw_messages)]
     return NormalizedThread(
         thread_id=thread_id or str(payload.get("thread_id") or payload.get("id") or f"thread_{uuid4().hex[:12]}"),
         source=source or str(payload.get("source") or "json"),
         created_at=str(payload.get("created_at") or _now_utc()),
         messages=messages,
-        metadata={key: value for key, value in payload.items() if key not in {"thread_id", "id", "source", "created_at", "messages", "conversation", "items"}},
+        metadata={key: value for key, value in payload.items() if key not in THREAD_KEYS},
     )
 
 
-def load_thread(path: str | Path) -> NormalizedThread:
-    """Load and normalize a transcript from .json, .md, or .txt."""
+def normalize_message_json(item: Any, index: int) -> TranscriptMessage:
+    """Normalize one JSON message object found at position `index`."""
+
+    return TranscriptMessage(**message_fields_from_json(item, index))
+
+
+def message_fields_from_json(item: Any, index: int) -> dict[str, Any]:
+    """Resolve key aliases in one JSON message object into `TranscriptMessage` fields."""
+
+    if not isinstance(item, dict):
+        raise ValueError(f"message at index {index} must be an object")
+
+    role_raw = str(item.get("role") or item.get("speaker") or item.get("author") or "unknown")
+    role = ROLE_ALIASES.get(role_raw.lower().strip(), TranscriptRole.unknown)
+    content = item.get("content") or item.get("text") or item.get("message")
+    if isinstance(content, list):
+        content = "\n".join(str(part) for part in content)
+    if content is None:
+        raise ValueError(f"message at index {index} is missing content/text/message")
+
+    return {
+        "id": str(item.get("id") or item.get("message_id") or f"msg_{index + 1:04d}"),
+        "role": role,
+        "content": str(content),
+        "timestamp": item.get("timestamp") or item.get("created_at"),
+        "source_index": index,
+        "metadata": {key: value for key, value in item.items() if key not in MESSAGE_KEYS},
+    }
+
+
+@dataclass(slots=True)
+class StreamingThread:
+    """A thread whose messages are parsed lazily from a .json or .jsonl file.
+
+    Thread fields are read when the stream is opened; iterating re-reads the file
+    and yields validated messages one at a time, so memory stays bounded by the
+    largest message rather than the export. For a JSON object, fields that only
+    appear after the message list are merged in once iteration completes.
+    `to_normalized()` materializes an ordinary `NormalizedThread`.
+    """
+
+    path: Path
+    thread_id: str
+    source: str
+    created_at: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+    chunk_chars: int = STREAM_CHUNK_CHARS
+    # Key of the streamed message list in a JSON object; None for a root array.
+    list_key: str | None = None
+    # Header fields that were defaulted and may still be set by trailing fields.
+    defaulted: set[str] = field(default_factory=set, repr=False)
+
+    def __iter__(self) -> Iterator[TranscriptMessage]:
+        for index, item in enumerate(self.iter_records()):
+            yield normalize_message_json(item, index)
+
+    def iter_records(self) -> Iterator[Any]:
+        """Yield the raw JSON message objects, before alias resolution and validation."""
 
+        with self.path.open("r", encoding="utf-8") as handle:
+            if self.path.suffix.lower() == ".jsonl":
+                yield from _iter_jsonl_items(handle)
+                return
+            reader = _JsonReader(handle, self.chunk_chars)
+            if self.list_key is None:
+                yield from reader.iter_array()
+                return
+            _seek_json_list(reader, self.list_key)
+            yield from reader.iter_array(opened=True)
+            trailing = _read_json_members(reader)
+        self._merge_trailing(trailing)
+
+    def to_prompt_block(self, *, max_chars: int | None = None) -> str:
+        return render_prompt_block(self, max_chars=max_chars)
+
+    def to_normalized(self) -> NormalizedThread:
+        messages = list(self)
+        return NormalizedThread(
+            thread_id=self.thread_id,
+            source=self.source,
+            created_at=self.created_at,
+            messages=messages,
+            metadata=self.metadata,
+        )
+
+    def _merge_trailing(self, fields: dict[str, Any]) -> None:
+        thread_id = fields.get("thread_id") or fields.get("id")
+        if thread_id and "thread_id" in self.defaulted:
+            self.thread_id = str(thread_id)
+        if fields.get("source") and "source" in self.defaulted:
+            self.source = str(fields["source"])
+        if fields.get("created_at") and "created_at" in self.defaulted:
+            self.created_at = str(fields["created_at"])
+        self.defaulted.difference_update(key for key in ("thread_id", "source", "created_at") if fields.get(key))
+        for key, value in fields.items():
+            if key not in THREAD_KEYS:
+                self.metadata.setdefault(key, value)
+
+
+def open_thread_stream(path: str | Path, *, chunk_chars: int = STREAM_CHUNK_CHARS) -> StreamingThread:
+    """Open a .json or .jsonl transcript for lazy, message-at-a-time parsing.
+
+    JSONL files hold one message object per line, optionally preceded by a
+    header line carrying thread fields (`thread_id`, `source`, `created_at`, ...)
+    and no message content. JSON files hold either an array of messages or an
+    object whose `messages`/`conversation`/`items` array is streamed. The list is
+    chosen as `normalize_transcript_json` chooses it: the first non-empty one in
+    that key order. Unless a non-empty `messages` list comes first, opening reads
+    the whole object once, skipping message lists item by item.
+    """
+
+    input_path = Path(path)
+    suffix = input_path.suffix.lower()
+    list_key: str | None = None
+    if suffix not in {".json", ".jsonl"}:
+        raise ValueError(f"streaming is only supported for .json and .jsonl transcripts: {input_path}")
+    with input_path.open("r", encoding="utf-8") as handle:
+        if suffix == ".jsonl":
+            header = _read_jsonl_header(handle)
+        else:
+            header, list_key = _read_json_header(_JsonReader(handle, chunk_chars))
+
+    defaulted = {key for key in ("thread_id", "source", "created_at") if not header.get(key)}
+    if header.get("id") and not header.get("thread_id"):
+        defaulted.discard("thread_id")
+    return StreamingThread(
+        path=input_path,
+        thread_id=str(header.get("thread_id") or header.get("id") or f"thread_{uuid4().hex[:12]}"),
+        source=str(header.get("source") or suffix.lstrip(".")),
+        created_at=str(header.get("created_at") or _now_utc()),
+        metadata={key: value for key, value in header.items() if key not in THREAD_KEYS},
+        chunk_chars=chunk_chars,
+        list_key=list_key,
+        defaulted=defaulted,
+    )
+
+
+def iter_json_array(path: str | Path, *, chunk_chars: int = STREAM_CHUNK_CHARS) -> Iterator[Any]:
+    """Yield the items of a file whose root is a JSON array, decoding one item at a time."""
+
+    with Path(path).open("r", encoding="utf-8") as handle:
+        yield from _JsonReader(handle, chunk_chars).iter_array()
+
+
+def load_thread(
+    path: str | Path,
+    *,
+    cache: ThreadCache | None = None,
+    incremental: bool = False,
+) -> NormalizedThread:
+    """Load and normalize a transcript from .json, .jsonl, .md, or .txt.
+
+    Files written by `save_thread` are rebuilt directly, without re-normalizing.
+    With a `cache`, a previously normalized copy of an unchanged file is reused;
+    with `incremental=True` as well, a .jsonl/.txt/.md file that was only
+    appended to is parsed from the cached checkpoint on.
+    """
+
+    if incremental and cache is None:
+        raise ValueError("incremental loading needs a thread cache to keep checkpoints in")
+    if cache is not None:
+        return cache.load(path, incremental=incremental)
     input_path = Path(path)
+    if input_path.suffix.lower() == ".jsonl":
+        return open_thread_stream(input_path).to_normalized()
+    if input_path.suffix.lower() != ".json":
+        return normalize_transcript_file(input_path, source=input_path.suffix.lower().lstrip(".") or "text")
     text = input_path.read_text(encoding="utf-8")
-    if input_path.suffix.lower() == ".json":
+    with _gc_paused():
         payload = json.loads(text)
-        return normalize_transcript_json(payload, source=payload.get("source") if isinstance(payload, dict) else None)
-    return normalize_transcript_text(text, source=input_path.suffix.lower().lstrip(".") or "text")
+        if isinstance(payload, dict) and payload.get("format") == NORMALIZED_THREAD_FORMAT:
+            return _thread_from_saved(text, payload, verify_checksum=True)
+    return normalize_transcript_json(payload, source=payload.get("source") if isinstance(payload, dict) else None)
+
+
+def save_thread(thread: NormalizedThread | Any, path: str | Path, *, checksum: bool = True) -> None:
+    """Persist a normalized thread as pretty JSON in the versioned saved-thread format.
+
+    A sha256 of the serialized thread is stored in the header and verified on
+    load, so edits made after saving are detected and a verified file is
+    rebuilt without re-validation. With `checksum=False` the file can be edited
+    by hand, and loading validates it like any other input.
+    """
+
+    data = thread.model_dump(mode="json") if isinstance(thread, NormalizedThread) else thread.to_dict()
+    # The header is written as text ahead of the dumped thread so the checksum
+    # can cover the exact bytes that follow it.
+    body = json.dumps(data, indent=2, ensure_ascii=False)[2:] + "\n"
+    digest = _text_checksum(body) if checksum else None
+    Path(path).write_text(_saved_header(digest) + body, encoding="utf-8")
+
+
+def load_saved_thread(path: str | Path, *, verify_checksum: bool = True) -> NormalizedThread:
+    """Load a file written by `save_thread`; raises ValueError for any other file.
+
+    With `verify_checksum=False` a changed file is accepted, but validated.
+    """
+
+    text = Path(path).read_text(encoding="utf-8")
+    with _gc_paused():
+        payload = json.loads(text)
+        if not isinstance(payload, dict) or payload.get("format") != NORMALIZED_THREAD_FORMAT:
+            raise ValueError(f"{path} is not a saved normalized thread")
+        return _thread_from_saved(text, payload, verify_checksum=verify_checksum)
+
+
+@dataclass(slots=True)
+class ParseCheckpoint:
+    """Resume point for an append-only .txt/.md/.jsonl transcript.
+
+    `offset` is the byte offset parsing resumes from and `messages` the number
+    of messages before it, which appending can no longer change. For text the
+    last message stays open, since appended lines may continue it, so `offset`
+    is where that message starts. For JSONL it is the end of the last complete
+    line, `lines` counts the lines before it and `started` records whether the
+    optional header line has been passed.
+    """
+
+    offset: int
+    messages: int
+    lines: int = 0
+    started: bool = True
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"offset": self.offset, "messages": self.messages, "lines": self.lines, "started": self.started}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ParseCheckpoint":
+        return cls(
+            offset=int(data["offset"]),
+            messages=int(data["messages"]),
+            lines=int(data.get("lines", 0)),
+            started=bool(data.get("started", True)),
+        )
+
+
+def resume_thread(
+    path: str | Path,
+    previous: NormalizedThread | None = None,
+    checkpoint: ParseCheckpoint | None = None,
+    *,
+    size: int | None = None,
+) -> tuple[NormalizedThread, ParseCheckpoint | None]:
+    """Load `path` and return the thread with a checkpoint for the next append.
+
+    Given the `previous` thread and its `checkpoint`, only the bytes from
+    `checkpoint.offset` on are parsed (see `parse_appended`) and the new
+    messages replace those after `checkpoint.messages`. `size` limits parsing
+    to the file's first `size` bytes, so the result matches a size taken with
+    `os.stat`. The checkpoint is None for .json files and for text that cannot
+    be resumed (no role lines, or exotic line breaks); those are re-parsed in
+    full on every call.
+    """
+
+    input_path = Path(path)
+    suffix = input_path.suffix.lower()
+    if suffix == ".json":
+        return load_thread(input_path), None
+    if previous is not None and checkpoint is not None:
+        open_id = previous.messages[checkpoint.messages].id if checkpoint.messages < len(previous.messages) else None
+        appended = parse_appended(input_path, checkpoint, size=size, open_message_id=open_id)
+        if appended is not None:
+            messages, next_checkpoint = appended
+            merged = [*previous.messages[: checkpoint.messages], *messages]
+            return previous.model_copy(update={"messages": merged}), next_checkpoint
+
+    if suffix == ".jsonl":
+        stream = open_thread_stream(input_path)
+        fields, next_checkpoint = _read_jsonl_from(input_path, None, size)
+        thread = NormalizedThread(
+            thread_id=stream.thread_id,
+            source=stream.source,
+            created_at=stream.created_at,
+            messages=[TranscriptMessage(**item) for item in fields],
+            metadata=stream.metadata,
+        )
+        return thread, next_checkpoint
+    texts, next_checkpoint = _read_text_from(input_path, None, size)  # type: ignore[misc]
+    messages = [
+        TranscriptMessage(role=role, content=content, source_index=index)
+        for index, (role, content) in enumerate(texts)
+    ]
+    return NormalizedThread(source=suffix.lstrip(".") or "text", messages=messages), next_checkpoint
+
+
+def parse_appended(
+    path: str | Path,
+    checkpoint: ParseCheckpoint,
+    *,
+    size: int | None = None,
+    open_message_id: str | None = None,
+) -> tuple[list[TranscriptMessage], ParseCheckpoint | None] | None:
+    """Parse the messages from `checkpoint` on, or return None if a full re-parse is needed.
+
+    The messages continue the `source_index` numbering at `checkpoint.messages`.
+    For text the first of them is the message that was still open; it keeps
+    `open_message_id` when given, so its id survives growing.
+    """
+
+    input_path = Path(path)
+    if input_path.suffix.lower() == ".jsonl":
+        fields, next_checkpoint = _read_jsonl_from(input_path, checkpoint, size)
+        return [TranscriptMessage(**item) for item in fields], next_checkpoint
+    parsed = _read_text_from(input_path, checkpoint, size)
+    if parsed is None:
+        return None
+    texts, next_checkpoint = parsed
+    messages = [
+        TranscriptMessage(role=role, content=content, source_index=index)
+        for index, (role, content) in enumerate(texts, start=checkpoint.messages)
+    ]
+    if open_message_id is not None and messages:
+        messages[0].id = open_message_id
+    return messages, next_checkpoint
 
 
-def save_thread(thread: NormalizedThread, path: str | Path) -> None:
-    """Persist a normalized thread as pretty JSON."""
+def construct_thread(data: dict[str, Any]) -> NormalizedThread:
+    """Rebuild a thread from its own `model_dump(mode="json")` output without validation.
 
-    output_path = Path(path)
-    output_path.write_text(
-        json.dumps(thread.model_dump(mode="json"), indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
+    Only for data this package wrote itself (checksummed saved threads, stage
+    and cache records): no alias resolution, content or timestamp checks are
+    applied.
+    """
+
+    construct = TranscriptMessage.model_construct
+    with _gc_paused():
+        messages = [
+            construct(**{**message, "role": TranscriptRole(message["role"])}) for message in data["messages"]
+        ]
+    return NormalizedThread.model_construct(**{**data, "messages": messages})
+
+
+def _saved_header(checksum: str | None) -> str:
+    lines = [
+        f'  "format": {json.dumps(NORMALIZED_THREAD_FORMAT)},',
+        f'  "format_version": {NORMALIZED_THREAD_FORMAT_VERSION},',
+    ]
+    if checksum is not None:
+        lines.append(f'  "checksum": {json.dumps(checksum)},')
+    return "{\n" + "\n".join(lines) + "\n"
+
+
+def _thread_from_saved(text: str, payload: dict[str, Any], *, verify_checksum: bool) -> NormalizedThread:
+    version = payload.get("format_version")
+    if version != NORMALIZED_THREAD_FORMAT_VERSION:
+        raise ValueError(f"unsupported normalized thread format version: {version!r}")
+    expected = payload.get("checksum")
+    verified = False
+    if verify_checksum and expected is not None:
+        header = _saved_header(expected)
+        if not text.startswith(header) or _text_checksum(text[len(header) :]) != expected:
+            raise ValueError("normalized thread checksum mismatch: the file changed after it was saved")
+        verified = True
+    data = {key: value for key, value in payload.items() if key not in _FORMAT_KEYS}
+    if verified and _is_complete_dump(data):
+        return construct_thread(data)
+    # Unchecked files may have been edited by hand.
+    return NormalizedThread.model_validate(data)
+
+
+_THREAD_FIELDS = frozenset(NormalizedThread.model_fields)
+_MESSAGE_FIELDS = frozenset(TranscriptMessage.model_fields)
+
+
+def _is_complete_dump(data: dict[str, Any]) -> bool:
+    messages = data.get("messages")
+    return (
+        _THREAD_FIELDS <= data.keys()
+        and isinstance(messages, list)
+        and bool(messages)
+        and all(isinstance(message, dict) and _MESSAGE_FIELDS <= message.keys() for message in messages)
     )
 
 
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Decoding and rebuilding a large thread allocates only acyclic objects, yet
+    # the allocation count alone triggers repeated full collections.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _text_checksum(text: str) -> str:
+    return "sha256:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 def _now_utc() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+class _JsonReader:
+    """Minimal pull parser over a text handle: decodes one JSON value at a time."""
+
+    def __init__(self, handle: IO[str], chunk_chars: int) -> None:
+        self._handle = handle
+        self._chunk_chars = chunk_chars
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ("" at EOF)."""
+
+        while True:
+            self._pos = _WHITESPACE_RE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                return ""
+            self._fill()
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"invalid JSON transcript: expected {char!r}, found {found or 'end of file'!r}")
+        self._pos += 1
+
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._eof:
+                    raise ValueError(f"invalid JSON transcript: {exc.msg}") from exc
+                self._fill()
+                continue
+            # A value that ends exactly at the buffer edge may be a truncated number.
+            if end < len(self._buffer) or self._eof:
+                self._pos = end
+                return value
+            self._fill()
+
+    def skip(self) -> None:
+        """Consume the next value; arrays are walked item by item rather than decoded whole."""
+
+        if self.peek() == "[":
+            for _ in self.iter_array():
+                pass
+        else:
+            self.decode()
+
+    def iter_array(self, *, opened: bool = False) -> Iterator[Any]:
+        if not opened:
+            self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.decode()
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self.expect("]")
+            return
+
+    def _fill(self) -> None:
+        # Read at least as much as is buffered, so re-decoding a large value
+        # stays linear overall.
+        data = self._handle.read(max(self._chunk_chars, len(self._buffer) - self._pos))
+        if not data:
+            self._eof = True
+        self._buffer = self._buffer[self._pos :] + data
+        self._pos = 0
+
+
+def _read_json_header(reader: _JsonReader) -> tuple[dict[str, Any], str | None]:
+    """Read the thread fields and pick the message list to stream.
+
+    Returns the fields read and the key of the chosen list, or None when the root
+    is an array. A non-empty `messages` list always wins, so the header stops at
+    it; otherwise every member is read to learn which lists are non-empty.
+    """
+
+    first = reader.peek()
+    if first == "[":
+        return {}, None
+    if first != "{":
+        raise ValueError("JSON transcript must be an object or an array of messages")
+    reader.expect("{")
+    header: dict[str, Any] = {}
+    found: set[str] = set()
+    while reader.peek() != "}":
+        key = reader.decode()
+        reader.expect(":")
+        if key in MESSAGE_LIST_KEYS and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.expect("]")
+            elif key == MESSAGE_LIST_KEYS[0]:
+                return header, key
+            else:
+                found.add(key)
+                for _ in reader.iter_array(opened=True):
+                    pass
+        else:
+            header[key] = reader.decode()
+        if reader.peek() != ",":
+            break
+        reader.expect(",")
+    reader.expect("}")
+    for key in MESSAGE_LIST_KEYS:
+        if key in found:
+            return header, key
+    raise ValueError("JSON transcript must contain a non-empty 'messages' list")
+
+
+def _seek_json_list(reader: _JsonReader, list_key: str) -> None:
+    """Advance `reader` past the opening bracket of the object's non-empty `list_key` list."""
+
+    reader.expect("{")
+    while True:
+        key = reader.decode()
+        reader.expect(":")
+        if key == list_key and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() != "]":
+                return
+            reader.expect("]")
+        else:
+            reader.skip()
+        reader.expect(",")
+
+
+def _read_json_members(reader: _JsonReader) -> dict[str, Any]:
+    """Read the object members that follow the message array."""
+
+    members: dict[str, Any] = {}
+    while reader.peek() == ",":
+        reader.expect(",")
+        key = reader.decode()
+        reader.expect(":")
+        members[key] = reader.decode()
+    reader.expect("}")
+    return members
+
+
+def _read_jsonl_header(handle: IO[str]) -> dict[str, Any]:
+    for line in handle:
+        if line.strip():
+            item = json.loads(line)
+            return item if _is_jsonl_header(item) else {}
+    return {}
+
+
+def _iter_jsonl_items(handle: IO[str]) -> Iterator[Any]:
+    first = True
+    for line_number, line in enumerate(handle, start=1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError as exc:
+            raise ValueError(f"invalid JSONL transcript at line {line_number}: {exc}") from exc
+        if first and _is_jsonl_header(item):
+            first = False
+            continue
+        first = False
+        yield item
+
+
+def _is_jsonl_header(item: Any) -> bool:
+    return (
+        isinstance(item, dict)
+        and not {"content", "text", "message"} & item.keys()
+        and bool({"thread_id", "source", "created_at", "metadata"} & item.keys())
+    )
+
+
+def _iter_text_messages(buffer: Any, start: int, end: int) -> Iterator[tuple[TranscriptRole, str]]:
+    """Yield `(role, content)` for the text in `buffer[start:end]`, as `normalize_transcript_text` splits it."""
+
+    return ((role, content) for _, role, content in _iter_text_spans(buffer, start, end))
+
+
+def _iter_text_spans(buffer: Any, start: int, end: int) -> Iterator[tuple[int, TranscriptRole, str]]:
+    """Like `_iter_text_messages`, with the offset where each message's first line starts."""
+
+    # Each pending message is (role, first-line content, body start, line start);
+    # its body runs up to the next role line.
+    pending: tuple[TranscriptRole, str, int, int] | None = None
+    position = _skip_leading_delimiters(buffer, start, end)
+    if position < end:
+        # The first line may start mid-line (after stripped whitespace), where
+        # the prefix scan's `^` would not match, so it is checked directly.
+        line_end = _line_end(buffer, position, end)
+        match = ROLE_LINE_RE.match(_decode(buffer, position, line_end).rstrip("\r"))
+        if match is None:
+            pending = (TranscriptRole.user, "", position, position)
+        else:
+            role = ROLE_ALIASES.get(match.group("role").lower().strip(), TranscriptRole.unknown)
+            pending = (role, match.group("content"), min(line_end + 1, end), position)
+        position = min(line_end + 1, end)
+
+    for candidate in ROLE_PREFIX_RE.finditer(buffer, position, end):
+        line_start = candidate.start()
+        line_end = _line_end(buffer, line_start, end)
+        match = ROLE_LINE_RE.match(_decode(buffer, line_start, line_end).rstrip("\r"))
+        if match is None:
+            continue
+        if pending is not None:
+            content = _message_content(buffer, pending, line_start)
+            if content:
+                yield pending[3], pending[0], content
+        role = ROLE_ALIASES.get(match.group("role").lower().strip(), TranscriptRole.unknown)
+        pending = (role, match.group("content"), min(line_end + 1, end), line_start)
+
+    if pending is not None:
+        content = _message_content(buffer, pending, end)
+        if content:
+            yield pending[3], pending[0], content
+
+
+def _message_content(buffer: Any, pending: tuple[TranscriptRole, str, int, int], end: int) -> str:
+    _, first_line, body_start, _ = pending
+    body = _decode(buffer, body_start, end).replace("\r\n", "\n") if body_start < end else ""
+    if first_line:
+        body = f"{first_line}\n{body}" if body else first_line
+    return body.strip()
+
+
+def _skip_leading_delimiters(buffer: Any, start: int, end: int) -> int:
+    """Return the offset of the first line that is not a `---`/`===`/`***` delimiter."""
+
+    position = start
+    while position < end:
+        line_end = _line_end(buffer, position, end)
+        if not DELIMITER_RE.match(_decode(buffer, position, line_end).rstrip("\r")):
+            return position
+        position = line_end + 1
+    return end
+
+
+def _line_end(buffer: Any, start: int, end: int) -> int:
+    line_end = buffer.find(b"\n", start, end)
+    return end if line_end < 0 else line_end
+
+
+def _strip_span(buffer: Any, start: int, end: int) -> tuple[int, int]:
+    """Narrow `[start, end)` the way `str.strip` would trim the decoded text."""
+
+    while start < end:
+        if buffer[start] in _ASCII_WHITESPACE:
+            start += 1
+            continue
+        width = _utf8_width(buffer[start])
+        if buffer[start] < 0x80 or not _decode(buffer, start, min(start + width, end)).isspace():
+            break
+        start += width
+    while end > start:
+        if buffer[end - 1] in _ASCII_WHITESPACE:
+            end -= 1
+            continue
+        char_start = end - 1
+        while char_start > start and end - char_start < 4 and 0x80 <= buffer[char_start] < 0xC0:
+            char_start -= 1
+        if buffer[end - 1] < 0x80 or not _decode(buffer, char_start, end).isspace():
+            break
+        end = char_start
+    return start, end
+
+
+def _utf8_width(lead: int) -> int:
+    return 1 if lead < 0xC0 else 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+
+
+def _decode(buffer: Any, start: int, end: int) -> str:
+    return buffer[start:end].decode("utf-8")
+
+
+def _read_text_from(
+    path: Path, checkpoint: ParseCheckpoint | None, size: int | None
+) -> tuple[list[tuple[TranscriptRole, str]], ParseCheckpoint | None] | None:
+    """Parse text messages from the checkpoint on; None means a full re-parse is needed."""
+
+    with open(path, "rb") as handle:
+        length = size if size is not None else os.fstat(handle.fileno()).st_size
+        if not length:
+            raise ValueError("transcript text cannot be empty")
+        with mmap.mmap(handle.fileno(), length, access=mmap.ACCESS_READ) as mapped:
+            begin = checkpoint.offset if checkpoint is not None else 0
+            if _EXOTIC_LINE_BREAK_RE.search(mapped, begin):
+                if checkpoint is not None:
+                    return None
+                return list(iter_text_file_messages(path)), None
+            start, end = _strip_span(mapped, begin, length)
+            if checkpoint is not None:
+                # The open message starts exactly at the checkpoint; stripping its
+                # leading whitespace would change how its first line is read.
+                start = begin
+            spans = list(_iter_text_spans(mapped, start, end)) if start < end else []
+            if not spans:
+                if checkpoint is not None:
+                    return None
+                return list(iter_text_file_messages(path)), None
+            previous = checkpoint.messages if checkpoint is not None else 0
+            messages = [(role, content) for _, role, content in spans]
+            return messages, ParseCheckpoint(offset=spans[-1][0], messages=previous + len(spans) - 1)
+
+
+def _read_jsonl_from(
+    path: Path, checkpoint: ParseCheckpoint | None, size: int | None
+) -> tuple[list[dict[str, Any]], ParseCheckpoint]:
+    """Parse JSONL message fields from the checkpoint on.
+
+    Messages on a final line without a newline are returned but left out of
+    the checkpoint, since the writer may still be extending that line.
+    """
+
+    resume = checkpoint or ParseCheckpoint(offset=0, messages=0, lines=0, started=False)
+    offset, index, line_number, started = resume.offset, resume.messages, resume.lines, resume.started
+    committed = resume
+    fields: list[dict[str, Any]] = []
+    with open(path, "rb") as handle:
+        handle.seek(offset)
+        remaining = None if size is None else size - offset
+        while remaining is None or remaining > 0:
+            raw = handle.readline() if remaining is None else handle.readline(remaining)
+            if not raw:
+                break
+            if remaining is not None:
+                remaining -= len(raw)
+            offset += len(raw)
+            line_number += 1
+            line = raw.decode("utf-8")
+            if line.strip():
+                try:
+                    item = json.loads(line)
+                except ValueError as exc:
+                    raise ValueError(f"invalid JSONL transcript at line {line_number}: {exc}") from exc
+                if started or not _is_jsonl_header(item):
+                    fields.append(message_fields_from_json(item, index))
+                    index += 1
+                started = True
+            if raw.endswith(b"\n"):
+                committed = ParseCheckpoint(offset=offset, messages=index, lines=line_number, started=started)
+    return fields, committed
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -29,41 +31,141 @@ SECTION_RE = re.compile(r"^###\s+(?P<title>.+?)\s*$", re.MULTILINE)
 FIELD_RE = re.compile(r"^\*\*(?P<key>[A-Za-z0-9_]+)\*\*:\s*(?P<value>.*)$")
 
 
+@dataclass(frozen=True, slots=True)
+class ArtifactSection:
+    """One `### ` section of a USS artifact with its parsed fields.
+
+    Offsets index into `ParsedArtifact.text` and span from the header line to the
+    start of the next header. Line numbers are 1-based and inclusive.
+    """
+
+    title: str
+    body: str
+    fields: dict[str, str]
+    start_offset: int
+    end_offset: int
+    start_line: int
+    end_line: int
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedArtifact:
+    """A USS Markdown artifact parsed once and shared by every consumer.
+
+    Validation, claim extraction, evidence anchoring, and inspection all accept a
+    `ParsedArtifact` in place of raw text so a file's front matter YAML, sections,
+    and fields are parsed exactly once.
+    """
+
+    text: str
+    frontmatter: dict[str, Any]
+    frontmatter_error: str | None
+    body: str
+    body_offset: int
+    sections: dict[str, ArtifactSection]
+
+    def section_bodies(self) -> dict[str, str]:
+        return {title: section.body for title, section in self.sections.items()}
+
+
+def parse_artifact(text: str) -> ParsedArtifact:
+    """Parse front matter, ordered sections, fields, and spans in one pass."""
+
+    frontmatter: dict[str, Any] = {}
+    frontmatter_error: str | None = None
+    try:
+        frontmatter, body = parse_frontmatter(text)
+    except ValueError as exc:
+        frontmatter_error = str(exc)
+        body = text
+    body_offset = len(text) - len(body)
+
+    line_starts = [0, *(match.end() for match in re.finditer("\n", text))]
+    matches = list(SECTION_RE.finditer(body))
+    sections: dict[str, ArtifactSection] = {}
+    for idx, match in enumerate(matches):
+        title = match.group("title").strip()
+        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(body)
+        section_body = body[match.end() : end].strip()
+        start_offset = body_offset + match.start()
+        end_offset = body_offset + end
+        sections[title] = ArtifactSection(
+            title=title,
+            body=section_body,
+            fields=parse_fields(section_body),
+            start_offset=start_offset,
+            end_offset=end_offset,
+            start_line=bisect_right(line_starts, start_offset),
+            end_line=bisect_right(line_starts, max(start_offset, end_offset - 1)),
+        )
+
+    return ParsedArtifact(
+        text=text,
+        frontmatter=frontmatter,
+        frontmatter_error=frontmatter_error,
+        body=body,
+        body_offset=body_offset,
+        sections=sections,
+    )
+
+
+def as_parsed_artifact(value: str | ParsedArtifact) -> ParsedArtifact:
+    """Return `value` unchanged if already parsed, otherwise parse it."""
+
+    return value if isinstance(value, ParsedArtifact) else parse_artifact(value)
+
+
 def validate_file(path: str | Path) -> ValidationReport:
     artifact_path = Path(path)
     text = artifact_path.read_text(encoding="utf-8")
-    report = validate_text(text)
+    report = validate_text(parse_artifact(text))
     report.artifact_path = str(artifact_path)
     return report
 
 
-def validate_text(text: str) -> ValidationReport:
+def validate_text(text: str | ParsedArtifact, *, mode: InvocationMode | str | None = None) -> ValidationReport:
     """Validate a USS Markdown artifact and return a report.
 
-    The validator intentionally fails closed. Missing required information is an error.
+    Accepts raw Markdown or a `ParsedArtifact`. The validator intentionally fails
+    closed. Missing required information is an error, as is a required section
+    out of protocol order. With `mode`, the front matter must also declare that
+    mode, so a finished artifact fails the same checks `IncrementalValidator`
+    applies while it streams in.
     """
 
+    parsed = as_parsed_artifact(text)
     issues: list[ValidationIssue] = []
-    frontmatter_data: dict[str, Any] = {}
-    mode: InvocationMode | None = None
+    requested_mode = None if mode is None else InvocationMode(mode)
+    artifact_mode: InvocationMode | None = None
     protocol_version: str | None = None
 
-    try:
-        frontmatter_data, body = parse_frontmatter(text)
-        frontmatter = FrontMatter.model_validate(frontmatter_data)
-        mode = frontmatter.mode
-        protocol_version = frontmatter.protocol_version
-    except ValueError as exc:
-        body = text
-        issues.append(ValidationIssue(code="frontmatter_error", message=str(exc)))
-    except ValidationError as exc:
-        body = text
-        issues.extend(_issues_from_pydantic(exc, section="frontmatter"))
-
-    sections = parse_sections(body)
+    if parsed.frontmatter_error is not None:
+        issues.append(ValidationIssue(code="frontmatter_error", message=parsed.frontmatter_error))
+    else:
+        declared = parsed.frontmatter.get("mode")
+        if requested_mode is not None and declared != requested_mode.value:
+            issues.append(_mode_mismatch(declared, requested_mode))
+        try:
+            frontmatter = FrontMatter.model_validate(parsed.frontmatter)
+            artifact_mode = frontmatter.mode
+            protocol_version = frontmatter.protocol_version
+        except ValidationError as exc:
+            issues.extend(_issues_from_pydantic(exc, section="frontmatter"))
+
+    sections = parsed.sections
+    section_rank = _section_ranks(requested_mode or artifact_mode)
+    highest_rank, last_title = -1, None
+    for section_title in sections:
+        rank = section_rank.get(section_title)
+        if rank is None:
+            continue
+        if rank < highest_rank:
+            issues.append(_section_out_of_order(section_title, last_title))
+            break
+        highest_rank, last_title = rank, section_title
 
     required_sections = dict(REQUIRED_SECTIONS)
-    if mode == InvocationMode.archive:
+    if artifact_mode == InvocationMode.archive:
         required_sections.update(ARCHIVE_REQUIRED_SECTIONS)
 
     for section_title, required_fields in required_sections.items():
@@ -77,9 +179,9 @@ def validate_text(text: str) -> ValidationReport:
             )
             continue
 
-        section_body = sections[section_title]
+        section = sections[section_title]
         if section_title == "INVOCATION LOCK":
-            if not section_body.strip():
+            if not section.body.strip():
                 issues.append(
                     ValidationIssue(
                         code="empty_invocation_lock",
@@ -89,7 +191,7 @@ def validate_text(text: str) -> ValidationReport:
                 )
             continue
 
-        fields = parse_fields(section_body)
+        fields = section.fields
         for field_name in required_fields:
             value = fields.get(field_name)
             if value is None:
@@ -135,7 +237,7 @@ def validate_text(text: str) -> ValidationReport:
     # Optional section validation: if present, check required optional fields are not blank.
     for section_title, optional_fields in OPTIONAL_SECTIONS.items():
         if section_title in sections:
-            fields = parse_fields(sections[section_title])
+            fields = sections[section_title].fields
             for field_name in optional_fields:
                 if field_name in fields and is_vague_null(fields[field_name]):
                     issues.append(
@@ -150,11 +252,137 @@ def validate_text(text: str) -> ValidationReport:
 
     return ValidationReport.from_issues(
         issues=issues,
-        mode=mode,
+        mode=artifact_mode,
         protocol_version=protocol_version,
     )
 
 
+class IncrementalValidator:
+    """Fail-fast structural checks for an artifact that is still streaming in.
+
+    Front matter is checked as soon as its closing `---` arrives and each `### `
+    header as soon as its line is complete. Only errors that no later text can
+    repair are reported: missing or unparseable front matter, a front matter mode
+    other than the one requested, and required sections out of protocol order.
+    Everything else is left to `validate_text` once the stream finishes.
+    """
+
+    def __init__(self, mode: InvocationMode | str) -> None:
+        self.mode = InvocationMode(mode)
+        self._section_rank = _section_ranks(self.mode)
+        self._buffer = ""
+        self._body_offset: int | None = None
+        self._scan_offset = 0
+        self._highest_rank = -1
+        self._last_title: str | None = None
+        self.frontmatter: dict[str, Any] = {}
+        self.fatal_issues: list[ValidationIssue] = []
+
+    @property
+    def failed(self) -> bool:
+        return bool(self.fatal_issues)
+
+    def feed(self, chunk: str) -> list[ValidationIssue]:
+        """Consume one streamed chunk and return any fatal issues found so far."""
+
+        if self.failed:
+            return self.fatal_issues
+        self._buffer += chunk
+        if self._body_offset is None:
+            self._check_frontmatter()
+        if self._body_offset is not None and not self.failed:
+            self._check_headers()
+        return self.fatal_issues
+
+    def report(self) -> ValidationReport:
+        """Report for an aborted stream, carrying only the fatal issues."""
+
+        frontmatter_mode = self.frontmatter.get("mode")
+        try:
+            mode = InvocationMode(frontmatter_mode) if frontmatter_mode is not None else None
+        except ValueError:
+            mode = None
+        return ValidationReport.from_issues(
+            issues=self.fatal_issues,
+            mode=mode,
+            protocol_version=_optional_str(self.frontmatter.get("protocol_version")),
+        )
+
+    def _check_frontmatter(self) -> None:
+        text = self._buffer.lstrip()
+        if len(text) < 4:
+            return
+        if not text.startswith("---\n"):
+            self._fail(ValidationIssue(code="frontmatter_error", message="Artifact must begin with YAML front matter delimited by ---"))
+            return
+        end = text.find("\n---\n", 3)
+        if end == -1:
+            if SECTION_RE.search(text):
+                self._fail(ValidationIssue(code="frontmatter_error", message="YAML front matter closing delimiter not found"))
+            return
+        try:
+            self.frontmatter, _ = parse_frontmatter(text)
+        except (ValueError, yaml.YAMLError) as exc:
+            self._fail(ValidationIssue(code="frontmatter_error", message=str(exc)))
+            return
+        self._body_offset = len(self._buffer) - len(text) + end + len("\n---\n")
+        self._scan_offset = self._body_offset
+
+        declared = self.frontmatter.get("mode")
+        if declared != self.mode.value:
+            self._fail(_mode_mismatch(declared, self.mode))
+
+    def _check_headers(self) -> None:
+        # Only complete lines are inspected, so a header split across chunks is
+        # never judged on a partial title.
+        complete_to = self._buffer.rfind("\n") + 1
+        if complete_to <= self._scan_offset:
+            return
+        for match in SECTION_RE.finditer(self._buffer, self._scan_offset, complete_to):
+            title = match.group("title").strip()
+            rank = self._section_rank.get(title)
+            if rank is None:
+                continue
+            if rank < self._highest_rank:
+                self._fail(_section_out_of_order(title, self._last_title))
+                return
+            self._highest_rank = rank
+            self._last_title = title
+        self._scan_offset = complete_to
+
+    def _fail(self, issue: ValidationIssue) -> None:
+        self.fatal_issues.append(
+            issue.model_copy(update={"message": f"{issue.message} Generation was stopped early."})
+        )
+
+
+def _section_ranks(mode: InvocationMode | None) -> dict[str, int]:
+    """Protocol position of each required section for `mode`."""
+
+    expected = list(REQUIRED_SECTIONS)
+    if mode == InvocationMode.archive:
+        insert_at = expected.index("INVOCATION LOCK")
+        expected[insert_at:insert_at] = ARCHIVE_REQUIRED_SECTIONS
+    return {title: rank for rank, title in enumerate(expected)}
+
+
+def _mode_mismatch(declared: Any, requested: InvocationMode) -> ValidationIssue:
+    return ValidationIssue(
+        code="mode_mismatch",
+        message=f"Front matter mode {declared!r} does not match requested mode {requested.value!r}.",
+        section="frontmatter",
+        field="mode",
+    )
+
+
+def _section_out_of_order(title: str, previous: str | None) -> ValidationIssue:
+    return ValidationIssue(
+        code="section_out_of_order",
+        message=f"Required section {title!r} appears after {previous!r}.",
+        section=title,
+    )
+
+
 def parse_frontmatter(text: str) -> tuple[dict[str, Any], str]:
     """Return YAML front matter and Markdown body."""
 
@@ -242,6 +470,10 @@ def is_vague_null(value: str) -> bool:
     return cleaned in VAGUE_NULLS
 
 
+def _optional_str(value: Any) -> str | None:
+    return None if value is None else str(value)
+
+
 def _issues_from_pydantic(exc: ValidationError, *, section: str) -> list[ValidationIssue]:
     issues: list[ValidationIssue] = []
     for error in exc.errors():
@@ -0,0 +1,142 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from uss_engine import batch as batch_module
+from uss_engine.batch import BatchConfig, discover_threads, read_completed_threads, run_batch
+from uss_engine.cli import app
+from uss_engine.run import RunConfig
+
+ROOT = Path(__file__).resolve().parents[1]
+PROTOCOL = ROOT / "protocols" / "uss_v1_3.protocol.json"
+
+
+def _make_inputs(tmp_path: Path) -> Path:
+    inputs = tmp_path / "inputs"
+    (inputs / "nested").mkdir(parents=True)
+    shutil.copy(ROOT / "examples" / "thread_minimal.json", inputs / "a.json")
+    shutil.copy(ROOT / "examples" / "thread_minimal.json", inputs / "nested" / "b.json")
+    (inputs / "notes.yaml").write_text("ignored: true\n", encoding="utf-8")
+    return inputs
+
+
+def test_discover_threads_filters_transcripts(tmp_path):
+    inputs = _make_inputs(tmp_path)
+    assert [path.name for path in discover_threads(inputs)] == ["a.json", "b.json"]
+    assert [path.name for path in discover_threads(str(inputs / "*.json"))] == ["a.json"]
+
+
+def test_discover_threads_skips_batch_outputs(tmp_path):
+    inputs = _make_inputs(tmp_path)
+    (inputs / "out" / "a_json").mkdir(parents=True)
+    (inputs / "out" / "a_json" / "validation_report.json").write_text("{}", encoding="utf-8")
+    (inputs / ".uss_stages").mkdir()
+    (inputs / ".uss_stages" / "normalize.json").write_text("{}", encoding="utf-8")
+
+    found = discover_threads(inputs, exclude=[inputs / "out"])
+    assert [path.name for path in found] == ["a.json", "b.json"]
+
+
+def test_output_names_do_not_collide(tmp_path):
+    inputs = tmp_path / "inputs"
+    inputs.mkdir()
+    for name in ("a.b.json", "a_b.json"):
+        shutil.copy(ROOT / "examples" / "thread_minimal.json", inputs / name)
+
+    result = run_batch(
+        source=inputs,
+        output_dir=inputs / "out",
+        protocol_path=PROTOCOL,
+        config=RunConfig(provider="static"),
+        batch=BatchConfig(workers=1),
+    )
+    assert len(result.entries) == 2
+    assert len({entry.output_dir for entry in result.entries}) == 2
+
+
+def test_run_batch_writes_manifest_and_resumes(tmp_path):
+    inputs = _make_inputs(tmp_path)
+    output = tmp_path / "out"
+
+    first = run_batch(
+        source=inputs,
+        output_dir=output,
+        protocol_path=PROTOCOL,
+        config=RunConfig(provider="static"),
+        batch=BatchConfig(workers=1),
+    )
+    assert len(first.entries) == 2
+    assert first.failed_count == 0
+    assert len(list(output.glob("a_json-*/summary.md"))) == 1
+    assert len(list(output.glob("nested__b_json-*/generation_report.json"))) == 1
+
+    lines = [json.loads(line) for line in (output / "manifest.ndjson").read_text().splitlines()]
+    assert {line["status"] for line in lines} <= {"completed", "completed_with_warnings"}
+    assert all(line["artifacts"]["summary_md"].endswith("summary.md") for line in lines)
+    assert len(read_completed_threads(output / "manifest.ndjson")) == 2
+
+    second = run_batch(
+        source=inputs,
+        output_dir=output,
+        protocol_path=PROTOCOL,
+        config=RunConfig(provider="static"),
+        batch=BatchConfig(workers=1),
+    )
+    assert second.entries == []
+    assert len(second.skipped) == 2
+
+
+def test_run_batch_cli_process_pool(tmp_path):
+    inputs = _make_inputs(tmp_path)
+    output = tmp_path / "out"
+    result = CliRunner().invoke(
+        app,
+        [
+            "run-batch",
+            str(inputs),
+            "--protocol",
+            str(PROTOCOL),
+            "--output-dir",
+            str(output),
+            "--workers",
+            "2",
+            "--env-file",
+            str(tmp_path / "missing.env"),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert len((output / "manifest.ndjson").read_text().splitlines()) == 2
+
+
+def test_resume_matches_threads_from_another_working_directory(tmp_path, monkeypatch):
+    inputs = _make_inputs(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    kwargs = dict(protocol_path=PROTOCOL, config=RunConfig(provider="static"), batch=BatchConfig(workers=1))
+    first = run_batch(source="inputs", output_dir="out", **kwargs)
+    assert all(Path(entry.thread_path).is_absolute() for entry in first.entries)
+
+    monkeypatch.chdir(inputs / "nested")
+    second = run_batch(source=inputs, output_dir=tmp_path / "out", **kwargs)
+    assert second.entries == []
+    assert len(second.skipped) == 2
+
+
+def test_crashed_worker_is_recorded_as_a_failed_entry(tmp_path, monkeypatch):
+    inputs = _make_inputs(tmp_path)
+    # Worker processes are forked, so they see the patched pipeline.
+    monkeypatch.setattr(batch_module, "run_uss_pipeline", lambda **_: os._exit(1))
+
+    result = run_batch(
+        source=inputs,
+        output_dir=tmp_path / "out",
+        protocol_path=PROTOCOL,
+        config=RunConfig(provider="static"),
+        batch=BatchConfig(workers=2),
+    )
+    assert len(result.entries) == 2
+    assert {entry.status for entry in result.entries} == {"error"}
+    assert all("BrokenProcessPool" in (entry.error or "") for entry in result.entries)
+    assert read_completed_threads(tmp_path / "out" / "manifest.ndjson") == set()
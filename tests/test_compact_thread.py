@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from uss_engine.compact_thread import CompactThread, load_compact_thread
+from uss_engine.evidence import build_evidence_map
+from uss_engine.redactor import RedactionResult, redact_thread
+from uss_engine.run import render_static_uss_summary
+from uss_engine.transcript import load_thread
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_compact_thread_round_trips_and_matches_normalized_reads():
+    thread = load_thread(ROOT / "examples" / "thread_with_secrets.json")
+    compact = CompactThread.from_normalized(thread)
+
+    assert compact.to_normalized() == thread
+    assert compact.to_dict() == thread.model_dump(mode="json")
+    assert list(compact.messages) == thread.messages
+    assert compact.messages[-1] == thread.messages[-1]
+    assert (compact.char_count, compact.exchange_pair_count) == (thread.char_count, thread.exchange_pair_count)
+    assert compact.to_prompt_block(max_chars=300) == thread.to_prompt_block(max_chars=300)
+
+    summary = render_static_uss_summary(thread=compact, mode="checkpoint")
+    evidence = build_evidence_map(summary_text=summary, thread=compact, artifact_id="a")
+    expected = build_evidence_map(summary_text=summary, thread=thread, artifact_id="a")
+    assert evidence.model_dump(exclude={"generated_at"}) == expected.model_dump(exclude={"generated_at"})
+
+
+def test_redacting_a_compact_thread_keeps_it_compact():
+    thread = load_thread(ROOT / "examples" / "thread_with_secrets.json")
+    expected = redact_thread(thread)
+    result = redact_thread(CompactThread.from_normalized(thread))
+
+    assert isinstance(result.thread, CompactThread)
+    assert result.report == expected.report
+    assert result.thread.to_normalized() == expected.thread
+    # Stored stage outputs serialize the normalized form and load back as one.
+    restored = RedactionResult.model_validate_json(result.model_dump_json())
+    assert restored.thread == expected.thread
+
+
+def test_compact_loader_validates_lazily(tmp_path):
+    path = tmp_path / "export.jsonl"
+    records = [{"role": "user", "content": f"hello {index}", "timestamp": "2026-01-01T00:00:00Z"} for index in range(50)]
+    records.append({"role": "assistant", "content": "bad stamp", "timestamp": "yesterday"})
+    path.write_text("\n".join(json.dumps(record) for record in records), encoding="utf-8")
+
+    compact = load_compact_thread(path)
+    assert len(compact) == 51
+    assert compact.message_id(3) == "msg_0004"
+    with pytest.raises(ValueError, match="ISO-8601"):
+        compact.validate()
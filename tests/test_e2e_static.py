@@ -4,6 +4,7 @@ from pathlib import Path
 from typer.testing import CliRunner
 
 from uss_engine.cli import app
+from uss_engine.inspector import inspect_text
 from uss_engine.reports import ProviderKind, RunStatus
 from uss_engine.run import RunConfig, render_static_uss_summary, run_uss_pipeline
 from uss_engine.schema import InvocationMode
@@ -68,3 +69,55 @@ def test_run_cli_static(tmp_path):
     assert result.exit_code == 0, result.output
     assert (tmp_path / "summary.md").exists()
     assert (tmp_path / "generation_report.json").exists()
+
+
+def test_e2e_inspection_report_matches_standalone_inspection(tmp_path):
+    result = run_uss_pipeline(
+        thread_path=ROOT / "examples" / "thread_minimal.json",
+        protocol_path=ROOT / "protocols" / "uss_v1_3.protocol.json",
+        output_dir=tmp_path,
+        config=RunConfig(provider=ProviderKind.static, mode=InvocationMode.checkpoint),
+    )
+    written = json.loads((tmp_path / "inspection_report.json").read_text())
+    standalone = inspect_text(
+        summary_text=result.generation.final_output,
+        thread=result.generation.redacted_thread,
+        artifact_path=result.output_paths.summary_md,
+        thread_path=str(ROOT / "examples" / "thread_minimal.json"),
+    ).model_dump(mode="json")
+    written["evidence_map"].pop("generated_at")
+    standalone["evidence_map"].pop("generated_at")
+    assert written == standalone
+    assert json.loads((tmp_path / "evidence_map.json").read_text())["claims"] == written["evidence_map"]["claims"]
+
+
+class _PlainClient:
+    def __init__(self, output):
+        self.output = output
+
+    def complete(self, messages):
+        return self.output
+
+
+def test_e2e_inspection_validates_without_the_requested_mode(tmp_path):
+    archive = (ROOT / "examples" / "checkpoint_valid.md").read_text(encoding="utf-8")
+    archive = archive.replace("mode: checkpoint", "mode: archive", 1)
+    result = run_uss_pipeline(
+        thread_path=ROOT / "examples" / "thread_minimal.json",
+        protocol_path=ROOT / "protocols" / "uss_v1_3.protocol.json",
+        output_dir=tmp_path,
+        config=RunConfig(provider=ProviderKind.static, mode=InvocationMode.checkpoint, max_attempts=1),
+        client=_PlainClient(archive),
+    )
+    assert "mode_mismatch" in {issue.code for issue in result.generation.final_report.issues}
+    written = json.loads((tmp_path / "inspection_report.json").read_text())
+    standalone = inspect_text(
+        summary_text=result.generation.final_output,
+        thread=result.generation.redacted_thread,
+        artifact_path=result.output_paths.summary_md,
+        thread_path=str(ROOT / "examples" / "thread_minimal.json"),
+    ).model_dump(mode="json")
+    written["evidence_map"].pop("generated_at")
+    standalone["evidence_map"].pop("generated_at")
+    assert written == standalone
+    assert "mode_mismatch" not in {issue["code"] for issue in written["validation_report"]["issues"]}
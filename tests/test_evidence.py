@@ -1,13 +1,20 @@
 from pathlib import Path
 
+import pytest
+from typer.testing import CliRunner
+
+from uss_engine import evidence_matrix
+from uss_engine.cli import app
 from uss_engine.evidence import (
+    EvidenceIndex,
     EvidenceStatus,
+    _lexical_support_score,
     build_evidence_map,
     build_evidence_map_from_files,
     extract_claims,
     validate_evidence_map,
 )
-from uss_engine.transcript import load_thread
+from uss_engine.transcript import NormalizedThread, load_thread
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -47,6 +54,40 @@ def test_build_evidence_map_from_files():
     )
     assert evidence_map.coverage.weighted_support_ratio > 0.5
 
+
+def test_evidence_map_cli_explains_missing_numpy(monkeypatch):
+    monkeypatch.setattr(evidence_matrix, "np", None)
+    result = CliRunner().invoke(
+        app,
+        [
+            "evidence-map",
+            str(ROOT / "examples" / "summary_with_evidence.md"),
+            str(ROOT / "examples" / "thread_minimal.json"),
+            "--scoring",
+            "bm25",
+        ],
+    )
+    assert result.exit_code == 2
+    assert "pip install uss-engine[fast]" in result.output
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+
+
+def test_evidence_map_cli_vector_scoring_falls_back_without_numpy(monkeypatch):
+    monkeypatch.setattr(evidence_matrix, "np", None)
+    result = CliRunner().invoke(
+        app,
+        [
+            "evidence-map",
+            str(ROOT / "examples" / "summary_with_evidence.md"),
+            str(ROOT / "examples" / "thread_minimal.json"),
+            "--scoring",
+            "vector",
+            "--json",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+
 def test_metadata_and_protocol_fields_are_not_unsupported():
     summary = """---
 mode: checkpoint
@@ -92,3 +133,67 @@ This checkpoint is complete and locked.
         if claim.field in {"Focus_Domains", "Invoker", "Failure_Severity"}
     )
 
+
+
+def test_evidence_index_matches_lexical_scorer():
+    thread = load_thread(ROOT / "examples" / "thread_minimal.json")
+    index = EvidenceIndex.from_thread(thread)
+    claims = [
+        "Build USS Engine as a local-first continuity tool with validation.",
+        "transcript normalization redaction prompt compilation",
+        "unrelated claim about weather patterns",
+    ]
+    for claim_text in claims:
+        scores = index.scores(claim_text)
+        for position, message in enumerate(thread.messages):
+            assert scores.get(position, 0.0) == _lexical_support_score(claim_text, message.content)
+
+
+def test_evidence_index_phrase_bonus_ignores_message_boundaries():
+    thread = NormalizedThread(
+        thread_id="phrase",
+        messages=[
+            {"role": "user", "content": "alpha bravo charlie"},
+            {"role": "assistant", "content": "delta echo foxtrot golf hotel india"},
+        ],
+    )
+    index = EvidenceIndex.from_thread(thread)
+    claim = "charlie delta echo foxtrot golf"
+    assert index.scores(claim) == {
+        position: _lexical_support_score(claim, message.content)
+        for position, message in enumerate(thread.messages)
+    }
+    best_score, best_message = index.best_match("delta echo foxtrot golf hotel")
+    assert best_message is thread.messages[1]
+    assert best_score == 1.0
+
+
+def test_vector_scoring_matches_lexical_scoring():
+    pytest.importorskip("numpy")
+    summary = (ROOT / "examples" / "summary_with_evidence.md").read_text(encoding="utf-8")
+    thread = load_thread(ROOT / "examples" / "thread_minimal.json")
+    lexical = build_evidence_map(summary_text=summary, thread=thread, artifact_id="a")
+    vector = build_evidence_map(summary_text=summary, thread=thread, artifact_id="a", scoring="vector")
+    assert [claim.model_dump() for claim in vector.claims] == [claim.model_dump() for claim in lexical.claims]
+    assert vector.coverage == lexical.coverage
+
+
+def test_bm25_scoring_prefers_focused_message_over_long_message():
+    np = pytest.importorskip("numpy")
+    from uss_engine.evidence_matrix import score_matrix
+
+    filler = " ".join(f"filler{n}" for n in range(200))
+    thread = NormalizedThread(
+        thread_id="bm25",
+        messages=[
+            {"role": "user", "content": f"redaction pipeline validator {filler}"},
+            {"role": "assistant", "content": "redaction pipeline validator"},
+        ],
+    )
+    index = EvidenceIndex.from_thread(thread)
+    claim = ["redaction pipeline validator"]
+    vector = score_matrix(index, claim, scoring="vector")
+    bm25 = score_matrix(index, claim, scoring="bm25")
+    assert vector[0, 0] == vector[0, 1] == 1.0
+    assert bm25[0, 1] > bm25[0, 0]
+    assert np.all((bm25 >= 0.0) & (bm25 <= 1.0))
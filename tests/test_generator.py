@@ -4,6 +4,7 @@ from uss_engine.generator import GenerationConfig, StaticLLMClient, generate_sum
 from uss_engine.prompt_compiler import load_protocol
 from uss_engine.schema import InvocationMode
 from uss_engine.transcript import load_thread
+from uss_engine.validator import validate_text
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -38,3 +39,43 @@ def test_generator_retries_after_invalid_output():
     assert len(result.attempts) == 2
     assert not result.attempts[0].validation_report.valid
     assert result.attempts[1].validation_report.valid
+
+
+def test_generator_aborts_stream_on_fatal_structure_and_repairs():
+    protocol = load_protocol(ROOT / "protocols" / "uss_v1_3.protocol.json")
+    thread = load_thread(ROOT / "examples" / "thread_minimal.json")
+    valid_output = (ROOT / "examples" / "checkpoint_valid.md").read_text(encoding="utf-8")
+    wrong_mode = valid_output.replace("mode: checkpoint", "mode: archive", 1)
+    client = StaticLLMClient(outputs=[wrong_mode, valid_output])
+
+    result = generate_summary(protocol=protocol, thread=thread, mode="checkpoint", client=client)
+
+    first = result.attempts[0]
+    assert first.aborted
+    assert [issue.code for issue in first.abort_report.issues] == ["mode_mismatch"]
+    assert first.validation_report == validate_text(first.output, mode="checkpoint")
+    assert len(first.output) < valid_output.index("### COSMIC CORE")
+    assert result.valid
+    assert result.attempts[1].prompt_metadata["repair"] is True
+
+
+def test_generator_keeps_the_full_output_of_the_last_attempt():
+    protocol = load_protocol(ROOT / "protocols" / "uss_v1_3.protocol.json")
+    thread = load_thread(ROOT / "examples" / "thread_minimal.json")
+    valid_output = (ROOT / "examples" / "checkpoint_valid.md").read_text(encoding="utf-8")
+    wrong_mode = valid_output.replace("mode: checkpoint", "mode: archive", 1)
+
+    result = generate_summary(
+        protocol=protocol,
+        thread=thread,
+        mode="checkpoint",
+        client=StaticLLMClient(outputs=[wrong_mode]),
+        config=GenerationConfig(max_attempts=1),
+    )
+
+    [attempt] = result.attempts
+    assert not attempt.aborted
+    assert result.final_output == wrong_mode.strip()
+    assert result.final_report == validate_text(result.final_output, mode="checkpoint")
+    assert "mode_mismatch" in {issue.code for issue in result.final_report.issues}
+    assert not result.valid
@@ -0,0 +1,89 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from uss_engine.clients._http import HTTPConnectionPool, post_json
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports: list[int] = []
+
+    def do_POST(self):  # noqa: N802 - http.server naming
+        length = int(self.headers["Content-Length"])
+        payload = json.loads(self.rfile.read(length))
+        type(self).client_ports.append(self.client_address[1])
+        if payload.get("drop"):
+            # Hang up after reading the request, as a server restarting mid-request would.
+            self.close_connection = True
+            return
+        if payload.get("fail"):
+            body = b'{"error": "bad key sk-abcdefghijklmnopqrstuvwxyz0123"}'
+            self.send_response(401)
+        else:
+            body = json.dumps({"echo": payload}).encode("utf-8")
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # noqa: D401 - silence test server logs
+        pass
+
+
+@pytest.fixture()
+def server():
+    _Handler.client_ports = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_pool_reuses_keep_alive_connection(server):
+    pool = HTTPConnectionPool(max_connections_per_host=2)
+    for number in range(3):
+        assert post_json(url=f"{server}/v1/chat", payload={"n": number}, pool=pool) == {"echo": {"n": number}}
+    assert len(set(_Handler.client_ports)) == 1
+    pool.close()
+
+
+def test_pool_drops_idle_connections_after_timeout(server):
+    pool = HTTPConnectionPool(idle_timeout_seconds=0)
+    post_json(url=f"{server}/v1/chat", payload={"n": 1}, pool=pool)
+    post_json(url=f"{server}/v1/chat", payload={"n": 2}, pool=pool)
+    assert len(set(_Handler.client_ports)) == 2
+
+
+def test_pool_errors_stay_redacted(server):
+    pool = HTTPConnectionPool()
+    with pytest.raises(RuntimeError) as excinfo:
+        post_json(url=f"{server}/v1/models?key=secret-value", payload={"fail": True}, pool=pool)
+    message = str(excinfo.value)
+    assert message.startswith("HTTP 401 from ")
+    assert "secret-value" not in message
+    assert "sk-abcdefghijklmnopqrstuvwxyz0123" not in message
+    assert "key=%3CREDACTED%3E" in message
+
+
+def test_pool_does_not_resend_a_post_the_server_received(server):
+    pool = HTTPConnectionPool()
+    post_json(url=f"{server}/v1/chat", payload={"n": 1}, pool=pool)
+    with pytest.raises(RuntimeError, match="Request failed"):
+        post_json(url=f"{server}/v1/chat", payload={"drop": True}, pool=pool)
+    assert len(_Handler.client_ports) == 2
+
+
+def test_pool_waits_for_a_free_connection_only_until_the_timeout(server):
+    pool = HTTPConnectionPool(max_connections_per_host=1)
+    held = pool.stream("POST", f"{server}/v1/chat", body=b'{"n": 1}', headers={"Content-Type": "application/json"})
+    next(held)
+    with pytest.raises(RuntimeError, match="waiting for a connection"):
+        post_json(url=f"{server}/v1/chat", payload={"n": 2}, pool=pool, timeout_seconds=0.2)
+    held.close()
+    assert post_json(url=f"{server}/v1/chat", payload={"n": 3}, pool=pool) == {"echo": {"n": 3}}
@@ -0,0 +1,96 @@
+import json
+
+from typer.testing import CliRunner
+
+from uss_engine.cli import app
+from uss_engine.ingest import IngestConfig, conversation_payload, ingest_export
+from uss_engine.transcript import load_thread
+
+
+def _chatgpt_conversation(conversation_id: str, prompt: str) -> dict:
+    def node(node_id, parent, children, role=None, text=None, hidden=False):
+        message = None
+        if role is not None:
+            message = {
+                "id": node_id,
+                "author": {"role": role},
+                "create_time": 1700000000,
+                "content": {"content_type": "text", "parts": [text]},
+                "metadata": {"is_visually_hidden_from_conversation": hidden},
+            }
+        return {"id": node_id, "parent": parent, "children": children, "message": message}
+
+    return {
+        "title": f"Chat {conversation_id}",
+        "conversation_id": conversation_id,
+        "create_time": 1700000000.5,
+        "current_node": "a2",
+        "mapping": {
+            "root": node("root", None, ["sys"]),
+            "sys": node("sys", "root", ["u1"], "system", "hidden prompt", hidden=True),
+            "u1": node("u1", "sys", ["a1", "a2"], "user", prompt),
+            "a1": node("a1", "u1", [], "assistant", "abandoned branch"),
+            "a2": node("a2", "u1", [], "assistant", "Decision: ship it."),
+        },
+    }
+
+
+def _export(tmp_path):
+    conversations = [
+        _chatgpt_conversation("c-1", "Plan the release."),
+        {
+            "uuid": "claude-1",
+            "name": "Claude chat",
+            "created_at": "2024-05-01T10:00:00Z",
+            "chat_messages": [
+                {"uuid": "m1", "sender": "human", "text": "Hello", "content": [{"type": "text", "text": "Hello"}]},
+                {"uuid": "m2", "sender": "assistant", "text": "Hi there", "content": []},
+            ],
+        },
+        {"uuid": "claude-empty", "name": "Empty", "chat_messages": []},
+        "not a conversation",
+    ]
+    path = tmp_path / "conversations.json"
+    path.write_text(json.dumps(conversations), encoding="utf-8")
+    return path
+
+
+def test_chatgpt_payload_follows_current_branch():
+    payload = conversation_payload(_chatgpt_conversation("c-1", "Plan the release."))
+
+    assert payload["thread_id"] == "c-1"
+    assert payload["created_at"] == "2023-11-14T22:13:20Z"
+    assert [(item["role"], item["content"]) for item in payload["messages"]] == [
+        ("user", "Plan the release."),
+        ("assistant", "Decision: ship it."),
+    ]
+
+
+def test_ingest_export_writes_threads_and_index(tmp_path):
+    result = ingest_export(source=_export(tmp_path), output_dir=tmp_path / "out", config=IngestConfig(workers=2))
+
+    assert [entry.status for entry in result.entries] == ["ingested", "ingested", "empty", "error"]
+    assert (result.ingested_count, result.empty_count, result.failed_count) == (2, 1, 1)
+
+    claude = result.entries[1]
+    thread = load_thread(claude.path)
+    assert thread.thread_id == "claude-1"
+    assert [message.role.value for message in thread.messages] == ["user", "assistant"]
+    assert (claude.message_count, claude.char_count) == (2, thread.char_count)
+
+    index = json.loads((tmp_path / "out" / "index.json").read_text(encoding="utf-8"))
+    assert index["thread_count"] == 2
+    assert [item["thread_id"] for item in index["threads"][:3]] == ["c-1", "claude-1", "claude-empty"]
+
+
+def test_ingest_cli_reports_failures(tmp_path):
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        ["ingest", str(_export(tmp_path)), "--output-dir", str(tmp_path / "out"), "--workers", "1"],
+    )
+
+    assert result.exit_code == 1
+    assert "INGEST COMPLETE" in result.output
+    assert "Ingested: 2" in result.output
+    assert len(list((tmp_path / "out" / "threads").glob("*.json"))) == 2
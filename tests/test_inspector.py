@@ -1,7 +1,9 @@
 from pathlib import Path
 
-from uss_engine.inspector import inspect_files, inspect_text
+from uss_engine.inspector import inspect_files, inspect_precomputed, inspect_text
+from uss_engine import validator
 from uss_engine.transcript import load_thread
+from uss_engine.validator import validate_text
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -31,3 +33,35 @@ def test_inspect_text_accepts_thread_object():
     inspection = inspect_text(summary_text=summary, thread=thread)
     assert inspection.summary["evidence_claims"] > 0
     assert "grade" in inspection.summary
+
+
+def test_inspect_files_parses_front_matter_once(monkeypatch):
+    calls = []
+    original = validator.yaml.safe_load
+
+    def counting_safe_load(raw):
+        calls.append(raw)
+        return original(raw)
+
+    monkeypatch.setattr(validator.yaml, "safe_load", counting_safe_load)
+    inspection = inspect_files(
+        summary_path=ROOT / "examples" / "summary_with_evidence.md",
+        thread_path=ROOT / "examples" / "thread_minimal.json",
+    )
+    assert inspection.evidence_map is not None
+    assert len(calls) == 1
+
+
+def test_inspect_precomputed_matches_inspect_text():
+    summary = (ROOT / "examples" / "summary_with_evidence.md").read_text(encoding="utf-8")
+    thread = load_thread(ROOT / "examples" / "thread_minimal.json")
+    full = inspect_text(summary_text=summary, thread=thread, artifact_path="summary.md")
+    validation_report = validate_text(summary)
+    precomputed = inspect_precomputed(
+        validation_report=validation_report,
+        evidence_map=full.evidence_map,
+        evidence_validation=full.evidence_validation,
+        artifact_path="summary.md",
+    )
+    assert precomputed.model_dump() == full.model_dump()
+    assert validation_report.artifact_path is None
@@ -1,8 +1,10 @@
+import json
 from pathlib import Path
 
 from uss_engine.prompt_compiler import compile_repair_prompt, compile_runtime_prompt, load_protocol
+from uss_engine.redactor import redact_thread
 from uss_engine.schema import InvocationMode, ValidationIssue, ValidationReport
-from uss_engine.transcript import load_thread
+from uss_engine.transcript import NormalizedThread, TranscriptMessage, load_thread, open_thread_stream
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -44,3 +46,46 @@ def test_repair_prompt_embeds_validation_issues():
     assert repair.metadata["repair"] is True
     assert "missing_section" in repair.user_prompt
     assert "bad output" in repair.user_prompt
+
+
+def test_prompt_embeds_compact_redaction_report_by_default():
+    protocol = load_protocol(ROOT / "protocols" / "uss_v1_3.protocol.json")
+    emails = "\n".join(f"user{index}@example.com" for index in range(1000))
+    thread = NormalizedThread(
+        thread_id="leak", source="test", messages=[TranscriptMessage(id="m0", role="user", content=emails)]
+    )
+    report = redact_thread(thread).report
+    assert len(report.hits) == 1000
+
+    compact = compile_runtime_prompt(protocol=protocol, thread=thread, mode="checkpoint", redaction_report=report)
+    full = compile_runtime_prompt(
+        protocol=protocol, thread=thread, mode="checkpoint", redaction_report=report, redaction_report_mode="full"
+    )
+    assert compact.metadata["redaction_hit_count"] == 1000
+    assert '"hits_truncated": true' in compact.user_prompt
+    assert compact.user_prompt.count('"placeholder"') == 20
+    assert full.user_prompt.count('"placeholder"') == 1000
+
+
+def test_streaming_thread_compiles_like_the_loaded_thread(tmp_path):
+    protocol = load_protocol(ROOT / "protocols" / "uss_v1_3.protocol.json")
+    payload = {
+        "messages": [
+            {"role": "user" if index % 2 == 0 else "assistant", "content": f"message {index} {'x' * 300}"}
+            for index in range(7)
+        ],
+        "thread_id": "streamed",
+        "created_at": "2024-01-01T00:00:00Z",
+    }
+    path = tmp_path / "thread.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    expected = compile_runtime_prompt(
+        protocol=protocol, thread=load_thread(path), mode="checkpoint", max_transcript_chars=700
+    )
+    streamed = compile_runtime_prompt(
+        protocol=protocol, thread=open_thread_stream(path), mode="checkpoint", max_transcript_chars=700
+    )
+    assert streamed == expected
+    assert streamed.metadata["message_count"] == 7
+    assert streamed.metadata["exchange_pair_count"] == 3
@@ -0,0 +1,89 @@
+import os
+import time
+from dataclasses import dataclass
+
+from uss_engine.clients import CachedLLMClient, ClientConfig, ResponseCache
+from uss_engine.reports import ProviderKind
+
+
+@dataclass
+class _CountingClient:
+    config: ClientConfig
+    calls: int = 0
+
+    def complete(self, messages):
+        self.calls += 1
+        return f"output for {messages[-1]['content']}"
+
+    def stream(self, messages):
+        self.calls += 1
+        yield "output "
+        yield f"for {messages[-1]['content']}"
+
+
+def _messages(content):
+    return [{"role": "system", "content": "rules"}, {"role": "user", "content": content}]
+
+
+def test_cached_client_reuses_identical_prompts(tmp_path):
+    inner = _CountingClient(ClientConfig(model="m1"))
+    client = CachedLLMClient(inner, ResponseCache(tmp_path), provider="openai")
+
+    assert client.complete(_messages("a")) == "output for a"
+    assert client.complete(_messages("a")) == "output for a"
+    assert "".join(client.stream(_messages("a"))) == "output for a"
+    assert inner.calls == 1
+    assert (client.hits, client.misses) == (2, 1)
+
+    other_model = CachedLLMClient(_CountingClient(ClientConfig(model="m2")), ResponseCache(tmp_path), provider="openai")
+    other_model.complete(_messages("a"))
+    assert other_model.misses == 1
+
+
+def test_cache_keys_separate_endpoints_and_share_provider_aliases(tmp_path):
+    local = _CountingClient(ClientConfig(model="m1", base_url="http://localhost:11434"))
+    CachedLLMClient(local, ResponseCache(tmp_path), provider="ollama").complete(_messages("a"))
+    remote = CachedLLMClient(
+        _CountingClient(ClientConfig(model="m1", base_url="http://gpu-box:11434")),
+        ResponseCache(tmp_path),
+        provider="ollama",
+    )
+    remote.complete(_messages("a"))
+    assert remote.misses == 1
+
+    keys = {
+        CachedLLMClient(local, ResponseCache(tmp_path), provider=ProviderKind(name).canonical.value).cache_key(
+            _messages("a")
+        )
+        for name in ("grok", "xai")
+    }
+    assert len(keys) == 1
+
+
+def test_cancelled_stream_is_not_cached(tmp_path):
+    inner = _CountingClient(ClientConfig(model="m1"))
+    client = CachedLLMClient(inner, ResponseCache(tmp_path))
+
+    stream = client.stream(_messages("b"))
+    next(stream)
+    stream.close()
+    assert "".join(client.stream(_messages("b"))) == "output for b"
+    assert inner.calls == 2
+    assert client.complete(_messages("b")) == "output for b"
+    assert inner.calls == 2
+
+
+def test_cache_evicts_expired_then_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path, max_age_seconds=3600)
+    for key in ("aa01", "bb02", "cc03"):
+        cache.put(key, "x" * 100)
+    old = time.time() - 7200
+    os.utime(cache._path("aa01"), (old, old))
+    os.utime(cache._path("bb02"), (old + 3700, old + 3700))
+
+    assert cache.get("aa01") is None
+    entry_size = cache._path("cc03").stat().st_size
+    cache.max_bytes = entry_size
+    assert cache.evict() == 1
+    assert cache.get("bb02") is None
+    assert cache.get("cc03") == "x" * 100
@@ -0,0 +1,109 @@
+from pathlib import Path
+
+from uss_engine import stages
+from uss_engine.clients import StaticLLMClient
+from uss_engine.redactor import RedactionConfig
+from uss_engine.reports import ProviderKind
+from uss_engine.run import RunConfig, run_uss_pipeline
+
+ROOT = Path(__file__).resolve().parents[1]
+CACHED_STAGES = ["normalize", "redact", "compile", "generate", "validate", "evidence", "inspect"]
+
+
+def _run(tmp_path, client=None, **overrides):
+    return run_uss_pipeline(
+        thread_path=ROOT / "examples" / "thread_minimal.json",
+        protocol_path=ROOT / "protocols" / "uss_v1_3.protocol.json",
+        output_dir=tmp_path,
+        config=RunConfig(provider=ProviderKind.static, incremental=True, **overrides),
+        client=client,
+    )
+
+
+def test_incremental_rerun_skips_unchanged_stages(tmp_path):
+    first = _run(tmp_path)
+    assert first.executed_stages == [*CACHED_STAGES, "report"]
+
+    second = _run(tmp_path)
+    assert second.skipped_stages == CACHED_STAGES
+    assert second.executed_stages == ["report"]
+    assert second.generation.final_output == first.generation.final_output
+    assert second.report.inspection_score == first.report.inspection_score
+
+
+def test_redaction_config_change_reruns_redaction_onward(tmp_path):
+    _run(tmp_path)
+    changed = _run(tmp_path, redaction=RedactionConfig(enabled=False))
+    assert changed.skipped_stages[0] == "normalize"
+    assert changed.executed_stages[:2] == ["redact", "compile"]
+    # The example thread has nothing to redact, so the compiled prompt is
+    # byte-identical and the provider call is not repeated.
+    assert "generate" in changed.skipped_stages
+
+
+def test_scoring_code_change_reruns_only_inspection(tmp_path, monkeypatch):
+    _run(tmp_path)
+    original = stages.code_version
+    monkeypatch.setattr(
+        stages,
+        "code_version",
+        lambda stage: "changed" if stage == "inspect" else original(stage),
+    )
+    rerun = _run(tmp_path)
+    assert rerun.executed_stages == ["inspect", "report"]
+
+
+def test_validator_code_change_reruns_evidence(tmp_path, monkeypatch):
+    _run(tmp_path)
+    package_dir = Path(stages.__file__).resolve().parent
+    original_read_bytes = Path.read_bytes
+
+    def read_bytes(path):
+        data = original_read_bytes(path)
+        return data + b"\n# edited\n" if path == package_dir / "validator.py" else data
+
+    monkeypatch.setattr(Path, "read_bytes", read_bytes)
+    stages.code_version.cache_clear()
+    try:
+        rerun = _run(tmp_path)
+    finally:
+        monkeypatch.undo()
+        stages.code_version.cache_clear()
+    assert rerun.executed_stages == ["generate", "validate", "evidence", "inspect", "report"]
+    assert rerun.skipped_stages == ["normalize", "redact", "compile"]
+
+
+def test_non_incremental_run_writes_no_stage_records(tmp_path):
+    result = run_uss_pipeline(
+        thread_path=ROOT / "examples" / "thread_minimal.json",
+        protocol_path=ROOT / "protocols" / "uss_v1_3.protocol.json",
+        output_dir=tmp_path,
+        config=RunConfig(provider=ProviderKind.static),
+    )
+    assert result.skipped_stages == []
+    assert not (tmp_path / stages.STAGE_DIR_NAME).exists()
+
+
+class _PlainClient:
+    def __init__(self, output):
+        self.output = output
+
+    def complete(self, messages):
+        return self.output
+
+
+def test_injected_clients_reuse_generation_only_by_fingerprint(tmp_path):
+    valid = (ROOT / "examples" / "checkpoint_valid.md").read_text(encoding="utf-8")
+    other = valid.replace("mode: checkpoint", "mode: archive", 1)
+
+    _run(tmp_path, client=StaticLLMClient(outputs=[valid]))
+    assert "generate" in _run(tmp_path, client=StaticLLMClient(outputs=[valid])).skipped_stages
+    changed = _run(tmp_path, client=StaticLLMClient(outputs=[other, other]))
+    assert "generate" in changed.executed_stages
+    assert changed.generation.final_output == other.strip()
+
+    plain = _run(tmp_path, client=_PlainClient(valid))
+    assert "generate" in plain.executed_stages
+    again = _run(tmp_path, client=_PlainClient(other))
+    assert "generate" in again.executed_stages
+    assert again.generation.final_output == other.strip()
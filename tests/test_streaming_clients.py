@@ -0,0 +1,157 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from uss_engine.clients import (
+    AnthropicClient,
+    ClientConfig,
+    GeminiClient,
+    GrokClient,
+    OllamaClient,
+    OpenAIClient,
+    StaticLLMClient,
+    StreamingLLMClient,
+)
+from uss_engine.clients._http import iter_sse_data
+from uss_engine.generator import GenerationConfig, generate_summary
+from uss_engine.prompt_compiler import load_protocol
+from uss_engine.reports import build_attempt_summaries
+from uss_engine.transcript import load_thread
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _sse(*events):
+    lines = []
+    for event, data in events:
+        if event:
+            lines.append(f"event: {event}")
+        lines.append(f"data: {data if isinstance(data, str) else json.dumps(data)}")
+        lines.append("")
+    return [line + "\n" for line in lines]
+
+
+_STREAMS = {
+    "/v1/chat/completions": _sse(
+        (None, {"choices": [{"delta": {"role": "assistant"}}]}),
+        (None, {"choices": [{"delta": {"content": "Hello"}}]}),
+        (None, {"choices": [{"delta": {"content": ", world"}}]}),
+        (None, "[DONE]"),
+    ),
+    "/v1/messages": _sse(
+        ("message_start", {"type": "message_start"}),
+        ("content_block_delta", {"delta": {"type": "text_delta", "text": "Hello"}}),
+        ("ping", {"type": "ping"}),
+        ("content_block_delta", {"delta": {"type": "text_delta", "text": ", world"}}),
+        ("message_stop", {"type": "message_stop"}),
+    ),
+    "/v1/models/gemini-test:streamGenerateContent": _sse(
+        (None, {"candidates": [{"content": {"parts": [{"text": "Hello"}]}}]}),
+        (None, {"candidates": [{"content": {"parts": [{"text": ", world"}]}}]}),
+    ),
+    "/api/chat": [
+        json.dumps({"message": {"content": "Hello"}, "done": False}) + "\n",
+        json.dumps({"message": {"content": ", world"}, "done": False}) + "\n",
+        json.dumps({"message": {"content": ""}, "done": True}) + "\n",
+    ],
+}
+
+
+class _StreamHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: list[dict] = []
+
+    def do_POST(self):  # noqa: N802 - http.server naming
+        length = int(self.headers["Content-Length"])
+        path, _, query = self.path.partition("?")
+        type(self).requests.append({"path": path, "query": query, "payload": json.loads(self.rfile.read(length))})
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for line in _STREAMS[path]:
+            data = line.encode("utf-8")
+            self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args):  # noqa: D401 - silence test server logs
+        pass
+
+
+@pytest.fixture()
+def server():
+    _StreamHandler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _StreamHandler)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.mark.parametrize(
+    ("client_cls", "base_path"),
+    [
+        (OpenAIClient, "/v1"),
+        (GrokClient, "/v1"),
+        (AnthropicClient, "/v1"),
+        (GeminiClient, "/v1"),
+        (OllamaClient, ""),
+    ],
+)
+def test_adapters_stream_text_deltas(server, client_cls, base_path):
+    model = "gemini-test" if client_cls is GeminiClient else "test-model"
+    client = client_cls(ClientConfig(model=model, api_key="test-key", base_url=f"{server}{base_path}"))
+    assert isinstance(client, StreamingLLMClient)
+    assert list(client.stream([{"role": "user", "content": "hi"}])) == ["Hello", ", world"]
+
+    request = _StreamHandler.requests[-1]
+    if client_cls is GeminiClient:
+        assert "alt=sse" in request["query"]
+    else:
+        assert request["payload"]["stream"] is True
+
+
+def test_sse_parser_joins_multiline_data_and_skips_comments():
+    lines = [": keep-alive", "event: delta", "data: a", "data: b", "", "data: c"]
+    assert list(iter_sse_data(lines)) == [("delta", "a\nb"), ("message", "c")]
+
+
+def test_generator_streams_and_records_time_to_first_token():
+    protocol = load_protocol(ROOT / "protocols" / "uss_v1_3.protocol.json")
+    thread = load_thread(ROOT / "examples" / "thread_minimal.json")
+    valid_output = (ROOT / "examples" / "checkpoint_valid.md").read_text(encoding="utf-8")
+
+    result = generate_summary(
+        protocol=protocol,
+        thread=thread,
+        mode="checkpoint",
+        client=StaticLLMClient(outputs=[valid_output]),
+    )
+    attempt = result.attempts[0]
+    assert result.valid
+    assert attempt.streamed
+    assert attempt.time_to_first_token_ms is not None
+    assert build_attempt_summaries(result.attempts)[0].streamed
+
+    unstreamed = generate_summary(
+        protocol=protocol,
+        thread=thread,
+        mode="checkpoint",
+        client=StaticLLMClient(outputs=[valid_output]),
+        config=GenerationConfig(stream=False),
+    )
+    assert not unstreamed.attempts[0].streamed
+    assert unstreamed.final_output == result.final_output
+
+
+def test_closing_stream_early_cancels_request(server):
+    client = OpenAIClient(ClientConfig(model="test-model", api_key="test-key", base_url=f"{server}/v1"))
+    stream = client.stream([{"role": "user", "content": "hi"}])
+    assert next(stream) == "Hello"
+    stream.close()
+    assert "".join(client.stream([{"role": "user", "content": "again"}])) == "Hello, world"
@@ -0,0 +1,105 @@
+import json
+import os
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from uss_engine import thread_cache
+from uss_engine.cli import app
+from uss_engine.thread_cache import ThreadCache
+from uss_engine.transcript import load_thread
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_cache_reuses_unchanged_transcripts_and_renormalizes_edits(tmp_path):
+    source = tmp_path / "live.md"
+    source.write_text("User: hello\n\nAssistant: hi there\n", encoding="utf-8")
+    cache = ThreadCache(tmp_path / "cache")
+
+    first = load_thread(source, cache=cache)
+    assert load_thread(source, cache=ThreadCache(tmp_path / "cache")) == first
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # A touched but identical file is confirmed by content hash.
+    os.utime(source, ns=(0, 0))
+    assert cache.load(source) == first
+    assert cache.hits == 1
+
+    source.write_text("User: hello\n\nAssistant: hi there\n\nUser: more\n", encoding="utf-8")
+    assert len(cache.load(source).messages) == 3
+    assert cache.misses == 2
+
+
+def test_cache_ignores_corrupt_records_and_other_normalizer_versions(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    thread_path = ROOT / "examples" / "thread_minimal.json"
+    ThreadCache(cache_dir).load(thread_path)
+    with (cache_dir / thread_cache.THREAD_CACHE_FILE).open("ab") as handle:
+        handle.write(b"USTC\x00\x01")
+
+    reader = ThreadCache(cache_dir)
+    assert reader.load(thread_path).thread_id == "thread_minimal_001"
+    assert reader.hits == 1
+
+    monkeypatch.setattr(thread_cache, "normalizer_version", lambda: "changed")
+    stale = ThreadCache(cache_dir)
+    stale.load(thread_path)
+    assert stale.misses == 1
+
+
+def test_cli_commands_share_the_thread_cache(tmp_path):
+    cache_dir = tmp_path / "cache"
+    thread_path = str(ROOT / "examples" / "thread_minimal.json")
+    result = CliRunner().invoke(app, ["normalize", thread_path, "--thread-cache", str(cache_dir)])
+    assert result.exit_code == 0
+    assert (cache_dir / thread_cache.THREAD_CACHE_FILE).stat().st_size > 0
+
+    redacted = CliRunner().invoke(app, ["redact", thread_path, "--thread-cache", str(cache_dir)])
+    assert redacted.exit_code == 0
+    assert ThreadCache(cache_dir).load(thread_path) == load_thread(thread_path)
+
+
+def test_incremental_load_parses_only_the_appended_tail(tmp_path):
+    source = tmp_path / "live.md"
+    source.write_text("User: first\n\nAssistant: partial", encoding="utf-8")
+    cache = ThreadCache(tmp_path / "cache")
+    first = load_thread(source, cache=cache, incremental=True)
+
+    with source.open("a", encoding="utf-8") as handle:
+        handle.write(" answer\n\nUser: second\n")
+    grown = load_thread(source, cache=ThreadCache(tmp_path / "cache"), incremental=True)
+    assert [message.content for message in grown.messages] == ["first", "partial answer", "second"]
+    assert [message.id for message in grown.messages[:2]] == [message.id for message in first.messages]
+    assert [message.source_index for message in grown.messages] == [0, 1, 2]
+    assert grown.thread_id == first.thread_id
+
+    # Rewriting earlier bytes invalidates the checkpoint and forces a full parse.
+    source.write_text("User: edited\n\nAssistant: partial answer\n\nUser: second\nUser: third\n", encoding="utf-8")
+    reparsed = ThreadCache(tmp_path / "cache")
+    assert [message.content for message in reparsed.load(source, incremental=True).messages][0] == "edited"
+    assert (reparsed.resumed, reparsed.misses) == (0, 1)
+
+
+def test_incremental_jsonl_leaves_an_unterminated_line_uncommitted(tmp_path):
+    source = tmp_path / "live.jsonl"
+    header = json.dumps({"thread_id": "live", "source": "log"})
+    source.write_text(f"{header}\n" + json.dumps({"role": "user", "content": "one"}) + "\n", encoding="utf-8")
+    cache = ThreadCache(tmp_path / "cache")
+    assert len(cache.load(source, incremental=True).messages) == 1
+
+    with source.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"role": "assistant", "content": "two"}))
+    assert [message.content for message in cache.load(source, incremental=True).messages] == ["one", "two"]
+
+    with source.open("a", encoding="utf-8") as handle:
+        handle.write("\n" + json.dumps({"role": "user", "content": "three"}) + "\n")
+    thread = cache.load(source, incremental=True)
+    assert cache.resumed == 2
+    assert thread.thread_id == "live"
+    assert [(message.id, message.content) for message in thread.messages] == [
+        ("msg_0001", "one"),
+        ("msg_0002", "two"),
+        ("msg_0003", "three"),
+    ]
+    assert thread == load_thread(source).model_copy(update={"created_at": thread.created_at})
@@ -1,13 +1,20 @@
+import json
+from itertools import islice
 from pathlib import Path
 
 import pytest
 
+from uss_engine.redactor import iter_redacted_messages
 from uss_engine.transcript import (
     NormalizedThread,
     TranscriptRole,
+    load_saved_thread,
     load_thread,
+    normalize_transcript_file,
     normalize_transcript_json,
     normalize_transcript_text,
+    open_thread_stream,
+    save_thread,
 )
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -43,3 +50,155 @@ def test_unprefixed_text_becomes_single_user_message():
 def test_json_requires_messages():
     with pytest.raises(ValueError):
         normalize_transcript_json({"thread_id": "bad"})
+
+
+def _payload(count):
+    return {
+        "thread_id": "big",
+        "source": "export",
+        "created_at": "2026-01-01T00:00:00Z",
+        "messages": [
+            {"role": "user" if index % 2 == 0 else "assistant", "content": f"message {index} \u00e9 {'x' * index}"}
+            for index in range(count)
+        ],
+        "project": "atlas",
+    }
+
+
+def test_streamed_json_matches_eager_normalization(tmp_path):
+    payload = _payload(40)
+    path = tmp_path / "export.json"
+    path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+
+    # A tiny chunk size forces values to straddle read boundaries.
+    stream = open_thread_stream(path, chunk_chars=7)
+    assert (stream.thread_id, stream.source) == ("big", "export")
+    assert stream.to_normalized() == normalize_transcript_json(payload)
+
+    # Thread fields after the message list are picked up once the stream is read.
+    trailing = {"messages": payload["messages"], "thread_id": "late"}
+    path.write_text(json.dumps(trailing), encoding="utf-8")
+    late = open_thread_stream(path, chunk_chars=16)
+    assert late.thread_id.startswith("thread_")
+    assert late.to_normalized().thread_id == "late"
+
+
+def test_streamed_json_prefers_the_list_the_eager_loader_uses(tmp_path):
+    path = tmp_path / "export.json"
+    first = [{"role": "user", "content": "from items"}]
+    second = [{"role": "assistant", "content": "from messages"}]
+    payloads = [
+        {"items": first, "messages": second},
+        {"messages": [], "conversation": first},
+        {"items": second, "conversation": first, "title": "t"},
+    ]
+    for payload in payloads:
+        payload.update(thread_id="t-1", source="export", created_at="2024-01-01T00:00:00Z")
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        stream = open_thread_stream(path, chunk_chars=5)
+        assert stream.to_normalized() == normalize_transcript_json(payload)
+
+    path.write_text(json.dumps({"messages": [], "items": []}), encoding="utf-8")
+    with pytest.raises(ValueError, match="non-empty 'messages' list"):
+        open_thread_stream(path)
+
+
+def test_jsonl_transcript_streams_messages_lazily(tmp_path):
+    path = tmp_path / "chat.jsonl"
+    lines = [json.dumps({"thread_id": "jsonl-1", "source": "chat_export"})]
+    lines += [json.dumps({"role": "user", "content": f"mail me at u{index}@example.com"}) for index in range(3)]
+    lines.append("{not json")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    stream = open_thread_stream(path)
+    assert stream.thread_id == "jsonl-1"
+    redacted = list(islice(iter_redacted_messages(stream), 3))
+    assert [message.content for message, _ in redacted] == ["mail me at [REDACTED_EMAIL]"] * 3
+    assert [message.id for message, _ in redacted] == ["msg_0001", "msg_0002", "msg_0003"]
+    with pytest.raises(ValueError, match="line 5"):
+        load_thread(path)
+
+
+def test_mapped_text_file_matches_in_memory_normalization(tmp_path):
+    raw = (
+        "  ---\r\n"
+        "Kickoff notes before anyone speaks\r\n"
+        "## User: Plan the offsite.\r\n"
+        "Budget is tight.\r\n"
+        "\r\n"
+        "Assistant:\r\n"
+        "Here is a plan.\r\n"
+        "userland is not a role line\r\n"
+        "Tool -  lookup done  \r\n"
+    )
+    path = tmp_path / "meeting.md"
+    path.write_bytes(raw.encode("utf-8"))
+
+    mapped = normalize_transcript_file(path, thread_id="m", created_at="2026-01-01T00:00:00Z")
+    expected = normalize_transcript_text(
+        path.read_text(encoding="utf-8"), thread_id="m", created_at="2026-01-01T00:00:00Z"
+    )
+    assert [(m.role, m.content) for m in mapped.messages] == [(m.role, m.content) for m in expected.messages]
+    assert [m.content for m in mapped.messages] == [
+        "Kickoff notes before anyone speaks",
+        "Plan the offsite.\nBudget is tight.",
+        "Here is a plan.\nuserland is not a role line",
+        "lookup done",
+    ]
+    assert load_thread(path).source == "md"
+
+
+def test_mapped_text_file_accepts_unit_separator_before_a_role(tmp_path):
+    raw = "User: first\n\x1fAssistant: second\n"
+    path = tmp_path / "separated.txt"
+    path.write_bytes(raw.encode("utf-8"))
+
+    mapped = normalize_transcript_file(path, thread_id="s", created_at="2026-01-01T00:00:00Z")
+    expected = normalize_transcript_text(raw, thread_id="s", created_at="2026-01-01T00:00:00Z")
+    assert [(m.role, m.content) for m in mapped.messages] == [(m.role, m.content) for m in expected.messages]
+    assert len(mapped.messages) == 2
+
+
+def test_saved_thread_reloads_without_renormalizing(tmp_path):
+    thread = normalize_transcript_json(_payload(5))
+    path = tmp_path / "thread.normalized.json"
+    save_thread(thread, path, checksum=True)
+
+    loaded = load_thread(path)
+    assert loaded == thread
+    assert loaded.messages[0].metadata == thread.messages[0].metadata
+    assert "format" not in loaded.model_dump()
+
+    tampered = path.read_text(encoding="utf-8").replace("message 3", "message 4", 1)
+    path.write_text(tampered, encoding="utf-8")
+    with pytest.raises(ValueError, match="checksum mismatch"):
+        load_thread(path)
+    assert load_saved_thread(path, verify_checksum=False).messages[3].content.startswith("message 4")
+
+    payload = json.loads(tampered)
+    payload["format_version"] = 99
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    with pytest.raises(ValueError, match="format version"):
+        load_thread(path)
+
+
+def test_unchecked_saved_thread_is_validated(tmp_path):
+    path = tmp_path / "thread.normalized.json"
+    save_thread(normalize_transcript_json(_payload(3)), path, checksum=False)
+    payload = json.loads(path.read_text(encoding="utf-8"))
+
+    del payload["messages"][0]["metadata"]
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    assert load_thread(path).messages[0].metadata == {}
+
+    for edit in (
+        lambda data: data["messages"][1].update(content="  "),
+        lambda data: data["messages"][1].update(timestamp="yesterday"),
+        lambda data: data["messages"][1].pop("role"),
+        lambda data: data.update(messages=[]),
+    ):
+        edited = json.loads(json.dumps(payload))
+        edit(edited)
+        path.write_text(json.dumps(edited), encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_thread(path)
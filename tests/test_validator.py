@@ -1,6 +1,14 @@
 from pathlib import Path
 
-from uss_engine.validator import validate_file, validate_text, parse_fields
+from uss_engine import validator
+from uss_engine.validator import (
+    IncrementalValidator,
+    parse_artifact,
+    parse_fields,
+    parse_sections,
+    validate_file,
+    validate_text,
+)
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -36,3 +44,80 @@ def test_field_parser_captures_multiline_values():
     fields = parse_fields(body)
     assert fields["A"] == "one\n- two\n- three"
     assert fields["B"] == "four"
+
+
+def test_parse_artifact_records_sections_fields_and_spans():
+    text = (ROOT / "examples" / "checkpoint_valid.md").read_text(encoding="utf-8")
+    parsed = parse_artifact(text)
+    assert parsed.frontmatter_error is None
+    assert parsed.frontmatter["mode"] == "checkpoint"
+    assert list(parsed.section_bodies()) == list(parse_sections(parsed.body))
+    header = parsed.sections["HEADER (THREAD LOCK & AUDIT)"]
+    assert header.fields == parse_fields(header.body)
+    assert text[header.start_offset :].startswith("### HEADER (THREAD LOCK & AUDIT)")
+    assert text.splitlines()[header.start_line - 1].startswith("### HEADER")
+    assert validate_text(parsed).model_dump() == validate_text(text).model_dump()
+
+
+def test_parse_artifact_keeps_frontmatter_error():
+    parsed = parse_artifact("### INVOCATION LOCK\n\nLocked.")
+    assert parsed.frontmatter == {}
+    assert parsed.frontmatter_error is not None
+    assert parsed.sections["INVOCATION LOCK"].body == "Locked."
+    assert any(issue.code == "frontmatter_error" for issue in validate_text(parsed).issues)
+
+
+def test_incremental_validator_accepts_valid_artifacts_in_small_chunks():
+    for mode, name in [("checkpoint", "checkpoint_valid.md"), ("archive", "archive_valid.md")]:
+        text = (ROOT / "examples" / name).read_text(encoding="utf-8")
+        monitor = IncrementalValidator(mode)
+        for start in range(0, len(text), 7):
+            assert monitor.feed(text[start : start + 7]) == []
+
+
+def test_incremental_validator_flags_fatal_structure_early():
+    text = (ROOT / "examples" / "checkpoint_valid.md").read_text(encoding="utf-8")
+
+    wrong_mode = IncrementalValidator("archive")
+    wrong_mode.feed(text[: text.index("### ")])
+    assert [issue.code for issue in wrong_mode.fatal_issues] == ["mode_mismatch"]
+
+    no_frontmatter = IncrementalValidator("checkpoint")
+    assert no_frontmatter.feed("### HEADER")[0].code == "frontmatter_error"
+
+    header = text.index("### HEADER")
+    failure = text.index("### FAILURE SEMANTICS")
+    cosmic = text.index("### COSMIC CORE")
+    swapped = text[:header] + text[failure:cosmic] + text[header:failure] + text[cosmic:]
+    out_of_order = IncrementalValidator("checkpoint")
+    out_of_order.feed(swapped[: swapped.index("### HEADER") + len("### HEADER (THREAD LOCK & AUDIT)\n")])
+    assert out_of_order.fatal_issues[0].code == "section_out_of_order"
+    assert not out_of_order.report().valid
+
+
+def test_validate_text_agrees_with_incremental_checks():
+    text = (ROOT / "examples" / "checkpoint_valid.md").read_text(encoding="utf-8")
+    assert validate_text(text, mode="checkpoint").valid
+
+    codes = {issue.code for issue in validate_text(text, mode="archive").issues}
+    assert "mode_mismatch" in codes
+
+    header = text.index("### HEADER")
+    failure = text.index("### FAILURE SEMANTICS")
+    cosmic = text.index("### COSMIC CORE")
+    swapped = text[:header] + text[failure:cosmic] + text[header:failure] + text[cosmic:]
+    monitor = IncrementalValidator("checkpoint")
+    monitor.feed(swapped)
+    [streamed] = monitor.fatal_issues
+    [finished] = validate_text(swapped, mode="checkpoint").issues
+    assert (finished.code, finished.section) == (streamed.code, streamed.section)
+
+
+def test_archive_section_order_supports_several_archive_sections(monkeypatch):
+    monkeypatch.setattr(
+        validator,
+        "ARCHIVE_REQUIRED_SECTIONS",
+        {"EXECUTION ARTIFACTS (Archive Mode Only)": [], "RUN LOG (Archive Mode Only)": []},
+    )
+    titles = list(IncrementalValidator("archive")._section_rank)
+    assert titles[-3:] == ["EXECUTION ARTIFACTS (Archive Mode Only)", "RUN LOG (Archive Mode Only)", "INVOCATION LOCK"]